@@ -0,0 +1,194 @@
+"""
+asyncio on the Qt event loop of the canvases, see `PySide6.QtAsyncio`:
+
+    python -m matplotlibqml.aio [--rate 2000] [--seconds 0]
+
+`run` runs coroutines on an asyncio event loop that is the Qt event loop:
+their callbacks, timers and tasks are Qt events of the GUI thread, so they
+can update the artists directly, with no thread, lock or polling between
+the data and the canvas.  `CanvasFeed` coalesces what producers push into
+one update and one idle draw per event loop iteration.
+
+The demo feeds a scrolling line from a producer of *rate* samples a second,
+pushed every few milliseconds, for *seconds* (until the window is closed
+with 0).
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import numpy as np
+from PySide6 import QtAsyncio, QtCore, QtWidgets
+from matplotlib.figure import Figure
+
+from .matplotlibqml import FigureCanvasQTAgg
+
+_EMPTY = object()
+
+
+def run(coro=None, keep_running=True, quit_qapp=True):
+    """
+    Run *coro* (or just the loop, with *keep_running*) on a QtAsyncio event
+    loop, on top of the event loop of the QApplication, created if need be;
+    see `PySide6.QtAsyncio.run`.
+    """
+    # QtAsyncio would create a QCoreApplication, which canvases can't use
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    return QtAsyncio.run(coro, keep_running=keep_running,
+                         quit_qapp=quit_qapp)
+
+
+class CanvasFeed:
+    """
+    Feeds the values pushed by producers of the GUI thread (coroutines of
+    the QtAsyncio loop, Qt slots) to *update*, a callable applying one to
+    the artists of *canvas*.
+
+    Values pushed before the next event loop iteration are combined with
+    *merge* (by default the last one is kept) and applied at once, followed
+    by a single ``canvas.draw_idle()``; ``await feed.put(value)`` also waits
+    for the frame showing it, to pace a producer with the canvas.
+    ``pushes``, ``updates`` and ``draws`` count each.
+    """
+
+    def __init__(self, canvas, update, merge=None):
+        self.canvas = canvas
+        self._update = update
+        self._merge = merge
+        self._pending = _EMPTY
+        self._scheduled = False
+        # the futures of the values pending, and of the update being drawn
+        self._waiters = []
+        self._drawing = []
+        self._dirty = False
+        self._cid = canvas.mpl_connect('draw_event', self._drawn)
+        self.pushes = 0
+        self.updates = 0
+        self.draws = 0
+
+    def push(self, value):
+        """Queue *value*, to be applied on the next event loop iteration."""
+        self.pushes += 1
+        if self._pending is _EMPTY or self._merge is None:
+            self._pending = value
+        else:
+            self._pending = self._merge(self._pending, value)
+        if not self._scheduled:
+            self._scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush)
+
+    async def put(self, value):
+        """Push *value*, and wait until a frame shows it."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.push(value)
+        await future
+
+    def close(self):
+        """Stop feeding the canvas; the coroutines waiting are cancelled."""
+        self.canvas.mpl_disconnect(self._cid)
+        self._pending = _EMPTY
+        for future in self._waiters + self._drawing:
+            future.cancel()
+        self._waiters, self._drawing = [], []
+
+    def _flush(self):
+        self._scheduled = False
+        value, self._pending = self._pending, _EMPTY
+        waiters, self._waiters = self._waiters, []
+        if value is _EMPTY:
+            # closed meanwhile
+            return
+        try:
+            self._update(value)
+        except Exception as exc:
+            if not waiters:
+                raise
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.updates += 1
+        self._drawing += waiters
+        self._dirty = True
+        self.canvas.draw_idle()
+
+    def _drawn(self, event):
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.draws += 1
+        drawing, self._drawing = self._drawing, []
+        for future in drawing:
+            if not future.done():
+                future.set_result(None)
+
+    def stats(self):
+        return {'pushes': self.pushes, 'updates': self.updates,
+                'draws': self.draws}
+
+
+async def _acquire(feed, rate, period=0.005):
+    """
+    Push *rate* samples a second to *feed*, every *period* seconds: the
+    samples acquired since the last push.
+    """
+    start = time.monotonic()
+    sent = 0
+    while True:
+        due = int((time.monotonic() - start) * rate)
+        if due > sent:
+            t = np.arange(sent, due) / rate
+            feed.push(np.sin(2 * np.pi * t) + 0.1 * np.random.randn(due - sent))
+            sent = due
+        await asyncio.sleep(period)
+
+
+async def _demo(rate, seconds):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.setWindowTitle('matplotlibqml - asyncio feed')
+    ax = canvas.figure.subplots()
+    window = np.zeros(2000)
+    line, = ax.plot(window)
+    ax.set_ylim(-1.5, 1.5)
+
+    def update(samples):
+        # the samples of the iteration, newest last
+        samples = samples[-window.size:]
+        window[:-samples.size] = window[samples.size:]
+        window[-samples.size:] = samples
+        line.set_ydata(window)
+
+    feed = CanvasFeed(canvas, update,
+                      merge=lambda old, new: np.concatenate([old, new]))
+    canvas.resize(800, 400)
+    canvas.show()
+    producer = asyncio.ensure_future(_acquire(feed, rate))
+    start = time.monotonic()
+    try:
+        while canvas.isVisible() and (
+                not seconds or time.monotonic() - start < seconds):
+            await asyncio.sleep(0.5)
+    finally:
+        producer.cancel()
+        feed.close()
+    elapsed = time.monotonic() - start
+    stats = feed.stats()
+    print(f"{stats['pushes']} pushes, {stats['updates']} updates, "
+          f"{stats['draws']} draws in {elapsed:.1f} s: "
+          f"{stats['draws'] / elapsed:.1f} fps")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rate', type=float, default=2000,
+                        help='samples per second')
+    parser.add_argument('--seconds', type=float, default=0,
+                        help='stop after that long, 0 to run until closed')
+    args = parser.parse_args()
+    run(_demo(args.rate, args.seconds), keep_running=False)
+
+
+if __name__ == "__main__":
+    main()
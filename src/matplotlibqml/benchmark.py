@@ -0,0 +1,92 @@
+"""
+Rendering throughput of the canvases, offscreen:
+
+    python -m matplotlibqml.benchmark [--frames 100] [--lines 4] [--points 2000]
+
+Each canvas renders the same streaming line plot, with new data every frame,
+and is then painted into an image the way Qt paints it on screen; the frames
+per second of each are printed.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+from PySide6 import QtGui, QtWidgets
+from matplotlib.figure import Figure
+
+from .matplotlibqml import (FigureCanvasQTAgg, FigureCanvasQTQPainter,
+                            FigureCanvasQtQuickAgg, FigureCanvasQtQuickQPainter)
+
+WIDTH, HEIGHT = 800, 600
+
+
+def _make_widget(cls):
+    canvas = cls(Figure())
+    canvas.resize(WIDTH, HEIGHT)
+    image = QtGui.QImage(WIDTH, HEIGHT,
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def paint():
+        canvas.render(image)
+    return canvas, paint
+
+
+def _make_item(cls):
+    canvas = cls()
+    canvas.setWidth(WIDTH)
+    canvas.setHeight(HEIGHT)
+    image = QtGui.QImage(WIDTH, HEIGHT,
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def paint():
+        painter = QtGui.QPainter(image)
+        try:
+            canvas.paint(painter)
+        finally:
+            painter.end()
+    return canvas, paint
+
+
+def run(make, cls, frames, lines, points):
+    """Return the frames per second of *cls*, made by *make*."""
+    canvas, paint = make(cls)
+    ax = canvas.figure.subplots()
+    x = np.arange(points)
+    artists = [ax.plot(x, np.zeros(points))[0] for _ in range(lines)]
+    ax.set_ylim(-1, lines + 1)
+    rng = np.random.default_rng(0)
+    # one warm up frame, for the caches and the pools
+    canvas.draw()
+    paint()
+    start = time.perf_counter()
+    for _ in range(frames):
+        for i, line in enumerate(artists):
+            line.set_ydata(i + rng.random(points))
+        canvas.draw()
+        paint()
+    return frames / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--frames', type=int, default=100)
+    parser.add_argument('--lines', type=int, default=4)
+    parser.add_argument('--points', type=int, default=2000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    print(f'{args.lines} lines of {args.points} points, {WIDTH}x{HEIGHT}, '
+          f'{args.frames} frames')
+    for make, cls in [(_make_widget, FigureCanvasQTAgg),
+                      (_make_widget, FigureCanvasQTQPainter),
+                      (_make_item, FigureCanvasQtQuickAgg),
+                      (_make_item, FigureCanvasQtQuickQPainter)]:
+        fps = run(make, cls, args.frames, args.lines, args.points)
+        print(f'{cls.__name__:30} {fps:8.1f} fps')
+
+
+if __name__ == "__main__":
+    main()
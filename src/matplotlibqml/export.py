@@ -0,0 +1,159 @@
+"""
+Headless batch export of figures, across a pool of worker processes:
+
+    python -m matplotlibqml.export [package.module:jobs] [--processes 4]
+                                   [--chunksize 1] [--dpi 100] [--count 200]
+
+*jobs* is an iterable of ``(builder, fname)`` pairs, or a function
+returning one: each ``builder(figure)`` fills a new `Figure`, which is then
+saved to *fname*.  Builders are sent to the workers by pickling, so they have
+to be module level functions (or `functools.partial` of them).  Without
+*jobs*, *count* demo figures are exported to the current directory.
+
+No window, QApplication or GPU is involved; the workers keep their Agg
+renderers and text caches from one figure to the next.  Throughput, overall
+and per worker process, is printed at the end.
+"""
+import argparse
+import functools
+import importlib
+import multiprocessing
+import os
+import time
+import traceback
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .matplotlibqml import _PooledAggCanvas, _renderer_pool
+
+
+class _ExportCanvas(_PooledAggCanvas, FigureCanvasAgg):
+    """Agg canvas taking its renderer from the pool of the worker."""
+
+    partial_render = False
+
+    def print_figure(self, *args, **kwargs):
+        # there is no frame on screen to restore afterwards
+        FigureCanvasAgg.print_figure(self, *args, **kwargs)
+
+    def release(self):
+        """Give the renderer back to the pool, for the next figure."""
+        if self._lastKey is not None:
+            _renderer_pool.release(self._lastKey, self.renderer)
+            self._lastKey = None
+            del self.renderer
+
+
+def _export(job, savefig_kwargs):
+    """
+    Build and save one figure, in a worker; return (fname, pid, seconds,
+    error).
+    """
+    builder, fname = job
+    start = time.perf_counter()
+    error = None
+    canvas = _ExportCanvas(Figure())
+    try:
+        builder(canvas.figure)
+        # savefig writes straight to the file, as the encoder goes
+        canvas.figure.savefig(fname, **savefig_kwargs)
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        canvas.release()
+    return fname, os.getpid(), time.perf_counter() - start, error
+
+
+def export_figures(jobs, processes=None, chunksize=1, method=None, **kwargs):
+    """
+    Save the figures of the ``(builder, fname)`` pairs of *jobs* with
+    *processes* workers (all cores by default), ``savefig(fname, **kwargs)``
+    style.  Yield ``(fname, pid, seconds, error)`` as each one is written,
+    *error* being the traceback of a failed figure, or None.
+
+    The workers are started with the multiprocessing start *method*, by
+    default forkserver where available and spawn otherwise: forking an
+    application that runs Qt or other threads isn't safe.
+    """
+    if method is None:
+        method = ('forkserver'
+                  if 'forkserver' in multiprocessing.get_all_start_methods()
+                  else 'spawn')
+    with multiprocessing.get_context(method).Pool(processes) as pool:
+        yield from pool.imap_unordered(
+            functools.partial(_export, savefig_kwargs=kwargs), jobs,
+            chunksize=chunksize)
+
+
+def demo_figure(figure, seed=0):
+    """A report-like figure: a few lines, a scatter, a histogram."""
+    rng = np.random.default_rng(seed)
+    figure.set_size_inches(8, 6)
+    ax1, ax2, ax3 = figure.subplots(3, 1)
+    t = np.linspace(0, 10, 2000)
+    for i in range(4):
+        ax1.plot(t, np.sin(t * (i + 1)) + rng.normal(0, .1, t.size),
+                 label=f'channel {i}')
+    ax1.legend(loc='upper right')
+    ax1.set_title(f'report {seed}')
+    ax2.scatter(*rng.normal(size=(2, 1000)), s=4, c=rng.random(1000))
+    ax3.hist(rng.normal(size=10000), bins=100)
+    figure.tight_layout()
+
+
+def demo_jobs(count, directory='.'):
+    """*count* `demo_figure` jobs, saved as demo-N.png in *directory*."""
+    return [(functools.partial(demo_figure, seed=i),
+             os.path.join(directory, f'demo-{i:05d}.png'))
+            for i in range(count)]
+
+
+def _load(target):
+    module, _, name = target.partition(':')
+    jobs = getattr(importlib.import_module(module), name or 'jobs')
+    return jobs() if callable(jobs) else jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('jobs', nargs='?',
+                        help='module:name of the (builder, fname) pairs')
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    parser.add_argument('--chunksize', type=int, default=1)
+    parser.add_argument('--dpi', type=float, default=None)
+    parser.add_argument('--count', type=int, default=200,
+                        help='number of demo figures, without jobs')
+    args = parser.parse_args()
+
+    jobs = _load(args.jobs) if args.jobs else demo_jobs(args.count)
+    kwargs = {} if args.dpi is None else {'dpi': args.dpi}
+    busy = {}
+    failed = 0
+    start = time.perf_counter()
+    # fork is cheaper where available, nothing Qt runs in this process
+    method = ('fork' if 'fork' in multiprocessing.get_all_start_methods()
+              else None)
+    for fname, pid, seconds, error in export_figures(
+            jobs, args.processes, args.chunksize, method, **kwargs):
+        count, total = busy.get(pid, (0, 0.))
+        busy[pid] = count + 1, total + seconds
+        if error is not None:
+            failed += 1
+            print(f'{fname} failed:\n{error}')
+    elapsed = time.perf_counter() - start
+
+    done = sum(count for count, _ in busy.values())
+    print(f'{done} figures in {elapsed:.2f} s with {args.processes} '
+          f'processes: {done / elapsed:.1f} figures/s, '
+          f'{done / elapsed / args.processes:.1f} per process')
+    for pid, (count, total) in sorted(busy.items()):
+        print(f'  worker {pid:>7}: {count:5} figures, '
+              f'{count / total:6.1f} figures/s while busy')
+    if failed:
+        raise SystemExit(f'{failed} figures failed')
+
+
+if __name__ == "__main__":
+    main()
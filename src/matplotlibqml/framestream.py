@@ -0,0 +1,443 @@
+"""
+Streaming of the frames of a canvas to viewers on other consoles, over a
+local socket (a Unix domain socket path, or host:port for TCP):
+
+    python -m matplotlibqml.framestream view ADDRESS
+    python -m matplotlibqml.framestream demo ADDRESS
+
+Frames are split in tiles and only the tiles that changed since the
+previous frame are sent, zlib compressed, so that both the bandwidth and the
+encoding time follow how much of the plot changes, not the frame size.
+
+Each message is a header, ``<4sIIHHHI``: b'MQFS', the size of the rest of
+the message, the frame number, the frame width and height, the tile size
+and the number of tiles; then for each tile ``<HHI``: its column, row and
+compressed size, followed by its zlib compressed RGBA rows.
+"""
+import argparse
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+import traceback
+import zlib
+
+import numpy as np
+from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+
+from .matplotlibqml import FigureCanvasQTAgg, _bbox_slices, _pixel_bbox
+
+_MAGIC = b'MQFS'
+_HEADER = struct.Struct('<4sIIHHHI')
+_TILE = struct.Struct('<HHI')
+
+
+def _parse_address(address):
+    """
+    Return the (host, port) of a 'host:port' *address*, else the absolute
+    path (QLocalSocket looks for relative names in the temporary directory).
+    """
+    if isinstance(address, tuple):
+        return address
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return os.path.abspath(address)
+
+
+def _tiles(frame, tile, region=None):
+    """
+    Yield the column, row and (rows, cols) slices of the tiles of *frame*
+    overlapping the (rows, cols) slices of *region*, all of them if None.
+    """
+    height, width = frame.shape[:2]
+    rows, cols = region or (slice(0, height), slice(0, width))
+    for row in range(rows.start // tile, -(-rows.stop // tile)):
+        ys = slice(row * tile, min((row + 1) * tile, height))
+        for col in range(cols.start // tile, -(-cols.stop // tile)):
+            xs = slice(col * tile, min((col + 1) * tile, width))
+            yield col, row, ys, xs
+
+
+def _message(number, shape, tile, tiles):
+    height, width = shape[:2]
+    body = b''.join(_TILE.pack(col, row, len(data)) + data
+                    for col, row, data in tiles)
+    return _HEADER.pack(_MAGIC, _HEADER.size - 8 + len(body), number, width,
+                        height, tile, len(tiles)) + body
+
+
+class _Joined(QtCore.QObject):
+    """
+    Lives in the GUI thread, to capture the current frame of the canvas for
+    the viewers that just connected, as signalled from the accept thread.
+    """
+
+    joined = QtCore.Signal()
+
+    def __init__(self, server):
+        super().__init__()
+        self._server = server
+        self.joined.connect(self._capture)
+
+    @QtCore.Slot()
+    def _capture(self):
+        server = self._server
+        if (server._listener is not None
+                and getattr(server.canvas, 'renderer', None) is not None):
+            server._capture()
+
+
+class FrameStreamServer:
+    """
+    Streams the frames of an Agg canvas to the viewers connected to
+    *address*: a path for a Unix domain socket, or a (host, port) tuple or
+    'host:port' string for TCP.
+
+    Like `FrameRecorder`, frames are lent to a worker thread, which compares
+    the *tile* x *tile* tiles of the area the canvas updated with the last
+    frame sent, and compresses (at zlib *level*) and sends those that
+    changed.  A viewer joining gets the whole current frame right away.
+    When the worker falls behind by *max_queue* frames, frames are dropped
+    (their changes are sent with the next one).  `stats` has the counters.
+    """
+
+    def __init__(self, canvas, address, tile=64, level=1, max_queue=2):
+        self.canvas = canvas
+        self.address = _parse_address(address)
+        self.tile = tile
+        self.level = level
+        self._queue = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._clients = []
+        self._joining = []
+        self._previous = None
+        self._listener = None
+        self._threads = []
+        self._joined = _Joined(self)
+        # what the dropped frames changed: a bbox list, or None for all
+        self._missed = None
+        self.frames = 0
+        self.dropped = 0
+        self.tiles_sent = 0
+        self.tiles_total = 0
+        self.bytes_sent = 0
+        self.encode_seconds = 0.
+
+    def start(self):
+        """Listen for viewers and start streaming the canvas frames."""
+        if self._listener is not None:
+            return
+        if isinstance(self.address, tuple):
+            listener = socket.create_server(self.address)
+        else:
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            listener.bind(self.address)
+            listener.listen()
+        # closing the socket doesn't wake accept up everywhere, poll instead
+        listener.settimeout(.2)
+        self._stopping = False
+        self._listener = listener
+        self._threads = [
+            threading.Thread(target=target, name=name, daemon=True)
+            for target, name in [(self._accept, 'matplotlibqml-stream-accept'),
+                                 (self._serve, 'matplotlibqml-stream')]]
+        for thread in self._threads:
+            thread.start()
+        self.canvas._recorders = (*self.canvas._recorders, self)
+
+    def stop(self):
+        """Stop streaming and disconnect the viewers."""
+        if self._listener is None:
+            return
+        self.canvas._recorders = tuple(
+            recorder for recorder in self.canvas._recorders
+            if recorder is not self)
+        self._stopping = True
+        # drop the frames still queued rather than wait for the worker
+        while True:
+            try:
+                self._queue.put_nowait(None)
+                break
+            except queue.Full:
+                pass
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            if item is not None:
+                self.canvas._return_frame(item[1])
+        for thread in self._threads:
+            thread.join()
+        self._listener.close()
+        self._listener = None
+        if not isinstance(self.address, tuple):
+            os.unlink(self.address)
+        with self._lock:
+            for client in self._clients + self._joining:
+                client.close()
+            self._clients, self._joining = [], []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        """
+        Return the frames streamed and dropped, the tiles sent out of all
+        the tiles of these frames, the bytes sent, the time spent encoding
+        and the number of viewers.
+        """
+        with self._lock:
+            clients = len(self._clients) + len(self._joining)
+        return {'frames': self.frames, 'dropped': self.dropped,
+                'tiles_sent': self.tiles_sent,
+                'tiles_total': self.tiles_total,
+                'bytes_sent': self.bytes_sent,
+                'encode_seconds': self.encode_seconds, 'clients': clients}
+
+    def _capture(self, bbox=None):
+        with self._lock:
+            watched = self._clients or self._joining
+        if not watched:
+            # nothing to compare the next frame with
+            self._missed = None
+            return
+        if self._queue.full():
+            self.dropped += 1
+            if bbox is None or self._missed is None:
+                self._missed = None
+            else:
+                self._missed.append(bbox)
+            return
+        if bbox is not None and self._missed is not None:
+            bbox = Bbox.union([bbox, *self._missed])
+        else:
+            bbox = None
+        self._missed = []
+        self._queue.put((self.frames, self.canvas._lend_frame(), bbox))
+        self.frames += 1
+
+    def _accept(self):
+        while not self._stopping:
+            try:
+                client, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            client.settimeout(5)
+            with self._lock:
+                self._joining.append(client)
+            # queued to the GUI thread, which sends the current frame
+            self._joined.joined.emit()
+
+    def _serve(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            number, renderer, bbox = item
+            with self._lock:
+                joining, self._joining = self._joining, []
+            try:
+                start = time.perf_counter()
+                frame = np.asarray(renderer.buffer_rgba())
+                tiles, keyframe = self._encode(frame, bbox, bool(joining))
+                self.encode_seconds += time.perf_counter() - start
+            except Exception:
+                traceback.print_exc()
+                continue
+            finally:
+                self.canvas._return_frame(renderer)
+            message = _message(number, frame.shape, self.tile, tiles)
+            # the viewers joining need all of the frame first
+            if keyframe is not None:
+                joining = self._send(joining, keyframe)
+            clients = self._send(self._clients + joining, message)
+            with self._lock:
+                self._clients = clients
+            height, width = frame.shape[:2]
+            self.tiles_sent += len(tiles)
+            self.tiles_total += -(-height // self.tile) * -(-width // self.tile)
+
+    def _encode(self, frame, bbox, joining):
+        """
+        Return the changed tiles of *frame*, within *bbox* if not None, and
+        if *joining*, the message of the whole previous frame (None when
+        this frame is sent whole anyway).
+        """
+        previous = self._previous
+        keyframe = None
+        if previous is None or previous.shape != frame.shape:
+            previous = self._previous = np.empty_like(frame)
+            region, full = None, True
+        else:
+            if joining:
+                keyframe = _message(
+                    self.frames, previous.shape, self.tile,
+                    [(col, row, zlib.compress(previous[ys, xs].tobytes(),
+                                              self.level))
+                     for col, row, ys, xs in _tiles(previous, self.tile)])
+            region = (None if bbox is None else
+                      _bbox_slices(_pixel_bbox(bbox), frame.shape[0]))
+            full = False
+        tiles = []
+        for col, row, ys, xs in _tiles(frame, self.tile, region):
+            new, old = frame[ys, xs], previous[ys, xs]
+            if not full and np.array_equal(new, old):
+                continue
+            old[...] = new
+            tiles.append((col, row, zlib.compress(new.tobytes(), self.level)))
+        return tiles, keyframe
+
+    def _send(self, clients, message):
+        """Send *message* to *clients*, return those still connected."""
+        connected = []
+        for client in clients:
+            try:
+                client.sendall(message)
+            except OSError:
+                client.close()
+                continue
+            self.bytes_sent += len(message)
+            connected.append(client)
+        return connected
+
+
+class FrameDecoder:
+    """
+    Rebuilds the frames of a `FrameStreamServer` stream into ``frame``, an
+    (height, width, 4) RGBA array; `feed` it the bytes received.
+    """
+
+    def __init__(self):
+        self.frame = None
+        self.number = None
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Decode the messages completed by *data*; return their count."""
+        self._buffer += data
+        count = 0
+        offset = 0
+        while len(self._buffer) - offset >= _HEADER.size:
+            magic, size, number, width, height, tile, ntiles = \
+                _HEADER.unpack_from(self._buffer, offset)
+            if magic != _MAGIC:
+                raise ValueError('not a matplotlibqml frame stream')
+            end = offset + 8 + size
+            if len(self._buffer) < end:
+                break
+            if self.frame is None or self.frame.shape[:2] != (height, width):
+                self.frame = np.zeros((height, width, 4), np.uint8)
+            pos = offset + _HEADER.size
+            for _ in range(ntiles):
+                col, row, length = _TILE.unpack_from(self._buffer, pos)
+                pos += _TILE.size
+                target = self.frame[row * tile:(row + 1) * tile,
+                                    col * tile:(col + 1) * tile]
+                target[...] = np.frombuffer(
+                    zlib.decompress(self._buffer[pos:pos + length]),
+                    np.uint8).reshape(target.shape)
+                pos += length
+            self.number = number
+            offset = end
+            count += 1
+        del self._buffer[:offset]
+        return count
+
+
+class FrameStreamViewer(QtWidgets.QWidget):
+    """Shows the frames streamed by a `FrameStreamServer` at *address*."""
+
+    def __init__(self, address, parent=None):
+        super().__init__(parent)
+        self.decoder = FrameDecoder()
+        self._image = None
+        self._frame = None
+        address = _parse_address(address)
+        if isinstance(address, tuple):
+            self._socket = QtNetwork.QTcpSocket(self)
+            self._socket.connectToHost(*address)
+        else:
+            self._socket = QtNetwork.QLocalSocket(self)
+            self._socket.connectToServer(address)
+        self._socket.readyRead.connect(self._read)
+
+    def _read(self):
+        if not self.decoder.feed(self._socket.readAll().data()):
+            return
+        frame = self.decoder.frame
+        if frame is not self._frame:
+            # the image wraps the decoded frame, until its size changes
+            self._frame = frame
+            height, width = frame.shape[:2]
+            self._image = QtGui.QImage(frame, width, height, width * 4,
+                                       QtGui.QImage.Format.Format_RGBA8888)
+            self.resize(width, height)
+        self.update()
+
+    def paintEvent(self, event):
+        if self._image is None:
+            return
+        painter = QtGui.QPainter(self)
+        try:
+            painter.drawImage(0, 0, self._image)
+        finally:
+            painter.end()
+
+
+def _demo(address):
+    canvas = FigureCanvasQTAgg(Figure())
+    axes = canvas.figure.subplots(2, 2)
+    t = np.linspace(0, 10, 500)
+    line, = axes[0, 0].plot(t, np.sin(t))
+    for ax in axes.flat[1:]:
+        ax.plot(t, np.cos(t * ax.get_subplotspec().num1))
+    canvas.resize(800, 600)
+    canvas.show()
+    server = FrameStreamServer(canvas, address)
+    server.start()
+
+    def update():
+        # only one axes changes, most tiles don't
+        line.set_ydata(np.sin(t + time.time()))
+        canvas.draw_idle()
+        stats = server.stats()
+        if stats['frames']:
+            print(f"\r{stats['clients']} viewers, {stats['frames']} frames, "
+                  f"{stats['tiles_sent'] / max(stats['tiles_total'], 1):.0%}"
+                  f" of the tiles sent, {stats['bytes_sent'] / 1e6:.1f} MB",
+                  end='')
+    timer = canvas.new_timer(50)
+    timer.add_callback(update)
+    timer.start()
+    return canvas, server, timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('command', choices=['view', 'demo'])
+    parser.add_argument('address', help='socket path, or host:port')
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if args.command == 'view':
+        viewer = FrameStreamViewer(args.address)
+        viewer.setWindowTitle(f'matplotlibqml - {args.address}')
+        viewer.show()
+    else:
+        demo = _demo(args.address)
+    app.exec()
+
+
+if __name__ == "__main__":
+    main()
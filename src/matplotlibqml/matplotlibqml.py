@@ -1,32 +1,101 @@
+import collections
+import contextlib
+import functools
 import logging
+import math
 import operator
 import os
+import pickle
+import queue
 import sys
+import threading
 import time
 import traceback
+import weakref
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib
 import matplotlib as mpl
 import numpy as np
+import PIL.Image
 from PySide6 import QtCore, QtGui, QtQuick, QtWidgets
 from PySide6.QtCore import Qt, qInstallMessageHandler, QMessageLogContext, QtMsgType
 
 from matplotlib import cbook, _api
-from matplotlib.backend_bases import FigureCanvasBase, NavigationToolbar2, MouseButton, TimerBase
+from matplotlib.backend_bases import DrawEvent, FigureCanvasBase, NavigationToolbar2, MouseButton, RendererBase, ResizeEvent, TimerBase
+from matplotlib.axes import Axes
+from matplotlib.axis import Axis, Tick
 from matplotlib.backend_tools import cursors
-from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg, get_hinting_flag
+from matplotlib import colors as mcolors
+from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.figure import Figure
-from matplotlib.transforms import Bbox
+from matplotlib.font_manager import findfont, weight_dict
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.path import Path as MplPath
+from matplotlib.spines import Spine
+from matplotlib.ticker import (AutoLocator, AutoMinorLocator, MaxNLocator, MultipleLocator,
+                               NullFormatter, NullLocator, ScalarFormatter)
+from matplotlib.transforms import Affine2D, Bbox, TransformedBbox
+
+class AnimationClock:
+    """
+    The real time of the ticks of a `TimerQT`, for animations: ``time``, the
+    seconds since the timer started when the tick fired, ``dt`` the seconds
+    since the previous tick (skipped ones included) and ``frame`` the number
+    of ticks so far.  Pass it to the callbacks::
+
+        timer.add_callback(update, timer.clock)
+    """
+
+    def __init__(self):
+        self._start = None
+        self.time = 0.
+        self.dt = 0.
+        self.frame = 0
+
+    def _reset(self, now):
+        self._start = now
+        self.time = self.dt = 0.
+        self.frame = 0
+
+    def _tick(self, now):
+        time = now - self._start
+        self.dt = time - self.time
+        self.time = time
+        self.frame += 1
+
 
 class TimerQT(TimerBase):
-    """Subclass of `.TimerBase` using QTimer events."""
+    """
+    Subclass of `.TimerBase` using QTimer events.
+
+    Ticks are scheduled on deadlines, every *interval* from the start, so
+    that they don't drift; with *precise*, by a ``Qt.PreciseTimer``.  With
+    *skip_late*, the deadlines already past when a tick is done (the
+    callbacks took longer than the interval) are skipped, rather than
+    fired in a burst.  ``clock`` has the time of the ticks (see
+    `AnimationClock`) and `stats` the jitter and skipped ticks.
+    """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, precise=True, skip_late=True, **kwargs):
         # Create a new timer and connect the timeout() signal to the
-        # _on_timer method.
+        # _on_timer method; it is rearmed for each deadline.
         self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        if precise:
+            self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._on_timer)
+        self.skip_late = skip_late
+        self.clock = AnimationClock()
+        self._deadline = None
+        self.ticks = 0
+        self.skipped = 0
+        self._jitter_sum = 0.
+        self._jitter_max = 0.
         super().__init__(*args, **kwargs)
 
     def __del__(self):
@@ -34,20 +103,69 @@ class TimerQT(TimerBase):
         # shutdown with PySide2.
         # if not _isdeleted(self._timer):
         #    self._timer_stop()
-        self._timer_stop()
+        try:
+            self._timer_stop()
+        except RuntimeError:
+            # the QTimer went first, at interpreter exit
+            pass
 
     def _timer_set_single_shot(self):
-        self._timer.setSingleShot(self._single)
+        # the timer is single shot anyway, _on_timer doesn't rearm it
+        pass
 
     def _timer_set_interval(self):
-        self._timer.setInterval(self._interval)
+        if self._deadline is not None:
+            # the next tick is an interval from now
+            self._schedule(time.monotonic() + self._interval / 1000)
 
     def _timer_start(self):
-        self._timer.start()
+        now = time.monotonic()
+        self.clock._reset(now)
+        self._schedule(now + self._interval / 1000)
 
     def _timer_stop(self):
+        self._deadline = None
         self._timer.stop()
 
+    def _schedule(self, deadline):
+        self._deadline = deadline
+        self._timer.start(max(round((deadline - time.monotonic()) * 1000), 0))
+
+    def _on_timer(self):
+        now = time.monotonic()
+        deadline = self._deadline
+        if deadline is None:
+            return
+        jitter = now - deadline
+        self.ticks += 1
+        self._jitter_sum += jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+        self.clock._tick(now)
+        super()._on_timer()
+        if self._single or self._deadline is not deadline:
+            # stopped, or restarted, by a callback
+            if self._single:
+                self._deadline = None
+            return
+        interval = self._interval / 1000
+        deadline += interval
+        now = time.monotonic()
+        if self.skip_late and interval > 0 and now > deadline:
+            late = int((now - deadline) // interval) + 1
+            self.skipped += late
+            deadline += late * interval
+        self._schedule(deadline)
+
+    def stats(self):
+        """
+        Return the ticks fired and skipped so far, and the mean and max
+        delay of the ticks after their deadline, in milliseconds.
+        """
+        return {'ticks': self.ticks, 'skipped': self.skipped,
+                'jitter_mean': (self._jitter_sum / self.ticks * 1000
+                                if self.ticks else 0.),
+                'jitter_max': self._jitter_max * 1000}
+
 SPECIAL_KEYS = {
         QtCore.Qt.Key.Key_Escape: "escape",
         QtCore.Qt.Key.Key_Tab: "tab",
@@ -152,21 +270,925 @@ def _setDevicePixelRatio(obj, val):
         obj.setDevicePixelRatio(val)
 
 
+class _IconCache:
+    """
+    Process wide cache of the decoded matplotlib toolbar icons.
+
+    Every toolbar (and the QML image provider) asks for the same handful of
+    PNG files, so decode each of them once and hand out the shared `QImage`.
+    Images are keyed by (file name, requested size, device pixel ratio), the
+    `QIcon` built for a toolbar additionally by its foreground color.  Each
+    table keeps the *maxsize* most recently used entries (the QML provider
+    can ask for any size).
+    """
+
+    def __init__(self, maxsize=256):
+        self._lock = threading.Lock()
+        self._images = collections.OrderedDict()
+        self._icons = collections.OrderedDict()
+        self._predecode_thread = None
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _path(name):
+        return str(cbook._get_data_path('images', name))
+
+    def _lookup(self, table, key):
+        """Return the entry of *key* in *table*, or None; counted."""
+        with self._lock:
+            value = table.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                table.move_to_end(key)
+            return value
+
+    def _store(self, table, key, value):
+        with self._lock:
+            # Another thread may have made it meanwhile, keep the first one.
+            value = table.setdefault(key, value)
+            table.move_to_end(key)
+            while len(table) > self.maxsize:
+                table.popitem(last=False)
+            return value
+
+    def image(self, name, width=0, height=0, dpr=1.0):
+        """
+        Return the decoded `QImage` for *name*, scaled to *width* x *height*
+        logical pixels if they are given.
+        """
+        key = (name, width, height, dpr)
+        img = self._lookup(self._images, key)
+        if img is None:
+            img = self._store(self._images, key,
+                              self._load(name, width, height, dpr))
+        return img
+
+    def _base(self, name):
+        """Return the image of *name* at its own size, uncounted."""
+        key = (name, 0, 0, 1.0)
+        with self._lock:
+            img = self._images.get(key)
+        if img is None:
+            img = self._store(self._images, key, self._load(name))
+        return img
+
+    def _load(self, name, width=0, height=0, dpr=1.0):
+        """Decode (and scale) the image of `image`, uncounted."""
+        if width > 0 or height > 0:
+            img = self._base(name)
+            if not img.isNull():
+                img = img.scaled(round((width or height) * dpr),
+                                 round((height or width) * dpr),
+                                 QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                                 QtCore.Qt.TransformationMode.SmoothTransformation)
+                img.setDevicePixelRatio(dpr)
+        else:
+            img = QtGui.QImage(self._path(name))
+            if dpr != 1.0:
+                img.setDevicePixelRatio(dpr)
+        return img
+
+    def icon(self, name, dpr, color=None):
+        """
+        Return a `QIcon` for *name*, recolored with *color* (a `QColor`) for
+        dark themes.  Must be called from the GUI thread.
+        """
+        key = (name, dpr, color.rgba() if color is not None else None)
+        icon = self._lookup(self._icons, key)
+        if icon is not None:
+            return icon
+        pm = QtGui.QPixmap.fromImage(self._base(name))
+        _setDevicePixelRatio(pm, dpr)
+        if color is not None:
+            mask = pm.createMaskFromColor(
+                QtGui.QColor('black'),
+                QtCore.Qt.MaskMode.MaskOutColor)
+            pm.fill(color)
+            pm.setMask(mask)
+        return self._store(self._icons, key, QtGui.QIcon(pm))
+
+    def predecode(self, background=True):
+        """
+        Decode the whole matplotlib icon set, in a daemon thread if
+        *background* is true.
+        """
+        def _decode_all():
+            for path in sorted(Path(self._path('')).glob('*.png')):
+                self.image(path.name)
+
+        if not background:
+            _decode_all()
+        elif self._predecode_thread is None:
+            self._predecode_thread = threading.Thread(
+                target=_decode_all, name='matplotlibqml-icons', daemon=True)
+            self._predecode_thread.start()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'images': len(self._images), 'icons': len(self._icons)}
+
+    def nbytes(self):
+        with self._lock:
+            return sum(img.sizeInBytes() for img in self._images.values())
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._icons.clear()
+            self.hits = self.misses = 0
+
+
+_icon_cache = _IconCache()
+
+# Decoding the icons takes a noticeable part of the startup of applications with
+# many toolbars, so optionally get it out of the way while the app is loading.
+if os.environ.get('MATPLOTLIBQML_PREDECODE_ICONS', '0') not in ('', '0'):
+    _icon_cache.predecode()
+
+
+def icon_cache_stats():
+    """Return the hit/miss counters and the sizes of the shared icon cache."""
+    return _icon_cache.stats()
+
+
+class _LRUPool:
+    """
+    Thread safe pool of idle, equally sized objects.
+
+    `acquire` hands out an idle object of the given key when there is one and
+    only creates a new one through *factory* otherwise; `release` gives it
+    back.  Idle objects are evicted least recently released first once they
+    hold more than *max_bytes*.
+    """
+
+    def __init__(self, factory, nbytes, max_bytes):
+        self._factory = factory
+        self._nbytes = nbytes
+        self._lock = threading.Lock()
+        self._idle = collections.OrderedDict()
+        self.max_bytes = max_bytes
+        self.idle_bytes = 0
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, key):
+        with self._lock:
+            for token, (idle_key, obj) in reversed(self._idle.items()):
+                if idle_key == key:
+                    del self._idle[token]
+                    self.idle_bytes -= self._nbytes(key)
+                    self.reuses += 1
+                    return obj
+            self.allocations += 1
+        return self._factory(key)
+
+    def release(self, key, obj):
+        with self._lock:
+            self._idle[id(obj)] = (key, obj)
+            self.idle_bytes += self._nbytes(key)
+            while self.idle_bytes > self.max_bytes and self._idle:
+                idle_key, _ = self._idle.popitem(last=False)[1]
+                self.idle_bytes -= self._nbytes(idle_key)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+            self.idle_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'allocations': self.allocations, 'reuses': self.reuses,
+                    'idle': len(self._idle), 'idle_bytes': self.idle_bytes}
+
+
+class _TextCache:
+    """
+    Thread safe LRU cache of text layouts and glyph bitmaps, bounded by the
+    bytes of the bitmaps it holds.
+    """
+
+    def __init__(self, max_bytes):
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, nbytes=0):
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes and self._entries:
+                self.nbytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            calls = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / calls if calls else 0.,
+                    'entries': len(self._entries), 'bytes': self.nbytes}
+
+
+_text_cache = _TextCache(max_bytes=16 * 1024 * 1024)
+
+
+def text_cache_stats():
+    """Return the counters of the text layout and glyph bitmap cache."""
+    return _text_cache.stats()
+
+
+class _CachingRendererAgg(RendererAgg):
+    """
+    RendererAgg that takes the layout and the rasterized glyphs of plain text
+    from `_text_cache`, so that unchanged tick labels, titles and legends
+    only cost a blit of their bitmap.
+
+    Bitmaps are rasterized unrotated (as RendererAgg does) and keyed by
+    (string, font properties, dpi, antialiasing, hinting); the rotation is
+    applied when they are drawn.  Mathtext and TeX go the regular way.
+    """
+
+    def _text_key(self, kind, s, prop):
+        # the fields of FontProperties.__hash__, not the hash, which collides
+        font = (tuple(prop.get_family()), prop.get_style(), prop.get_variant(),
+                prop.get_weight(), prop.get_stretch(),
+                prop.get_size_in_points(), prop.get_file(),
+                prop.get_math_fontfamily())
+        return (kind, s, font, self.dpi,
+                mpl.rcParams['text.antialiased'], get_hinting_flag())
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        # docstring inherited
+        if ismath:
+            return super().draw_text(gc, x, y, s, prop, angle, ismath, mtext)
+        key = self._text_key('bitmap', s, prop)
+        entry = _text_cache.get(key)
+        if entry is None:
+            font = self._prepare_font(prop)
+            font.set_text(s, 0, flags=get_hinting_flag())
+            font.draw_glyphs_to_bitmap(
+                antialiased=mpl.rcParams['text.antialiased'])
+            # get_image() is a view of the buffer the font reuses
+            image = np.array(font.get_image())
+            xo, yo = font.get_bitmap_offset()
+            entry = (image, xo / 64.0, yo / 64.0, font.get_descent() / 64.0)
+            _text_cache.put(key, entry, image.nbytes)
+        else:
+            entry = entry[0]
+        image, xo, yo, d = entry
+        # Same placement as RendererAgg.draw_text.
+        xd = d * math.sin(math.radians(angle))
+        yd = d * math.cos(math.radians(angle))
+        x = round(x + xo + xd)
+        y = round(y + yo + yd)
+        self._renderer.draw_text_image(image, x, y + 1, angle, gc)
+
+    def get_text_width_height_descent(self, s, prop, ismath):
+        # docstring inherited
+        if ismath:
+            return super().get_text_width_height_descent(s, prop, ismath)
+        key = self._text_key('layout', s, prop)
+        entry = _text_cache.get(key)
+        if entry is None:
+            entry = super().get_text_width_height_descent(s, prop, ismath)
+            # a nominal size, so that layouts are bounded too
+            _text_cache.put(key, entry, 128 + len(s))
+        else:
+            entry = entry[0]
+        return entry
+
+
+# Renderers are keyed like FigureCanvasAgg.get_renderer does, by
+# (width, height, dpi); frame buffers by their numpy shape.
+_renderer_pool = _LRUPool(lambda key: _CachingRendererAgg(*key),
+                          lambda key: int(key[0]) * int(key[1]) * 4,
+                          max_bytes=128 * 1024 * 1024)
+_buffer_pool = _LRUPool(lambda shape: np.empty(shape, np.uint8),
+                        lambda shape: int(np.prod(shape)),
+                        max_bytes=64 * 1024 * 1024)
+
+
+# Renderers holding a frame lent to a FrameRecorder: renderer -> [key, count].
+# The canvas renders into another one until they are returned.
+_lent_renderers = {}
+_lend_lock = threading.Lock()
+
+
+def pool_stats():
+    """Return the counters of the shared renderer and frame buffer pools."""
+    return {'renderers': _renderer_pool.stats(),
+            'buffers': _buffer_pool.stats()}
+
+
+# Every live Agg canvas, for memory_report_all().
+_live_canvases = weakref.WeakSet()
+
+
+def memory_report_all():
+    """
+    Return the memory held by all the live Agg canvases and the shared caches.
+
+    The result maps 'canvases' to the `memory_report` of each canvas, keyed by
+    its objectName (or class name) and id, 'shared' to the bytes held by the
+    process wide pools and caches, and 'total' to the grand total in bytes.
+    """
+    canvases = {}
+    for canvas in list(_live_canvases):
+        try:
+            name = canvas.objectName() or type(canvas).__name__
+            canvases[f'{name}@{id(canvas):#x}'] = canvas.memory_report()
+        except RuntimeError:
+            # The C++ side has already been deleted (e.g. by QML).
+            continue
+    shared = {'renderer_pool': _renderer_pool.idle_bytes,
+              'buffer_pool': _buffer_pool.idle_bytes,
+              'icon_cache': _icon_cache.nbytes(),
+              'text_cache': _text_cache.nbytes}
+    total = (sum(report['total'] for report in canvases.values())
+             + sum(shared.values()))
+    return {'canvases': canvases, 'shared': shared, 'total': total}
+
+
+def _capped_render_ratio(dpi_ratio, original_dpi, width, height,
+                         max_dpi, max_pixels):
+    """
+    Return the device pixel ratio to render the figure at: *dpi_ratio*,
+    lowered so that the figure dpi stays below *max_dpi* and the physical size
+    of a *width* x *height* (logical pixels) canvas below *max_pixels*, when
+    they are non zero.  Qt upscales the frame the rest of the way.
+
+    The pixel cap is rounded down to 1/8 steps: otherwise every resize past
+    it would change the figure dpi, and miss the renderers and texts cached
+    for the previous one.
+    """
+    ratio = dpi_ratio
+    if max_dpi > 0:
+        ratio = min(ratio, max_dpi / original_dpi)
+    if max_pixels > 0 and width > 0 and height > 0:
+        capped = (max_pixels / (width * height)) ** 0.5
+        if capped < ratio:
+            ratio = max(math.floor(capped * 8) / 8, 1 / 8)
+    return ratio
+
+
+def _rgba_to_premultiplied_argb32(rgba, out):
+    """
+    Like `cbook._unmultiplied_rgba8888_to_premultiplied_argb32`, but writing
+    into the existing uint8 array *out* of the same shape as *rgba*.
+    """
+    if sys.byteorder == "little":
+        order = (2, 1, 0, 3)
+        rgb, alpha = out[..., :-1], out[..., -1:]
+    else:
+        order = (3, 0, 1, 2)
+        rgb, alpha = out[..., 1:], out[..., :1]
+    for dst, src in enumerate(order):
+        out[..., dst] = rgba[..., src]
+    # Only bother premultiplying when the figure is not fully opaque, as the
+    # cost is not negligible.
+    if alpha.min() < 0xff:
+        mask = (alpha != 0) & (alpha != 0xff)
+        if mask.any():
+            np.multiply(rgb, alpha / 0xff, out=rgb, casting="unsafe",
+                        where=mask)
+    return out
+
+
+def _bbox_slices(bbox, height):
+    """
+    Return the (rows, cols) slices of the pixels of *bbox*, in display
+    coordinates, in an image of *height* rows stored top down.
+    """
+    x0, y0, x1, y1 = bbox.extents
+    rows = slice(max(int(height - np.ceil(y1)), 0),
+                 max(int(height - np.floor(y0)), 0))
+    cols = slice(max(int(np.floor(x0)), 0), max(int(np.ceil(x1)), 0))
+    return rows, cols
+
+
+def _pixel_bbox(bbox, pad=1):
+    """
+    Return *bbox* grown by *pad* pixels (for antialiasing) and snapped out to
+    whole pixels.
+    """
+    x0, y0, x1, y1 = bbox.padded(pad).extents
+    return Bbox.from_extents(np.floor(x0), np.floor(y0),
+                             np.ceil(x1), np.ceil(y1))
+
+
+def _overlaps(a, b):
+    """Whether the bboxes *a* and *b* share some area (touching doesn't count)."""
+    return a.x0 < b.x1 and b.x0 < a.x1 and a.y0 < b.y1 and b.y0 < a.y1
+
+
+def _tightbbox(ax, renderer):
+    """
+    Return the area *ax* draws to, or None if it is hidden, without marking
+    it stale (apply_aspect always does, even when nothing moved).
+
+    Unlike the default tight bbox, that is the whole extent of every visible
+    child, including those left out of the layout (``in_layout=False``) and
+    the full width of the axis labels; and the extents of the spines (with
+    their ticks) and unclipped artists are grown by their strokes, which
+    their paths don't include.
+    """
+    if not ax.get_visible():
+        return None
+    stale = ax.stale
+    children = [artist for artist in ax.get_children() if artist.get_visible()]
+    boxes = [ax.get_tightbbox(renderer, bbox_extra_artists=children)]
+    for artist in children:
+        if isinstance(artist, Spine) or (
+                not artist.get_clip_on() and hasattr(artist, 'get_linewidth')):
+            pad = _stroke_pad(artist, renderer)
+            if pad:
+                boxes.append(artist.get_window_extent(renderer).padded(pad))
+    if not stale:
+        ax.stale = False
+    return Bbox.union(boxes)
+
+
+def _stroke_pad(artist, renderer):
+    """
+    Return how far, in whole pixels, the strokes of *artist* (and the tick
+    marks of a spine) can reach out of their paths once snapped to pixels.
+    """
+    widths = [0., *np.ravel(artist.get_linewidth())]
+    axis = artist.axis if isinstance(artist, Spine) else None
+    if axis is not None:
+        for ticks in (axis.majorTicks, axis.minorTicks):
+            if ticks:
+                widths.append(ticks[0].tick1line.get_markeredgewidth())
+    if not max(widths):
+        return 0
+    return math.ceil(renderer.points_to_pixels(max(widths)) / 2 + .5)
+
+
+# The locators and formatters the tick cache handles, whose whole state is in
+# `_fingerprint`, with the attributes that are not settings but derived from
+# the tick locations (formatters only).  Other classes (and subclasses), with
+# state elsewhere (FuncFormatter.func...), are left alone.
+_CACHED_TICKERS = {
+    AutoLocator: (), MaxNLocator: (), MultipleLocator: (),
+    AutoMinorLocator: (), NullLocator: (),
+    ScalarFormatter: ('locs', 'offset', 'orderOfMagnitude', 'format'),
+    NullFormatter: (),
+}
+
+
+def _state(value):
+    """Return *value*, an attribute of a locator or formatter, hashable."""
+    if isinstance(value, np.ndarray):
+        return value.dtype.str, value.shape, value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return tuple(_state(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _state(item)) for key, item in value.items()))
+    if hasattr(value, '__dict__'):
+        # a helper object, like the _Edge_integer of MultipleLocator
+        return type(value), _fingerprint(value)
+    return value
+
+
+def _fingerprint(obj, derived=()):
+    """
+    Return the state of a locator or formatter: all its attributes but its
+    axis and the *derived* ones.
+    """
+    return tuple((name, _state(value))
+                 for name, value in sorted(vars(obj).items())
+                 if name != 'axis' and name not in derived)
+
+
+class _TickCache:
+    """
+    Cache of the tick locations and labels of a figure, keyed by the view
+    interval of each axis, the axes size and the locator/formatter state.
+
+    Tick locating and label formatting dominate the render of small streaming
+    plots, and happen several times per draw.  Locations are reused when the
+    view hasn't changed, or derived by shifting the previous ones when the
+    view moved by a whole tick step (for evenly spaced linear locators);
+    labels are reused when the same locations recur.
+
+    Only the locators and formatters of `_CACHED_TICKERS` are cached, keyed
+    by a weak reference to them and their whole state (`_fingerprint`); the
+    cache is cleared when one of them was replaced since the last draw.
+
+    The cache is only hooked in for the duration of a canvas draw (see
+    `installed`), by shadowing methods of the axis and formatter instances,
+    so that user code and pickling never see it.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._locs = collections.OrderedDict()
+        self._labels = collections.OrderedDict()
+        self._last = collections.OrderedDict()
+        self._formatter_locs = collections.OrderedDict()
+        # the locators and formatters of each axis at the last draw
+        self._tickers = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.shifted = 0
+        self.misses = 0
+
+    def clear(self):
+        self._locs.clear()
+        self._labels.clear()
+        self._last.clear()
+        self._formatter_locs.clear()
+
+    def stats(self):
+        calls = self.hits + self.shifted + self.misses
+        return {'hits': self.hits, 'shifted': self.shifted,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.shifted) / calls if calls else 0.}
+
+    def _store(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    @contextlib.contextmanager
+    def installed(self, figure):
+        """Hook the cache into the axes of *figure* for the block."""
+        patched = []
+
+        def patch(obj, name, func):
+            patched.append((obj, name, obj.__dict__.get(name)))
+            obj.__dict__[name] = func
+
+        try:
+            formatters = set()
+            axes = [axis for ax in figure.get_axes()
+                    for axis in (getattr(ax, 'xaxis', None),
+                                 getattr(ax, 'yaxis', None))
+                    if axis is not None]
+            tickers = {axis: tuple(weakref.ref(obj) for obj in (
+                axis.major.locator, axis.minor.locator,
+                axis.major.formatter, axis.minor.formatter))
+                for axis in axes}
+            if any(self._tickers.get(axis) != refs
+                   for axis, refs in tickers.items()):
+                # set_major_locator & co were called since the last draw
+                self.clear()
+                self._tickers = weakref.WeakKeyDictionary(tickers)
+            for axis in axes:
+                major = type(axis.major.locator) in _CACHED_TICKERS
+                if major:
+                    patch(axis, 'get_majorticklocs', functools.partial(
+                        self._ticklocs, axis, axis.major,
+                        type(axis).get_majorticklocs))
+                    # minor locations depend on the major ones
+                    if type(axis.minor.locator) in _CACHED_TICKERS:
+                        patch(axis, 'get_minorticklocs', functools.partial(
+                            self._ticklocs, axis, axis.minor,
+                            type(axis).get_minorticklocs))
+                for ticker in (axis.major, axis.minor):
+                    fmt = ticker.formatter
+                    if (type(fmt) not in _CACHED_TICKERS
+                            or id(fmt) in formatters):
+                        continue
+                    formatters.add(id(fmt))
+                    patch(fmt, 'format_ticks', functools.partial(
+                        self._format_ticks, axis, fmt))
+                    patch(fmt, 'set_locs', functools.partial(
+                        self._set_locs, axis, fmt))
+            yield self
+        finally:
+            for obj, name, old in reversed(patched):
+                if old is None:
+                    obj.__dict__.pop(name, None)
+                else:
+                    obj.__dict__[name] = old
+
+    def _ticklocs(self, axis, ticker, compute):
+        locator = ticker.locator
+        ax = axis.axes
+        base = (ticker is axis.major, axis.get_scale(), weakref.ref(locator),
+                _fingerprint(locator), ax.bbox.width, ax.bbox.height,
+                ax.figure.dpi)
+        if ticker is axis.minor:
+            # minor ticks overlapping the major ones are removed
+            major = axis.major.locator
+            base += (weakref.ref(major), _fingerprint(major))
+        interval = tuple(axis.get_view_interval())
+        key = base + (interval,)
+        locs = self._locs.get(key)
+        if locs is not None:
+            self.hits += 1
+            self._locs.move_to_end(key)
+            return locs
+        locs = self._shift(base, interval, locator)
+        if locs is not None:
+            self.shifted += 1
+        else:
+            self.misses += 1
+            locs = np.asarray(compute(axis))
+        self._store(self._locs, key, locs)
+        self._store(self._last, base, (interval, locs))
+        return locs
+
+    def _shift(self, base, interval, locator):
+        """
+        Return the previous locations of *locator* shifted to *interval*, if
+        it only moved by a whole tick step.
+        """
+        last = self._last.get(base)
+        if (last is None or base[1] != 'linear'
+                or not isinstance(locator, (MaxNLocator, MultipleLocator))):
+            return None
+        (a0, b0), locs = last
+        a1, b1 = interval
+        if len(locs) < 2 or not np.isclose(b1 - a1, b0 - a0, rtol=1e-9, atol=0):
+            return None
+        steps = np.diff(locs)
+        step = steps[0]
+        if not np.allclose(steps, step, rtol=1e-9, atol=0):
+            return None
+        k = (a1 - a0) / step
+        if abs(k - round(k)) > 1e-6:
+            return None
+        return locs + round(k) * step
+
+    def _format_ticks(self, axis, fmt, values):
+        key = (weakref.ref(fmt), _fingerprint(fmt, _CACHED_TICKERS[type(fmt)]),
+               tuple(values), tuple(axis.get_view_interval()),
+               mpl.rcParams['axes.unicode_minus'])
+        labels = self._labels.get(key)
+        if labels is not None:
+            self.hits += 1
+            self._labels.move_to_end(key)
+            return labels
+        self.misses += 1
+        labels = type(fmt).format_ticks(fmt, values)
+        self._store(self._labels, key, labels)
+        return labels
+
+    def _set_locs(self, axis, fmt, locs):
+        # The formatter state (offset, order of magnitude...) only depends on
+        # the locations and the view interval, skip the recomputation when
+        # they are the ones it was last set with, and its state wasn't
+        # changed from elsewhere meanwhile.
+        derived = _CACHED_TICKERS[type(fmt)]
+        key = (_fingerprint(fmt, derived), tuple(locs),
+               tuple(axis.get_view_interval()))
+        ref = weakref.ref(fmt)
+        last = self._formatter_locs.get(ref)
+        state = tuple(_state(getattr(fmt, name, None)) for name in derived)
+        if last == (key, state):
+            return
+        type(fmt).set_locs(fmt, locs)
+        state = tuple(_state(getattr(fmt, name, None)) for name in derived)
+        self._store(self._formatter_locs, ref, (key, state))
+
+
+def _freeze(value):
+    """Return *value*, a view of the navigation stack, as a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _ticker_state(ticker):
+    """
+    Return the state of a locator or formatter: all of it for those of
+    `_CACHED_TICKERS`, its simple attributes and the identity of the others
+    for the rest.
+    """
+    if type(ticker) in _CACHED_TICKERS:
+        return _fingerprint(ticker)
+    return tuple((name, value if isinstance(value, (bool, int, float, str,
+                                                    type(None)))
+                  else id(value))
+                 for name, value in sorted(vars(ticker).items())
+                 if name != 'axis')
+
+
+def _axis_settings(axis):
+    """
+    Return a hash of the settings the ticks of *axis* are drawn with: its
+    scale, its tick parameters (grid lines...), locators and formatters.
+    """
+    tickers = (axis.major.locator, axis.minor.locator,
+               axis.major.formatter, axis.minor.formatter)
+    try:
+        return hash((axis.get_scale(), _state(axis._major_tick_kw),
+                     _state(axis._minor_tick_kw),
+                     tuple((id(ticker), _ticker_state(ticker))
+                           for ticker in tickers)))
+    except TypeError:
+        # can't tell, as if they changed
+        return id(object())
+
+
+class _FrameCache:
+    """
+    LRU cache of the rendered frames of a canvas, keyed by the size and the
+    views they were rendered at, bounded by their bytes; the frames are held
+    in buffers of `_buffer_pool`.
+
+    A frame is only valid for the data it was rendered from: `scan` tells
+    whether any artist other than the axes, their axis and ticks (which
+    navigating marks stale) went stale, was added or removed, or whether the
+    settings of an axis (`_axis_settings`) changed since, and the frames are
+    dropped then.
+    """
+
+    def __init__(self, max_bytes):
+        self._frames = collections.OrderedDict()
+        self._signature = None
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        frame = self._frames.get(key)
+        if frame is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._frames.move_to_end(key)
+        return frame
+
+    def put(self, key, buf):
+        if key in self._frames or buf.nbytes > self.max_bytes:
+            return
+        frame = self._frames[key] = _buffer_pool.acquire(buf.shape)
+        np.copyto(frame, buf)
+        self.nbytes += frame.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            _buffer_pool.release(evicted.shape, evicted)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def __len__(self):
+        return len(self._frames)
+
+    def clear(self):
+        for frame in self._frames.values():
+            _buffer_pool.release(frame.shape, frame)
+        self._frames.clear()
+        self.nbytes = 0
+
+    def scan(self, figure, reset=False):
+        """
+        Return whether the artists of *figure* changed since the last scan
+        with *reset*, which takes their current state as the reference.
+        """
+        if not reset and self._signature is None:
+            # nothing to compare with
+            return True
+        ids = []
+        todo = [figure]
+        while todo:
+            for artist in todo.pop().get_children():
+                if artist.get_animated() or isinstance(artist, Tick):
+                    # not part of the frame, or derived from the view
+                    continue
+                ids.append(id(artist))
+                todo.append(artist)
+                if isinstance(artist, Axis):
+                    ids.append(_axis_settings(artist))
+                elif isinstance(artist, Axes):
+                    ids.append((artist.axison, artist.get_frame_on()))
+                if artist._stale and not isinstance(artist, (Axes, Axis)):
+                    if not reset:
+                        self.invalidations += 1
+                        return True
+                    # the flag is set again on the next change, even of an
+                    # artist that draw skips (hidden ones)
+                    artist._stale = False
+        signature = hash(tuple(ids))
+        if reset:
+            self._signature = signature
+            return False
+        if signature != self._signature:
+            self.invalidations += 1
+            return True
+        return False
+
+    def stats(self):
+        calls = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / calls if calls else 0.,
+                'invalidations': self.invalidations,
+                'entries': len(self._frames), 'bytes': self.nbytes}
+
+
 class MatplotlibIconProvider(QtQuick.QQuickImageProvider):
     """ This class provide the matplotlib icons for the navigation toolbar.
     """
 
     def __init__(self, img_type=QtQuick.QQuickImageProvider.Image):
-        self.basedir = os.path.join(matplotlib.rcParams['datapath'], 'images')
+        self.basedir = str(cbook._get_data_path('images'))
         QtQuick.QQuickImageProvider.__init__(self, img_type)
 
     def requestImage(self, ids, size, reqSize):
-        img = QtGui.QImage(os.path.join(self.basedir, ids + '.png'))
+        img = _icon_cache.image(ids + '.png',
+                                max(reqSize.width(), 0),
+                                max(reqSize.height(), 0))
         size.setWidth(img.width())
         size.setHeight(img.height())
         return img
 
 
+class FigureExporter(QtCore.QObject):
+    """
+    Saves figures in a worker thread, so that a large export (a 600 dpi PDF)
+    doesn't freeze the GUI.  `export` pickles a snapshot of the figure, on
+    the calling thread, and the worker renders and writes that copy: the
+    figure can keep changing meanwhile and its canvas isn't involved at all.
+
+    Exports run one at a time, in order, reporting through the signals:
+    ``progress(fname, fraction)`` as the axes are rendered,
+    ``finished(fname)`` and ``failed(fname, message)``.
+    """
+
+    progress = QtCore.Signal(str, float)
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='matplotlibqml-export')
+
+    def export(self, figure, fname, **kwargs):
+        """
+        Save *figure* to *fname* like ``figure.savefig(fname, **kwargs)``,
+        in the background; return the `concurrent.futures.Future` of it.
+
+        A figure that can't be pickled (lambdas in callbacks...) fails like
+        a failed save: ``failed`` is emitted, and the future holds the error.
+        """
+        fname = os.fspath(fname)
+        try:
+            snapshot = pickle.dumps(figure)
+        except Exception as e:
+            self.failed.emit(fname, str(e))
+            future = Future()
+            future.set_exception(e)
+            return future
+        self.progress.emit(fname, 0.)
+        return self._executor.submit(self._save, snapshot, fname, kwargs)
+
+    def _save(self, snapshot, fname, kwargs):
+        try:
+            figure = pickle.loads(snapshot)
+            axes = figure.get_axes()
+            drawn = []
+            for ax in axes:
+                # report each axes drawn, on this copy only
+                def draw(renderer, ax=ax, draw=ax.draw):
+                    draw(renderer)
+                    drawn.append(ax)
+                    self.progress.emit(
+                        fname, .9 * min(len(drawn), len(axes)) / len(axes))
+                ax.draw = draw
+            figure.savefig(fname, **kwargs)
+        except Exception as e:
+            self.failed.emit(fname, str(e))
+            raise
+        self.progress.emit(fname, 1.)
+        self.finished.emit(fname)
+
+    def shutdown(self, wait=True):
+        """Stop the worker, after the pending exports if *wait*."""
+        self._executor.shutdown(wait=wait)
+
+
 class NavigationToolbar2QtQuick(QtCore.QObject, NavigationToolbar2):
     """ NavigationToolbar2 customized for QtQuick
     """
@@ -188,10 +1210,15 @@ class NavigationToolbar2QtQuick(QtCore.QObject, NavigationToolbar2):
         #     NavigationToolbar2.__init__(self, canvas)
         # else:
         #     super().__init__(canvas=canvas, parent=parent)
-        QtCore.QObject.__init__(self, parent)
-        NavigationToolbar2.__init__(self, canvas)
+        # PySide6's QObject.__init__ is cooperative, it calls
+        # NavigationToolbar2.__init__ itself with the remaining arguments.
+        super().__init__(canvas=canvas, parent=parent)
 
         self._message = ""
+        self.exporter = FigureExporter(self)
+        self.exporter.progress.connect(self._export_progress)
+        self.exporter.finished.connect(self._export_finished)
+        self.exporter.failed.connect(self._export_failed)
 
         #
         # Store margin
@@ -295,6 +1322,11 @@ class NavigationToolbar2QtQuick(QtCore.QObject, NavigationToolbar2):
         """Enable or disable back/forward button"""
         pass
 
+    def _update_view(self):
+        # the canvas may have the frame of the view in its nav_cache
+        self.canvas._nav_pending = True
+        super()._update_view()
+
     def set_cursor(self, cursor):
         """
         Set the current cursor to one of the :class:`Cursors`
@@ -317,6 +1349,9 @@ class NavigationToolbar2QtQuick(QtCore.QObject, NavigationToolbar2):
 
             for loc in locators:
                 loc.refresh()
+        tick_cache = getattr(self.canvas, 'tick_cache', None)
+        if tick_cache is not None:
+            tick_cache.clear()
         self.canvas.draw_idle()
 
     def draw_rubberband(self, event, x0, y0, x1, y1):
@@ -350,21 +1385,155 @@ class NavigationToolbar2QtQuick(QtCore.QObject, NavigationToolbar2):
             fname = QtCore.QUrl(fname).toLocalFile()
             # save dir for next time
             matplotlib.rcParams['savefig.directory'] = os.path.dirname(fname)
-        NavigationToolbar2.print_figure(self, fname, *args, **kwargs)
-        self.canvas.draw_idle()
+        # the canvas redraws itself when the print went through its buffer
+        self.canvas.figure.savefig(fname, *args, **kwargs)
 
-    def save_figure(self, *args):
-        raise NotImplementedError("save_figure is not yet implemented")
+    @QtCore.Slot(str)
+    def save_figure(self, fname=None, **kwargs):
+        """
+        Save the figure to *fname* (a path or a file: url from a QML
+        FileDialog), in the background, see `FigureExporter`; the progress
+        is shown in the message.  Without *fname*, it is saved under its
+        default name in ``savefig.directory``.
+        """
+        if not fname:
+            fname = os.path.join(
+                os.path.expanduser(matplotlib.rcParams['savefig.directory']),
+                self.canvas.get_default_filename())
+        elif fname.startswith('file:'):
+            fname = QtCore.QUrl(fname).toLocalFile()
+        if matplotlib.rcParams['savefig.directory']:
+            # save dir for next time, unless empty str (i.e., use cwd)
+            matplotlib.rcParams['savefig.directory'] = os.path.dirname(fname)
+        return self.exporter.export(self.canvas.figure, fname, **kwargs)
+
+    def _export_progress(self, fname, fraction):
+        self.message = f"Saving {os.path.basename(fname)}... {fraction:.0%}"
+
+    def _export_finished(self, fname):
+        self.message = f"Saved {fname}"
+
+    def _export_failed(self, fname, error):
+        self.message = f"Error saving {os.path.basename(fname)}: {error}"
+
+class _OverlayCanvas:
+    """
+    Mixin for the canvases below: an overlay layer drawn over the rendered
+    frame, for the rubberband, crosshairs, selection spans, hover markers...
+
+    Overlays are painter callbacks, in logical pixels, keyed by name.  Changing
+    them only repaints the overlay (`_update_overlay`), without any Agg work
+    or frame conversion.
+    """
+
+    # the FigureMirror views showing this canvas
+    _mirrors = ()
+
+    def set_overlay(self, name, paint):
+        """Draw *paint(painter)* over the figure, replacing overlay *name*."""
+        self._overlays[name] = paint
+        self._update_overlay()
+
+    def remove_overlay(self, name):
+        if self._overlays.pop(name, None) is not None:
+            self._update_overlay()
+
+    def _paint_overlays(self, painter):
+        for paint in list(self._overlays.values()):
+            painter.save()
+            try:
+                paint(painter)
+            finally:
+                painter.restore()
+
+    def _update_overlay(self):
+        raise NotImplementedError
 
-class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
+    def _update_frame(self):
+        """Queue the repaint of a newly rendered frame."""
+        self.update()
+
+    def _update_mirrors(self):
+        for mirror in self._mirrors:
+            mirror._source_changed()
+
+    def _to_logical(self, x, y):
+        """Convert display coordinates (as in events) to logical pixels."""
+        ratio = self._render_ratio
+        return x / ratio, (self.figure.bbox.height - y) / ratio
+
+    def set_crosshair(self, xy, color='gray'):
+        """
+        Draw a crosshair through the display coordinates *xy*, or remove it
+        if *xy* is None.
+        """
+        if xy is None:
+            return self.remove_overlay('crosshair')
+        x, y = self._to_logical(*xy)
+
+        def paint(painter):
+            painter.setPen(QtGui.QPen(QtGui.QColor(color), 0))
+            painter.drawLine(QtCore.QLineF(x, 0, x, self.height()))
+            painter.drawLine(QtCore.QLineF(0, y, self.width(), y))
+        self.set_overlay('crosshair', paint)
+
+    def set_span(self, span, horizontal=True, color='#400000ff'):
+        """
+        Shade the selection *span*, a (min, max) pair of display x (or y if not
+        *horizontal*) coordinates, across the whole canvas; None removes it.
+        """
+        if span is None:
+            return self.remove_overlay('span')
+        (x0, y0), (x1, y1) = (self._to_logical(v, v) for v in span)
+
+        def paint(painter):
+            if horizontal:
+                rect = QtCore.QRectF(x0, 0, x1 - x0, self.height())
+            else:
+                rect = QtCore.QRectF(0, y1, self.width(), y0 - y1)
+            painter.fillRect(rect.normalized(), QtGui.QColor(color))
+        self.set_overlay('span', paint)
+
+    def set_hover_marker(self, xy, radius=4, color='red'):
+        """
+        Circle the display coordinates *xy*, e.g. the data point under the
+        cursor, or remove the marker if *xy* is None.
+        """
+        if xy is None:
+            return self.remove_overlay('hover_marker')
+        x, y = self._to_logical(*xy)
+
+        def paint(painter):
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            painter.setPen(QtGui.QPen(QtGui.QColor(color), 1.5))
+            painter.drawEllipse(QtCore.QPointF(x, y), radius, radius)
+        self.set_overlay('hover_marker', paint)
+
+
+class _OverlayItem(QtQuick.QQuickPaintedItem):
+    """
+    Transparent child item of `FigureCanvasQtQuick` painting its overlays, so
+    that they are updated without repainting (nor re-uploading) the frame.
+    """
+
+    def __init__(self, canvas):
+        super().__init__(canvas)
+        self._canvas = canvas
+        self.setSize(canvas.size())
+
+    def paint(self, p):
+        self._canvas._paint_overlays(p)
+
+
+class FigureCanvasQtQuick(_OverlayCanvas, QtQuick.QQuickPaintedItem, FigureCanvasBase):
     """ This class creates a QtQuick Item encapsulating a Matplotlib
         Figure and all the functions to interact with the 'standard'
         Matplotlib navigation toolbar.
     """
 
     dpi_ratio_changed = QtCore.Signal()
-
-
+    max_render_dpi_changed = QtCore.Signal()
+    max_render_pixels_changed = QtCore.Signal()
 
     def __init__(self, figure=None, parent=None):
         if figure is None:
@@ -376,6 +1545,11 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
 
         # The dpi ratio (property without leading _)
         self._dpi_ratio = 1
+        # The render-scale cap (properties without leading _), 0 means no cap,
+        # and the resulting ratio the figure is actually rendered at.
+        self._max_render_dpi = 0.0
+        self._max_render_pixels = 0
+        self._render_ratio = 1
 
         # Activate hover events and mouse press events
         self.setAcceptHoverEvents(True)
@@ -395,13 +1569,22 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
 
         self._draw_pending = False
         self._is_drawing = False
-        self._draw_rect_callback = lambda painter: None
+        self._overlays = {}
+        self._overlay_item = None
+        # (width, height, dpi) of the figure as last configured
+        self._configured = None
 
         self.resize(*self.get_width_height())
 
-    def _update_figure_dpi(self):
-        dpi = self.dpi_ratio * self.figure._original_dpi
-        self.figure._set_dpi(dpi, forward=False)
+    def _update_figure_dpi(self, width=None, height=None):
+        if width is None:
+            width, height = self.width(), self.height()
+        self._render_ratio = _capped_render_ratio(
+            self._dpi_ratio, self.figure._original_dpi, width, height,
+            self._max_render_dpi, self._max_render_pixels)
+        dpi = self._render_ratio * self.figure._original_dpi
+        if dpi != self.figure.dpi:
+            self.figure._set_dpi(dpi, forward=False)
 
     # property exposed to Qt
     def get_dpi_ratio(self):
@@ -414,42 +1597,69 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
         # As described in __init__ above, we need to be careful in cases with
         # mixed resolution displays if dpi_ratio is changing between painting
         # events.
-        # Return whether we triggered a resizeEvent (and thus a paintEvent)
-        # from within this function.
         if new_ratio != self._dpi_ratio:
             self._dpi_ratio = new_ratio
-            # We need to update the figure DPI.
-            self._update_figure_dpi()
-            # The easiest way to resize the canvas is to emit a resizeEvent
-            # since we implement all the logic for resizing the canvas for
-            # that event.
-            self.geometryChanged(self.boundingRect(), self.boundingRect())
-            # resizeEvent triggers a paintEvent itself, so we exit this one
-            # (after making sure that the event is immediately handled).
+            self.dpi_ratio_changed.emit()
+            self._reconfigure(self.width(), self.height())
 
     dpi_ratio = QtCore.Property(float,
                                 get_dpi_ratio,
                                 set_dpi_ratio,
                                 notify=dpi_ratio_changed)
 
+    # Render-scale cap: on wall sized HiDPI displays render the figure at a
+    # lower resolution and let Qt upscale it, trading sharpness for speed.
+    def get_max_render_dpi(self):
+        return self._max_render_dpi
+
+    def set_max_render_dpi(self, value):
+        if value != self._max_render_dpi:
+            self._max_render_dpi = value
+            self.max_render_dpi_changed.emit()
+            self._reconfigure(self.width(), self.height())
+
+    max_render_dpi = QtCore.Property(float,
+                                     get_max_render_dpi,
+                                     set_max_render_dpi,
+                                     notify=max_render_dpi_changed)
+
+    def get_max_render_pixels(self):
+        return self._max_render_pixels
+
+    def set_max_render_pixels(self, value):
+        if value != self._max_render_pixels:
+            self._max_render_pixels = value
+            self.max_render_pixels_changed.emit()
+            self._reconfigure(self.width(), self.height())
+
+    max_render_pixels = QtCore.Property(int,
+                                        get_max_render_pixels,
+                                        set_max_render_pixels,
+                                        notify=max_render_pixels_changed)
+
     def get_width_height(self):
         w, h = FigureCanvasBase.get_width_height(self)
-        return int(w / self.dpi_ratio), int(h / self.dpi_ratio)
+        return int(w / self._render_ratio), int(h / self._render_ratio)
+
+    def _update_overlay(self):
+        # Created on first use, the overlay item holds a texture of its own.
+        if self._overlay_item is None:
+            self._overlay_item = _OverlayItem(self)
+        self._overlay_item.update()
+        self._update_mirrors()
 
     def drawRectangle(self, rect):
-        # Draw the zoom rectangle to the QPainter.  _draw_rect_callback needs
-        # to be called at the end of paintEvent.
-        if rect is not None:
-            def _draw_rect_callback(painter):
-                pen = QtGui.QPen(QtCore.Qt.black, 1 / self.dpi_ratio,
-                                 QtCore.Qt.DotLine)
-                painter.setPen(pen)
-                painter.drawRect(*(pt / self.dpi_ratio for pt in rect))
-        else:
-            def _draw_rect_callback(painter):
-                return
-        self._draw_rect_callback = _draw_rect_callback
-        self.update()
+        # Draw the zoom rectangle in the overlay.
+        if rect is None:
+            return self.remove_overlay('rubberband')
+
+        def _draw_rect_callback(painter):
+            pen = QtGui.QPen(QtCore.Qt.black, 1 / self._render_ratio,
+                             QtCore.Qt.DotLine)
+            painter.setPen(pen)
+            painter.drawRect(QtCore.QRectF(
+                *(pt / self._render_ratio for pt in rect)))
+        self.set_overlay('rubberband', _draw_rect_callback)
 
     def draw(self):
         """Render the figure, and queue a request for a Qt draw.
@@ -460,7 +1670,7 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
             return
         with cbook._setattr_cm(self, _is_drawing=True):
             super().draw()
-        self.update()
+        self._update_frame()
 
     def draw_idle(self):
         """
@@ -489,22 +1699,41 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
                 # Uncaught exceptions are fatal for PyQt5, so catch them.
                 traceback.print_exc()
 
-    def geometryChanged(self, new_geometry, old_geometry):
-        w = new_geometry.width() * self.dpi_ratio
-        h = new_geometry.height() * self.dpi_ratio
+    def _reconfigure(self, width, height):
+        """
+        Bring the figure dpi and size in line with the logical *width* and
+        *height* of the item and its dpi ratio, all at once.
+
+        Moving to another screen changes both the dpi ratio and the geometry,
+        in either order; rather than rendering after each of them, only queue
+        an idle draw, which renders the final state once.
+        """
+        # The pixel cap depends on the size, so does the render ratio.
+        self._update_figure_dpi(width, height)
+        w = width * self._render_ratio
+        h = height * self._render_ratio
 
         if (w <= 0.0) or (h <= 0.0):
             return
 
         dpival = self.figure.dpi
-        winch = w / dpival
-        hinch = h / dpival
-        self.figure.set_size_inches(winch, hinch, forward=False)
-        FigureCanvasBase.resize_event(self)
+        if self._configured == (w, h, dpival):
+            return
+        self._configured = (w, h, dpival)
+        self.figure.set_size_inches(w / dpival, h / dpival, forward=False)
+        # draw_idle calls from the resize callbacks, and a second change in
+        # the same event loop iteration, are folded in this draw.
         self.draw_idle()
-        QtQuick.QQuickPaintedItem.geometryChanged(self,
-                                                  new_geometry,
-                                                  old_geometry)
+        ResizeEvent('resize_event', self)._process()
+        self.update()
+
+    def geometryChange(self, new_geometry, old_geometry):
+        self._reconfigure(new_geometry.width(), new_geometry.height())
+        if self._overlay_item is not None:
+            self._overlay_item.setSize(new_geometry.size())
+        QtQuick.QQuickPaintedItem.geometryChange(self,
+                                                 new_geometry,
+                                                 old_geometry)
 
     def sizeHint(self):
         w, h = self.get_width_height()
@@ -535,7 +1764,7 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
         Also, the origin is different and needs to be corrected.
 
         """
-        dpi_ratio = self.dpi_ratio
+        dpi_ratio = self._render_ratio
         x = pos.x()
         # flip y so y=0 is bottom of canvas
         y = self.figure.bbox.height / dpi_ratio - pos.y()
@@ -640,25 +1869,638 @@ class FigureCanvasQtQuick(QtQuick.QQuickPaintedItem, FigureCanvasBase):
 
         optional arguments:
 
-        *interval*
-            Timer interval in milliseconds
+        *interval*
+            Timer interval in milliseconds
+
+        *callbacks*
+            Sequence of (func, args, kwargs) where func(*args, **kwargs)
+            will be executed by the timer every *interval*.
+        """
+        return TimerQT(*args, **kwargs)
+
+    def flush_events(self):
+        global qApp
+        qApp.processEvents()
+
+class _BufferRegion:
+    """
+    The BufferRegion of `_PooledAggCanvas.copy_from_bbox`, weakly
+    referenceable so that the canvas can count the live ones; attributes
+    are those of the region, and `restore_region` unwraps it.
+    """
+
+    __slots__ = ('region', 'nbytes', '__weakref__')
+
+    def __init__(self, region):
+        self.region = region
+        x0, y0, x1, y1 = region.get_extents()
+        self.nbytes = (x1 - x0) * (y1 - y0) * 4
+
+    def __getattr__(self, name):
+        return getattr(self.region, name)
+
+
+class _PooledAggCanvas:
+    """
+    Mixin for the Agg canvases below taking their renderers (and frame
+    buffers) from the shared pools, so that toggling between a few sizes
+    (maximize/restore, docking) reuses the buffers instead of reallocating
+    them.  ``frame_allocations`` counts the pool misses of the last frame,
+    ``frame_count`` the frames rendered so far.
+
+    Draws go through the canvas' ``tick_cache`` (see `_TickCache`).  When
+    ``partial_render`` is on (the default) and only some axes changed since
+    the last frame, only those are re-rendered, see `_draw_partial`;
+    ``partial_frames`` counts these frames.
+
+    When ``dirty_tiles`` is on (the default), each frame is compared with
+    the previous one in ``tile_size`` tiles and only the tiles that changed
+    are converted and repainted, see `_dirty_tiles`; `upload_stats` has the
+    fraction of the pixels that were.
+
+    Once the toolbar has a navigation stack, the frames of its views are
+    kept in ``nav_cache`` (up to ``nav_cache_bytes``, see `_FrameCache`), so
+    that going back, forward or home to a view already rendered, with the
+    same data, only copies its frame back.  The frames are tracked from the
+    first back, forward or home on, until the data changes: other draws
+    don't pay for it.
+    """
+
+    frame_allocations = 0
+    frame_count = 0
+    partial_frames = 0
+    partial_render = True
+    tick_cache = None
+    _partial_state = None
+    _background = None
+    _print_key = None
+    _blit_regions = None
+    _recorders = ()
+    dirty_tiles = True
+    tile_size = 64
+    _snapshot = None
+    upload_fraction = 1.
+    _uploaded = 0
+    _rendered = 0
+    nav_cache_bytes = 64 * 1024 * 1024
+    nav_cache = None
+    _nav_frame = None
+    # set by the toolbar when it goes back, forward or home
+    _nav_pending = False
+
+    def _acquire(self, pool, key):
+        allocations = pool.allocations
+        obj = pool.acquire(key)
+        self.frame_allocations += pool.allocations - allocations
+        return obj
+
+    def get_renderer(self, *args, **kwargs):
+        w, h = self.figure.bbox.size
+        key = w, h, self.figure.dpi
+        if self.is_saving():
+            self._print_key = key
+        if self._lastKey != key:
+            renderer = self._acquire(_renderer_pool, key)
+            with _lend_lock:
+                # a lent renderer goes back to the pool once returned
+                if (self._lastKey is not None
+                        and self.renderer not in _lent_renderers):
+                    _renderer_pool.release(self._lastKey, self.renderer)
+                self.renderer = renderer
+            self._lastKey = key
+        return self.renderer
+
+    def _lend_frame(self):
+        """
+        Lend the renderer holding the current frame, to be read from another
+        thread until `_return_frame`; the canvas switches to another renderer
+        if it has to render meanwhile (see `_unlend`).
+        """
+        with _lend_lock:
+            entry = _lent_renderers.setdefault(self.renderer,
+                                               [self._lastKey, 0])
+            entry[1] += 1
+            return self.renderer
+
+    def _return_frame(self, renderer):
+        with _lend_lock:
+            entry = _lent_renderers[renderer]
+            entry[1] -= 1
+            if entry[1]:
+                return
+            del _lent_renderers[renderer]
+            if renderer is not getattr(self, 'renderer', None):
+                # the canvas moved on to another renderer
+                _renderer_pool.release(entry[0], renderer)
+
+    def _unlend(self, keep=False):
+        """
+        Switch to another renderer if the current one is lent, copying the
+        frame over if *keep* (to blit or partially render over it).
+        """
+        if not _lent_renderers:
+            return
+        with _lend_lock:
+            lent = getattr(self, 'renderer', None)
+            if lent not in _lent_renderers:
+                return
+            renderer = self._acquire(_renderer_pool, self._lastKey)
+            if keep:
+                np.copyto(np.asarray(renderer.buffer_rgba()),
+                          np.asarray(lent.buffer_rgba()))
+                state = self._partial_state
+                if state is not None and state.get('renderer') is lent:
+                    state['renderer'] = renderer
+            self.renderer = renderer
+
+    def _frame_done(self, bbox=None):
+        """
+        Hand the completed frame to the recorders, with the *bbox* (display
+        coordinates) it changed in, None for all of it.
+        """
+        for recorder in self._recorders:
+            recorder._capture(bbox)
+        self._update_mirrors()
+
+    def draw(self):
+        # Each step is a hook of its own feature: nav_cache, partial_render
+        # (with the tick cache), frame lending, dirty_tiles and recorders.
+        self.frame_allocations = 0
+        key, nav, frame = self._nav_lookup()
+        if frame is not None:
+            self._draw_cached(frame)
+            bbox = None
+        else:
+            bbox = self._render()
+        self._nav_record(key, nav)
+        self._present(bbox)
+        self._frame_done(bbox)
+
+    def _render(self):
+        """
+        Render the figure, only its stale axes if possible; return the area
+        rendered, None for all of it.
+        """
+        if self.tick_cache is None:
+            self.tick_cache = _TickCache()
+        with self.tick_cache.installed(self.figure):
+            bbox = self._draw_partial() if self.partial_render else None
+            if bbox is None:
+                self._draw_full()
+        self.frame_count += 1
+        if bbox is not None:
+            self.partial_frames += 1
+        return bbox
+
+    def _draw_full(self):
+        """Render all of the figure, and what the next partial renders need."""
+        self._unlend()
+        self._partial_state = state = None
+        # a partial render needs some axes left alone
+        if self.partial_render and len(self.figure.axes) > 1:
+            self._save_background(self.get_renderer())
+            # blitting from a draw_event callback resets it
+            self._partial_state = state = {'others': None}
+        elif self._background is not None:
+            _buffer_pool.release(self._background.shape, self._background)
+            self._background = None
+        super().draw()
+        if state is not None and self._partial_state is state:
+            state['renderer'] = self.renderer
+            state['axes'] = {ax: [ax.get_position(original=True).extents, None]
+                             for ax in self.figure.axes}
+
+    def _present(self, bbox):
+        """
+        Queue the repaint of the frame, within *bbox* if not None, or only of
+        its tiles that changed (`dirty_tiles`).
+        """
+        rects = self._dirty_tiles(bbox) if self.dirty_tiles else None
+        if rects is not None:
+            uploaded = self._update_tiles(rects)
+        elif bbox is None:
+            self._frame_ready()
+            self.update()
+            uploaded = self.renderer.width * self.renderer.height
+        else:
+            self._update_region(bbox)
+            uploaded = bbox.width * bbox.height
+        frame_pixels = self.renderer.width * self.renderer.height
+        self.upload_fraction = uploaded / frame_pixels
+        self._uploaded += uploaded
+        self._rendered += frame_pixels
+
+    def _update_frame(self):
+        # draw queues the repaint of what changed itself
+        pass
+
+    def _nav_key(self):
+        """
+        Return the `nav_cache` key of the current frame size and views, once
+        the toolbar navigation stack is in use; None otherwise.
+        """
+        stack = getattr(self.toolbar, '_nav_stack', None)
+        if not self.nav_cache_bytes or stack is None or stack() is None:
+            return None
+        # the active position as last applied (get_position would apply the
+        # aspect, marking the axes stale)
+        views = tuple((_freeze(ax._get_view()),
+                       tuple(ax.get_position(original=True).extents),
+                       tuple(ax._position.extents))
+                      for ax in self.figure.axes)
+        w, h = self.figure.bbox.size
+        return (w, h, self.figure.dpi), views
+
+    def _nav_views(self):
+        """Return the views of the entries of the navigation stack."""
+        views = set()
+        for entry in self.toolbar._nav_stack._elements:
+            try:
+                views.add(tuple((_freeze(entry[ax][0]),
+                                 tuple(entry[ax][1][0].extents),
+                                 tuple(entry[ax][1][1].extents))
+                                for ax in self.figure.axes))
+            except KeyError:
+                # an axes added since
+                continue
+        return views
+
+    def _nav_lookup(self):
+        """
+        Return the `nav_cache` key of the frame to draw (None if the frames
+        aren't tracked), whether it's a draw of the toolbar, and the cached
+        frame of the key, if any.
+        """
+        nav, self._nav_pending = self._nav_pending, False
+        key = self._nav_key() if nav or self._nav_tracked() else None
+        frame = self._nav_cached(key, nav) if key is not None else None
+        return key, nav, frame
+
+    def _nav_record(self, key, nav):
+        """Take the frame just drawn as the one on screen, for `nav_cache`."""
+        if key is not None and (nav or self._nav_tracked()):
+            # the views may have been autoscaled by the render
+            self._nav_frame = self._nav_key(), self.renderer
+            self.nav_cache.scan(self.figure, reset=True)
+
+    def _nav_tracked(self):
+        """
+        Return whether the frame on screen or in `nav_cache` may still be
+        reused, so that draws have to check the data they render.
+        """
+        return self._nav_frame is not None or bool(self.nav_cache)
+
+    def _nav_cached(self, key, nav):
+        """
+        Drop the frames of `nav_cache` if the data changed; then, for a draw
+        of the toolbar (*nav*), keep the frame on screen if it shows a view
+        of the navigation stack, and return the cached frame of *key*, if
+        any.
+        """
+        cache = self.nav_cache
+        if cache is None:
+            cache = self.nav_cache = _FrameCache(self.nav_cache_bytes)
+        if cache.scan(self.figure):
+            # no frame rendered so far has the current data
+            cache.clear()
+            self._nav_frame = None
+            return None
+        if not nav:
+            return None
+        views = self._nav_views()
+        if self._nav_frame is not None:
+            shown, renderer = self._nav_frame
+            if (shown != key and shown not in cache and shown[1] in views
+                    and renderer is getattr(self, 'renderer', None)):
+                cache.put(shown, np.asarray(renderer.buffer_rgba()))
+        return cache.get(key) if key[1] in views else None
+
+    def _draw_cached(self, frame):
+        """
+        Show *frame*, from `nav_cache`, as if the figure was rendered: only
+        the ticks are updated to the view before the draw_event.
+        """
+        self._unlend()
+        renderer = self.get_renderer()
+        np.copyto(np.asarray(renderer.buffer_rgba()), frame)
+        # the buffer no longer holds what the last render did
+        self._partial_state = None
+        for ax in self.figure.axes:
+            # the ticks and their labels as a render of the view sets them,
+            # for the draw_event callbacks (blitting, label placement)
+            for axis in ax._axis_map.values():
+                axis._update_ticks()
+            ax.stale = False
+        self.figure.stale = False
+        DrawEvent('draw_event', self, renderer)._process()
+
+    def _dirty_tiles(self, bbox=None):
+        """
+        Compare the frame (within *bbox*, if not None) with the previous one,
+        in tiles, and return the display coordinates bboxes of the runs of
+        tiles that changed, merged down the rows of tiles into bands when
+        they span the same columns; None if all of the frame has to be
+        repainted.
+        """
+        buf = np.asarray(self.renderer.buffer_rgba())
+        height, width = buf.shape[:2]
+        # a pixel per uint32, for a single comparison per pixel
+        new = buf.view(np.uint32).reshape(height, width)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.shape != buf.shape:
+            if snapshot is not None:
+                _buffer_pool.release(snapshot.shape, snapshot)
+            snapshot = self._snapshot = self._acquire(_buffer_pool, buf.shape)
+            np.copyto(snapshot, buf)
+            return None
+        old = snapshot.view(np.uint32).reshape(height, width)
+        t = self.tile_size
+        if bbox is None:
+            r0, r1, c0, c1 = 0, height, 0, width
+        else:
+            # the area, grown to whole tiles
+            rows, cols = _bbox_slices(bbox, height)
+            r0, r1 = rows.start // t * t, min(-(-rows.stop // t) * t, height)
+            c0, c1 = cols.start // t * t, min(-(-cols.stop // t) * t, width)
+            if r0 >= r1 or c0 >= c1:
+                return []
+        changed = new[r0:r1, c0:c1] != old[r0:r1, c0:c1]
+        tiles = np.logical_or.reduceat(
+            np.logical_or.reduceat(changed, np.arange(0, r1 - r0, t), axis=0),
+            np.arange(0, c1 - c0, t), axis=1)
+        bands = []
+        # the bands ending at the previous row of tiles, by their columns
+        above = {}
+        for i, row in enumerate(tiles):
+            # the starts and ends of the runs of changed tiles
+            edges = np.flatnonzero(np.diff(np.concatenate([[0], row, [0]])))
+            y0 = r0 + i * t
+            y1 = min(y0 + t, r1)
+            below = {}
+            for start, end in zip(edges[::2], edges[1::2]):
+                x0 = c0 + start * t
+                x1 = min(c0 + end * t, c1)
+                old[y0:y1, x0:x1] = new[y0:y1, x0:x1]
+                band = above.get((x0, x1))
+                if band is None:
+                    band = [x0, y0, x1, y1]
+                    bands.append(band)
+                band[3] = y1
+                below[x0, x1] = band
+            above = below
+        return [Bbox.from_extents(x0, height - y1, x1, height - y0)
+                for x0, y0, x1, y1 in bands]
+
+    def _update_tiles(self, rects):
+        """
+        Queue the repaint of the *rects* bboxes of the frame; return the
+        number of pixels to be uploaded.
+        """
+        for rect in rects:
+            self._update_region(rect)
+        return sum(rect.width * rect.height for rect in rects)
+
+    def upload_stats(self):
+        """
+        Return the fraction of the frame pixels converted and uploaded for
+        the last frame, and overall.
+        """
+        return {'last': self.upload_fraction,
+                'mean': self._uploaded / self._rendered if self._rendered else 1.}
+
+    def _save_background(self, renderer):
+        """Render the figure patch alone, and keep it for `_draw_partial`."""
+        buf = np.asarray(renderer.buffer_rgba())
+        background = self._background
+        if background is None or background.shape != buf.shape:
+            if background is not None:
+                _buffer_pool.release(background.shape, background)
+            background = self._background = self._acquire(_buffer_pool,
+                                                           buf.shape)
+        renderer.clear()
+        self.figure.patch.draw(renderer)
+        np.copyto(background, buf)
+
+    def _draw_partial(self):
+        """
+        Re-render only the stale axes of the figure, over the figure
+        background, and return the updated area; return None when the whole
+        figure has to be rendered instead.
+
+        That is the case when something else than axes changed (figure
+        texts, legends, the layout, the canvas size...), when an axes moved,
+        when a re-rendered area would overlap another axes or figure artist,
+        and when the buffer was drawn to outside of `draw` (blitting).
+        """
+        figure = self.figure
+        state = self._partial_state
+        if (state is None or state.get('renderer') is not self.get_renderer()
+                or figure.get_layout_engine() is not None or figure.subfigs
+                or list(state['axes']) != figure.axes):
+            return None
+        renderer = self.renderer
+        axes = set(figure.axes)
+        others = [artist for artist in figure.get_children()
+                  if artist is not figure.patch and artist not in axes]
+        if figure.patch.stale or any(artist.stale for artist in others):
+            return None
+        stale = [ax for ax in figure.axes if ax.stale]
+        if not stale or len(stale) == len(figure.axes):
+            return None
+        for ax in figure.axes:
+            entry = state['axes'][ax]
+            if tuple(ax.get_position(original=True).extents) != tuple(entry[0]):
+                return None
+            if entry[1] is None:
+                entry[1] = _tightbbox(ax, renderer)
+        if state['others'] is None:
+            state['others'] = [artist.get_window_extent(renderer)
+                               for artist in others if artist.get_visible()]
+
+        # The area of each stale axes is where it was and where it will be.
+        # The axes overlapping these areas (neighbours' tick labels often
+        # do) are redrawn as well, and so on.
+        new_extents = {ax: _tightbbox(ax, renderer) for ax in stale}
+        redraw = set(stale)
+        regions = {}
+        while True:
+            for ax in redraw.difference(regions):
+                boxes = [bbox for bbox in (state['axes'][ax][1],
+                                           new_extents.get(ax))
+                         if bbox is not None]
+                if boxes:
+                    regions[ax] = Bbox.intersection(
+                        _pixel_bbox(Bbox.union(boxes)), figure.bbox)
+                else:
+                    regions[ax] = None
+            areas = [region for region in regions.values()
+                     if region is not None]
+            if any(_overlaps(area, _pixel_bbox(bbox))
+                   for area in areas for bbox in state['others']):
+                return None
+            overlapping = {
+                ax for ax, entry in state['axes'].items()
+                if ax not in redraw and entry[1] is not None
+                and any(_overlaps(area, _pixel_bbox(entry[1]))
+                        for area in areas)}
+            if not overlapping:
+                break
+            redraw |= overlapping
+        if not areas or len(redraw) == len(figure.axes):
+            return None
+
+        # a copy is much cheaper than rendering all of a new renderer
+        self._unlend(keep=True)
+        renderer = self.renderer
+        buf = np.asarray(renderer.buffer_rgba())
+        for area in areas:
+            rows, cols = _bbox_slices(area, buf.shape[0])
+            buf[rows, cols] = self._background[rows, cols]
+        with cbook._setattr_cm(self, _is_drawing=True):
+            # in the order of Figure.draw
+            for ax in sorted((ax for ax in figure.axes if ax in redraw),
+                             key=lambda ax: ax.get_zorder()):
+                if not ax.get_animated():
+                    ax.draw(renderer)
+            figure.stale = False
+            DrawEvent('draw_event', self, renderer)._process()
+        for ax, new in new_extents.items():
+            state['axes'][ax][1] = new
+        return Bbox.union(areas)
+
+    def print_figure(self, *args, **kwargs):
+        # Raster formats render through get_renderer, at the print size, and
+        # vector ones not at all: the frame on screen only has to be rendered
+        # again if the print went into its buffer, or the buffer was lost.
+        # Never into a lent buffer though.
+        self._unlend(keep=True)
+        key, renderer = self._lastKey, getattr(self, 'renderer', None)
+        self._print_key = None
+        super().print_figure(*args, **kwargs)
+        if renderer is not None and self._print_key not in (None, key):
+            # take the screen renderer back before the print one is released,
+            # which may evict it from the pool otherwise
+            printed = self.renderer
+            self.renderer = self._acquire(_renderer_pool, key)
+            _renderer_pool.release(self._lastKey, printed)
+            self._lastKey = key
+        if (renderer is None or self.renderer is not renderer
+                or self._print_key == key):
+            self.draw()
+
+    def restore_region(self, region, *args, **kwargs):
+        # the buffer no longer holds what draw rendered
+        self._partial_state = None
+        self._nav_frame = None
+        self._unlend(keep=True)
+        if isinstance(region, _BufferRegion):
+            region = region.region
+        super().restore_region(region, *args, **kwargs)
 
-        *callbacks*
-            Sequence of (func, args, kwargs) where func(*args, **kwargs)
-            will be executed by the timer every *interval*.
+    def blit(self, bbox=None):
+        self._partial_state = None
+        self._nav_frame = None
+        super().blit(bbox)
+        snapshot = self._snapshot
+        if snapshot is not None:
+            # what is shown now, for the comparison of the next frame
+            buf = np.asarray(self.renderer.buffer_rgba())
+            if snapshot.shape == buf.shape:
+                rows, cols = _bbox_slices(
+                    bbox if bbox is not None else self.figure.bbox,
+                    buf.shape[0])
+                snapshot[rows, cols] = buf[rows, cols]
+        self._frame_done(bbox)
+
+    def _frame_ready(self, bbox=None):
+        """Hook run once the Agg buffer holds a new frame (or *bbox* of it)."""
+
+    def _update_region(self, bbox):
         """
-        return TimerQT(*args, **kwargs)
+        Hook run once *bbox* (display coordinates) of the frame was
+        re-rendered, queuing its repaint.
+        """
+        raise NotImplementedError
+
+    def copy_from_bbox(self, bbox):
+        # Keep track of the saved regions for memory_report, as long as the
+        # caller holds them; BufferRegion can't be weakly referenced, so hand
+        # out a wrapper that can.
+        region = _BufferRegion(super().copy_from_bbox(bbox))
+        if self._blit_regions is None:
+            self._blit_regions = weakref.WeakSet()
+        self._blit_regions.add(region)
+        return region
+
+    def _memory_items(self):
+        """Return the bytes held by this canvas, by item."""
+        items = {'agg_buffer': 0, 'blit_regions': 0}
+        renderer = getattr(self, 'renderer', None)
+        if renderer is not None:
+            items['agg_buffer'] = int(renderer.width) * int(renderer.height) * 4
+        for reg in list(self._blit_regions or ()):
+            items['blit_regions'] += reg.nbytes
+        background = self._background
+        items['partial_background'] = (
+            background.nbytes if background is not None else 0)
+        snapshot = self._snapshot
+        items['tile_snapshot'] = snapshot.nbytes if snapshot is not None else 0
+        cache = self.nav_cache
+        items['nav_cache'] = cache.nbytes if cache is not None else 0
+        return items
+
+    def memory_report(self):
+        """
+        Return the bytes of memory held by this canvas, itemized, along with
+        their 'total'.
+        """
+        report = self._memory_items()
+        report['total'] = sum(report.values())
+        return report
+
+    def _frame_qimage(self):
+        """Return a `QImage` of the current frame, in physical pixels."""
+        raise NotImplementedError
 
-    def flush_events(self):
-        global qApp
-        qApp.processEvents()
 
-class FigureCanvasQtQuickAgg(FigureCanvasAgg, FigureCanvasQtQuick):
+class FigureCanvasQtQuickAgg(_PooledAggCanvas, FigureCanvasAgg, FigureCanvasQtQuick):
     """ This class customizes the FigureCanvasQtQuick for Agg
     """
     def __init__(self, figure=None, parent=None):
         super().__init__(figure=figure, parent=parent)
         self.blitbox = None
+        self._frame = (None, None)
+        _live_canvases.add(self)
+
+    def _frame_qimage(self):
+        # matplotlib is in rgba byte order, which is what QImage's RGBA8888
+        # format expects whatever the endianness, so the image can directly
+        # wrap the Agg buffer, without any conversion or copy.  It only has to
+        # be rebuilt when the renderer changes.
+        renderer, qImage = self._frame
+        if renderer is not self.renderer:
+            renderer = self.renderer
+            buf = renderer.buffer_rgba()
+            qImage = QtGui.QImage(buf, int(renderer.width),
+                                  int(renderer.height),
+                                  int(renderer.width) * 4,
+                                  QtGui.QImage.Format_RGBA8888)
+            # keep the buffer alive as long as the image
+            self._frame = (renderer, qImage)
+            self._frame_buffer = buf
+        return qImage
+
+    def _memory_items(self):
+        items = super()._memory_items()
+        # The frame QImage wraps the Agg buffer, it doesn't own any memory.
+        items['frame_image'] = 0
+        overlay = self._overlay_item
+        items['overlay'] = 0
+        if overlay is not None:
+            ratio = self._dpi_ratio
+            items['overlay'] = (int(overlay.width() * ratio)
+                                * int(overlay.height() * ratio) * 4)
+        return items
 
     def paint(self, p):
         """
@@ -673,62 +2515,30 @@ class FigureCanvasQtQuickAgg(FigureCanvasAgg, FigureCanvasQtQuick):
         if not hasattr(self, 'renderer'):
             return
 
+        qImage = self._frame_qimage()
+        # paint uses logical pixels, not physical pixels like the renderer.
+        ratio = self._render_ratio
+        if ratio != self._dpi_ratio:
+            # the render-scale cap is hit, let Qt upscale the frame smoothly
+            p.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
         if self.blitbox is None:
-            # matplotlib is in rgba byte order.  QImage wants to put the bytes
-            # into argb format and is in a 4 byte unsigned int.  Little endian
-            # system is LSB first and expects the bytes in reverse order
-            # (bgra).
-            if QtCore.QSysInfo.ByteOrder == QtCore.QSysInfo.LittleEndian:
-                # stringBuffer = self.renderer._renderer.tostring_bgra()
-                #   tostring_xxx do not exist anymore in _renderer
-
-                # patch
-                #  Change QImage format to RGBA8888
-                #    now no conversion needed
-                #    And with bigendian?
-                stringBuffer = np.asarray(self.renderer._renderer).tobytes()
-            else:
-                stringBuffer = self.renderer.tostring_argb()
-
-            # convert the Agg rendered image -> qImage
-            qImage = QtGui.QImage(stringBuffer, self.renderer.width,
-                                  self.renderer.height,
-                                  QtGui.QImage.Format_RGBA8888)
-            if hasattr(qImage, 'setDevicePixelRatio'):
-                # Not available on Qt4 or some older Qt5.
-                qImage.setDevicePixelRatio(self.dpi_ratio)
-            # get the rectangle for the image
-            rect = qImage.rect()
-            # p = QtGui.QPainter(self)
+            source = QtCore.QRectF(qImage.rect())
             # reset the image area of the canvas to be the back-ground color
-            p.eraseRect(rect)
-            # draw the rendered image on to the canvas
-            p.drawPixmap(QtCore.QPoint(0, 0), QtGui.QPixmap.fromImage(qImage))
-
-            # draw the zoom rectangle to the QPainter
-            self._draw_rect_callback(p)
-
+            p.eraseRect(QtCore.QRectF(0, 0, source.width() / ratio,
+                                      source.height() / ratio))
         else:
-            bbox = self.blitbox
-            # repaint uses logical pixels, not physical pixels like the renderer.
-            l, b, w, h = [pt / self._dpi_ratio for pt in bbox.bounds]
-            t = b + h
-            reg = self.copy_from_bbox(bbox)
-            stringBuffer = reg.to_string_argb()
-            qImage = QtGui.QImage(stringBuffer, w, h,
-                                  QtGui.QImage.Format_RGBA8888)
-
-            if hasattr(qImage, 'setDevicePixelRatio'):
-                # Not available on Qt4 or some older Qt5.
-                qImage.setDevicePixelRatio(self.dpi_ratio)
-            pixmap = QtGui.QPixmap.fromImage(qImage)
-
-            p.drawPixmap(QtCore.QPoint(l, self.renderer.height-t), pixmap)
-
-            # draw the zoom rectangle to the QPainter
-            self._draw_rect_callback(p)
-
+            l, b, w, h = self.blitbox.bounds
+            source = QtCore.QRectF(l, self.renderer.height - (b + h), w, h)
             self.blitbox = None
+        target = QtCore.QRectF(source.x() / ratio, source.y() / ratio,
+                               source.width() / ratio, source.height() / ratio)
+        # draw the rendered image on to the canvas, the overlays are drawn
+        # by their own item on top of it
+        p.drawImage(target, qImage, source)
+
+    def _frame_ready(self, bbox=None):
+        # a whole new frame, paint all of it
+        self.blitbox = None
 
     def blit(self, bbox=None):
         """
@@ -738,16 +2548,29 @@ class FigureCanvasQtQuickAgg(FigureCanvasAgg, FigureCanvasQtQuick):
         # blit only the area defined by the bbox.
         if bbox is None and self.figure:
             bbox = self.figure.bbox
-
+        super().blit(bbox)
+        self._update_region(bbox)
+
+    def _update_tiles(self, rects):
+        # Unlike a widget's, the dirty area of a QQuickPaintedItem is a
+        # single rect: Qt clears the bounding rect of the updates before
+        # paint, so all of it is repainted (and uploaded) anyway.
+        if not rects:
+            return 0
+        bbox = Bbox.union(rects)
+        self._update_region(bbox)
+        return bbox.width * bbox.height
+
+    def _update_region(self, bbox):
+        # several regions may be updated before the next paint
+        if self.blitbox is not None:
+            bbox = Bbox.union([self.blitbox, bbox])
         self.blitbox = bbox
         # repaint uses logical pixels, not physical pixels like the renderer.
-        l, b, w, h = [pt / self._dpi_ratio for pt in bbox.bounds]
+        l, b, w, h = [pt / self._render_ratio for pt in bbox.bounds]
         t = b + h
-        self.repaint(l, self.renderer.height-t, w, h)
-
-    def print_figure(self, *args, **kwargs):
-        super().print_figure(*args, **kwargs)
-        self.draw()
+        top = self.renderer.height / self._render_ratio - t
+        self.update(QtCore.QRectF(l, top, w, h).toAlignedRect())
 
 
 class NavigationToolbar2QT(NavigationToolbar2, QtWidgets.QToolBar):
@@ -824,16 +2647,10 @@ class NavigationToolbar2QT(NavigationToolbar2, QtWidgets.QToolBar):
         """
         if QtCore.qVersion() >= '5.':
             name = name.replace('.png', '_large.png')
-        pm = QtGui.QPixmap(str(cbook._get_data_path('images', name)))
-        _setDevicePixelRatio(pm, _devicePixelRatioF(self))
+        icon_color = None
         if self.palette().color(self.backgroundRole()).value() < 128:
             icon_color = self.palette().color(self.foregroundRole())
-            mask = pm.createMaskFromColor(
-                QtGui.QColor('black'),
-                QtCore.Qt.MaskMode.MaskOutColor)
-            pm.fill(icon_color)
-            pm.setMask(mask)
-        return QtGui.QIcon(pm)
+        return _icon_cache.icon(name, _devicePixelRatioF(self), icon_color)
 
     #TODO fix in the future
     # def edit_parameters(self):
@@ -943,17 +2760,28 @@ class NavigationToolbar2QT(NavigationToolbar2, QtWidgets.QToolBar):
         if 'forward' in self._actions:
             self._actions['forward'].setEnabled(can_forward)
 
+    def _update_view(self):
+        # the canvas may have the frame of the view in its nav_cache
+        self.canvas._nav_pending = True
+        super()._update_view()
+
 #TODO may crash sometime
-class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
+class FigureCanvasQT(_OverlayCanvas, QtWidgets.QWidget, FigureCanvasBase):
     required_interactive_framework = "qt"
     _timer_cls = TimerQT
 
+    max_render_dpi_changed = QtCore.Signal()
+    max_render_pixels_changed = QtCore.Signal()
+
     def __init__(self, figure=None, parent=None):
         #TODO? how to init QWidget?
         #super().__init__(figure=figure)
         QtWidgets.QWidget.__init__(self, parent=parent)
         FigureCanvasBase.__init__(self, figure=figure)
 
+        # The render-scale cap (properties without leading _), 0 means no cap.
+        self._max_render_dpi = 0.0
+        self._max_render_pixels = 0
 
         # We don't want to scale up the figure DPI more than once.
         # Note, we don't handle a signal for changing DPI yet.
@@ -962,11 +2790,16 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
         # In cases with mixed resolution displays, we need to be careful if the
         # dpi_ratio changes - in this case we need to resize the canvas
         # accordingly.
-        self._dpi_ratio_prev = self._dpi_ratio
+        self._render_ratio_prev = self._render_ratio
 
         self._draw_pending = False
         self._is_drawing = False
-        self._draw_rect_callback = lambda painter: None
+        self._overlays = {}
+        # (width, height, dpi) of the figure as last configured, and the
+        # window/screen whose signals we are connected to.
+        self._configured = None
+        self._window = None
+        self._screen = None
 
         self.setAttribute(
             QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
@@ -977,46 +2810,128 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
         self.setPalette(palette)
 
     def _update_figure_dpi(self):
-        dpi = self._dpi_ratio * self.figure._original_dpi
-        self.figure._set_dpi(dpi, forward=False)
+        dpi = self._render_ratio * self.figure._original_dpi
+        if dpi != self.figure.dpi:
+            self.figure._set_dpi(dpi, forward=False)
 
     @property
     def _dpi_ratio(self):
         #return _devicePixelRatioF(self)
         return self.devicePixelRatioF() or 1
 
+    @property
+    def _render_ratio(self):
+        # The ratio the figure is rendered at, _dpi_ratio unless the
+        # render-scale cap is hit, in which case Qt upscales the frame.
+        return _capped_render_ratio(
+            self._dpi_ratio, self.figure._original_dpi,
+            self.width(), self.height(),
+            self._max_render_dpi, self._max_render_pixels)
+
+    # Render-scale cap: on wall sized HiDPI displays render the figure at a
+    # lower resolution and let Qt upscale it, trading sharpness for speed.
+    def get_max_render_dpi(self):
+        return self._max_render_dpi
+
+    def set_max_render_dpi(self, value):
+        if value != self._max_render_dpi:
+            self._max_render_dpi = value
+            self.max_render_dpi_changed.emit()
+            self._update_pixel_ratio()
+
+    max_render_dpi = QtCore.Property(float,
+                                     get_max_render_dpi,
+                                     set_max_render_dpi,
+                                     notify=max_render_dpi_changed)
+
+    def get_max_render_pixels(self):
+        return self._max_render_pixels
+
+    def set_max_render_pixels(self, value):
+        if value != self._max_render_pixels:
+            self._max_render_pixels = value
+            self.max_render_pixels_changed.emit()
+            self._update_pixel_ratio()
+
+    max_render_pixels = QtCore.Property(int,
+                                        get_max_render_pixels,
+                                        set_max_render_pixels,
+                                        notify=max_render_pixels_changed)
+
     def _update_pixel_ratio(self):
         # We need to be careful in cases with mixed resolution displays if
         # dpi_ratio changes.
-        if self._dpi_ratio != self._dpi_ratio_prev:
-            # We need to update the figure DPI.
-            self._update_figure_dpi()
-            self._dpi_ratio_prev = self._dpi_ratio
-            # The easiest way to resize the canvas is to emit a resizeEvent
-            # since we implement all the logic for resizing the canvas for
-            # that event.
-            event = QtGui.QResizeEvent(self.size(), self.size())
-            self.resizeEvent(event)
-            # resizeEvent triggers a paintEvent itself, so we exit this one
-            # (after making sure that the event is immediately handled).
+        if self._render_ratio != self._render_ratio_prev:
+            self._reconfigure(self.size())
+
+    def _reconfigure(self, size):
+        """
+        Bring the figure dpi and size in line with the widget *size* and its
+        render ratio, all at once.
+
+        Moving to another screen changes both the pixel ratio and the
+        geometry, in either order; rather than rendering after each of them,
+        only queue an idle draw, which renders the final state once.
+        """
+        # The pixel cap depends on the size, so does the render ratio.
+        self._update_figure_dpi()
+        self._render_ratio_prev = self._render_ratio
+        w = size.width() * self._render_ratio
+        h = size.height() * self._render_ratio
+
+        if (w <= 0.0) or (h <= 0.0):
+            return
+
+        dpival = self.figure.dpi
+        if self._configured == (w, h, dpival):
+            return
+        self._configured = (w, h, dpival)
+        self.figure.set_size_inches(w / dpival, h / dpival, forward=False)
+        # draw_idle calls from the resize callbacks, and a second change in
+        # the same event loop iteration, are folded in this draw.
+        self.draw_idle()
+        ResizeEvent('resize_event', self)._process()
+        self.update()
 
     def _update_screen(self, screen):
-        # Handler for changes to a window's attached screen.
+        # Handler for changes to a window's attached screen.  Both dpi signals
+        # may fire for one change, _update_pixel_ratio ignores the repeat.
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.physicalDotsPerInchChanged.disconnect(
+                        self._update_pixel_ratio)
+                    self._screen.logicalDotsPerInchChanged.disconnect(
+                        self._update_pixel_ratio)
+                except RuntimeError:
+                    # the screen has been removed meanwhile
+                    pass
+            self._screen = screen
+            if screen is not None:
+                screen.physicalDotsPerInchChanged.connect(
+                    self._update_pixel_ratio)
+                screen.logicalDotsPerInchChanged.connect(
+                    self._update_pixel_ratio)
         self._update_pixel_ratio()
-        if screen is not None:
-            screen.physicalDotsPerInchChanged.connect(self._update_pixel_ratio)
-            screen.logicalDotsPerInchChanged.connect(self._update_pixel_ratio)
 
     def showEvent(self, event):
         # Set up correct pixel ratio, and connect to any signal changes for it,
-        # once the window is shown (and thus has these attributes).
+        # once the window is shown (and thus has these attributes).  Only
+        # connect once per window, showEvent is sent on every show.
         window = self.window().windowHandle()
-        window.screenChanged.connect(self._update_screen)
+        if window is not self._window:
+            if self._window is not None:
+                try:
+                    self._window.screenChanged.disconnect(self._update_screen)
+                except RuntimeError:
+                    pass
+            self._window = window
+            window.screenChanged.connect(self._update_screen)
         self._update_screen(window.screen())
 
     def get_width_height(self):
         w, h = FigureCanvasBase.get_width_height(self)
-        return int(w / self._dpi_ratio), int(h / self._dpi_ratio)
+        return int(w / self._render_ratio), int(h / self._render_ratio)
 
     def enterEvent(self, event):
         try:
@@ -1047,7 +2962,7 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
 
         Also, the origin is different and needs to be corrected.
         """
-        dpi_ratio = self._dpi_ratio
+        dpi_ratio = self._render_ratio
         x = pos.x()
         # flip y so y=0 is bottom of canvas
         y = self.figure.bbox.height / dpi_ratio - pos.y()
@@ -1105,16 +3020,10 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
         frame = sys._getframe()
         if frame.f_code is frame.f_back.f_code:  # Prevent PyQt6 recursion.
             return
-        w = event.size().width() * self._dpi_ratio
-        h = event.size().height() * self._dpi_ratio
-        dpival = self.figure.dpi
-        winch = w / dpival
-        hinch = h / dpival
-        self.figure.set_size_inches(winch, hinch, forward=False)
         # pass back into Qt to let it finish
         QtWidgets.QWidget.resizeEvent(self, event)
         # emit our resize events
-        FigureCanvasBase.resize_event(self)
+        self._reconfigure(event.size())
 
     def sizeHint(self):
         w, h = self.get_width_height()
@@ -1188,7 +3097,7 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
             return
         with cbook._setattr_cm(self, _is_drawing=True):
             super().draw()
-        self.update()
+        self._update_frame()
 
     def draw_idle(self):
         """Queue redraw of the Agg buffer and request Qt paintEvent."""
@@ -1207,7 +3116,7 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
         if bbox is None and self.figure:
             bbox = self.figure.bbox  # Blit the entire canvas if bbox is None.
         # repaint uses logical pixels, not physical pixels like the renderer.
-        l, b, w, h = [int(pt / self._dpi_ratio) for pt in bbox.bounds]
+        l, b, w, h = [int(pt / self._render_ratio) for pt in bbox.bounds]
         t = b + h
         self.repaint(l, self.rect().height() - t, w, h)
 
@@ -1224,41 +3133,91 @@ class FigureCanvasQT(QtWidgets.QWidget, FigureCanvasBase):
                 # Uncaught exceptions are fatal for PyQt5, so catch them.
                 traceback.print_exc()
 
-    def drawRectangle(self, rect):
-        # Draw the zoom rectangle to the QPainter.  _draw_rect_callback needs
-        # to be called at the end of paintEvent.
-        if rect is not None:
-            x0, y0, w, h = [int(pt / self._dpi_ratio) for pt in rect]
-            x1 = x0 + w
-            y1 = y0 + h
-            def _draw_rect_callback(painter):
-                pen = QtGui.QPen(QtGui.QColor("black"), 1 / self._dpi_ratio)
-                pen.setDashPattern([3, 3])
-                for color, offset in [
-                        (QtGui.QColor("black"), 0),
-                        (QtGui.QColor("white"), 3),
-                ]:
-                    pen.setDashOffset(offset)
-                    pen.setColor(color)
-                    painter.setPen(pen)
-                    # Draw the lines from x0, y0 towards x1, y1 so that the
-                    # dashes don't "jump" when moving the zoom box.
-                    painter.drawLine(x0, y0, x0, y1)
-                    painter.drawLine(x0, y0, x1, y0)
-                    painter.drawLine(x0, y1, x1, y1)
-                    painter.drawLine(x1, y0, x1, y1)
-        else:
-            def _draw_rect_callback(painter):
-                return
-        self._draw_rect_callback = _draw_rect_callback
+    def _update_overlay(self):
+        # paintEvent only blits the cached frame before painting the overlays.
         self.update()
+        self._update_mirrors()
+
+    def drawRectangle(self, rect):
+        # Draw the zoom rectangle in the overlay.
+        if rect is None:
+            return self.remove_overlay('rubberband')
+        x0, y0, w, h = [int(pt / self._render_ratio) for pt in rect]
+        x1 = x0 + w
+        y1 = y0 + h
+
+        def _draw_rect_callback(painter):
+            pen = QtGui.QPen(QtGui.QColor("black"), 1 / self._render_ratio)
+            pen.setDashPattern([3, 3])
+            for color, offset in [
+                    (QtGui.QColor("black"), 0),
+                    (QtGui.QColor("white"), 3),
+            ]:
+                pen.setDashOffset(offset)
+                pen.setColor(color)
+                painter.setPen(pen)
+                # Draw the lines from x0, y0 towards x1, y1 so that the
+                # dashes don't "jump" when moving the zoom box.
+                painter.drawLine(x0, y0, x0, y1)
+                painter.drawLine(x0, y0, x1, y0)
+                painter.drawLine(x0, y1, x1, y1)
+                painter.drawLine(x1, y0, x1, y1)
+        self.set_overlay('rubberband', _draw_rect_callback)
 
 #TODO may crash sometime
-class FigureCanvasQTAgg(FigureCanvasAgg, FigureCanvasQT):
+class FigureCanvasQTAgg(_PooledAggCanvas, FigureCanvasAgg, FigureCanvasQT):
 
     def __init__(self, figure):
         # Must pass 'figure' as kwarg to Qt base class.
         super().__init__(figure=figure)
+        self._frame_argb = None
+        self._frame_image = None
+        _live_canvases.add(self)
+
+    def _frame_ready(self, bbox=None):
+        # Convert the Agg buffer to the premultiplied ARGB32 QImage wants once
+        # per frame (or blit), into a pooled buffer, rather than on each
+        # paintEvent.
+        rgba = np.asarray(self.renderer.buffer_rgba())
+        argb = self._frame_argb
+        if argb is None or argb.shape != rgba.shape:
+            if argb is not None:
+                _buffer_pool.release(argb.shape, argb)
+            argb = self._frame_argb = self._acquire(_buffer_pool, rgba.shape)
+            self._frame_image = QtGui.QImage(
+                argb, argb.shape[1], argb.shape[0], argb.shape[1] * 4,
+                QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+            bbox = None
+        if bbox is None:
+            _rgba_to_premultiplied_argb32(rgba, argb)
+        else:
+            rows, cols = _bbox_slices(bbox, rgba.shape[0])
+            _rgba_to_premultiplied_argb32(rgba[rows, cols], argb[rows, cols])
+
+    def _update_region(self, bbox):
+        self._frame_ready(bbox)
+        # update uses logical pixels, not physical pixels like the renderer.
+        l, b, w, h = [pt / self._render_ratio for pt in bbox.bounds]
+        top = self.renderer.height / self._render_ratio - (b + h)
+        self.update(QtCore.QRectF(l, top, w, h).toAlignedRect())
+
+    def _frame_qimage(self):
+        if self._frame_image is None:
+            self._frame_ready()
+        return self._frame_image
+
+    def _memory_items(self):
+        items = super()._memory_items()
+        argb = self._frame_argb
+        items['frame_image'] = argb.nbytes if argb is not None else 0
+        return items
+
+    def blit(self, bbox=None):
+        # docstring inherited
+        if bbox is None and self.figure:
+            bbox = self.figure.bbox
+        self._frame_ready(bbox)
+        super().blit(bbox)
 
     def paintEvent(self, event):
         """
@@ -1276,62 +3235,1433 @@ class FigureCanvasQTAgg(FigureCanvasAgg, FigureCanvasQT):
 
         painter = QtGui.QPainter(self)
         try:
-            # See documentation of QRect: bottom() and right() are off
-            # by 1, so use left() + width() and top() + height().
             rect = event.rect()
             # scale rect dimensions using the screen dpi ratio to get
-            # correct values for the Figure coordinates (rather than
-            # QT5's coords)
-            width = rect.width() * self._dpi_ratio
-            height = rect.height() * self._dpi_ratio
-            left, top = self.mouseEventCoords(rect.topLeft())
-            # shift the "top" by the height of the image to get the
-            # correct corner for our coordinate system
-            bottom = top - height
-            # same with the right side of the image
-            right = left + width
-            # create a buffer using the image bounding box
-            bbox = Bbox([[left, bottom], [right, top]])
-            reg = self.copy_from_bbox(bbox)
-            buf = cbook._unmultiplied_rgba8888_to_premultiplied_argb32(
-                memoryview(reg))
+            # the matching region of the (physical pixels) frame
+            ratio = self._render_ratio
+            if ratio != self._dpi_ratio:
+                # the render-scale cap is hit, let Qt upscale the frame
+                painter.setRenderHint(
+                    QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+            source = QtCore.QRectF(rect.left() * ratio, rect.top() * ratio,
+                                   rect.width() * ratio, rect.height() * ratio)
 
             # clear the widget canvas
             painter.eraseRect(rect)
+            painter.drawImage(QtCore.QRectF(rect), self._frame_qimage(), source)
 
-            # if QT_API == "PyQt6":
-            #     from PyQt6 import sip
-            #     ptr = sip.voidptr(buf)
-            # else:
-            #     ptr = buf
-            ptr = buf
-            qimage = QtGui.QImage(
-                ptr, buf.shape[1], buf.shape[0],
-                QtGui.QImage.Format.Format_ARGB32_Premultiplied)
-            #_setDevicePixelRatio(qimage, self._dpi_ratio)
-            qimage.setDevicePixelRatio(self._dpi_ratio)
-            # set origin using original QT coordinates
-            origin = QtCore.QPoint(rect.left(), rect.top())
-            painter.drawImage(origin, qimage)
-            # Adjust the buf reference count to work around a memory
-            # leak bug in QImage under PySide.
-            #if QT_API in ('PySide', 'PySide2'):
-            #    ctypes.c_long.from_address(id(buf)).value = 1
-            #ctypes.c_long.from_address(id(buf)).value = 1
-
-            self._draw_rect_callback(painter)
+            self._paint_overlays(painter)
         finally:
             painter.end()
 
-    def print_figure(self, *args, **kwargs):
-        super().print_figure(*args, **kwargs)
-        self.draw()
+
+class FrameRecorder:
+    """
+    Records the frames an Agg canvas shows, as a sequence of PNG files in
+    the *path* directory (``format='png'``) or as one raw RGBA stream
+    *path* with a ``path.index`` text file of the frame number, time, size
+    and offset of each frame (``format='raw'``).
+
+    Each frame (or blit) is queued as is, its renderer is lent to the writer
+    thread and the canvas only renders the next frame into another one if
+    that's still being written; nothing is copied on the GUI thread.  When
+    *max_queue* frames are already waiting for the writer, frames are
+    dropped and counted, see `stats`.
+    """
+
+    def __init__(self, canvas, path, format='png', max_queue=8,
+                 compress_level=1):
+        _api.check_in_list(['png', 'raw'], format=format)
+        self.canvas = canvas
+        self.path = os.fspath(path)
+        self.format = format
+        self.compress_level = compress_level
+        self._queue = queue.Queue(max_queue)
+        self._thread = None
+        self._start = None
+        self.frames = 0
+        self.written = 0
+        self.dropped = 0
+
+    def start(self):
+        """Start recording the frames of the canvas."""
+        if self._thread is not None:
+            return
+        if self.format == 'png':
+            os.makedirs(self.path, exist_ok=True)
+        self._start = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._write, name='matplotlibqml-recorder', daemon=True)
+        self._thread.start()
+        self.canvas._recorders = (*self.canvas._recorders, self)
+
+    def stop(self):
+        """Stop recording, once the queued frames are written."""
+        if self._thread is None:
+            return
+        self.canvas._recorders = tuple(
+            recorder for recorder in self.canvas._recorders
+            if recorder is not self)
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        """Return the frames captured, written and dropped so far."""
+        return {'frames': self.frames, 'written': self.written,
+                'dropped': self.dropped}
+
+    def _capture(self, bbox=None):
+        if self._queue.full():
+            self.dropped += 1
+            return
+        renderer = self.canvas._lend_frame()
+        self._queue.put((self.frames, time.monotonic() - self._start,
+                         renderer))
+        self.frames += 1
+
+    def _write(self):
+        if self.format == 'raw':
+            stream = open(self.path, 'wb')
+            index = open(self.path + '.index', 'w')
+            index.write('# frame time width height offset\n')
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                number, t, renderer = item
+                try:
+                    buf = renderer.buffer_rgba()
+                    width, height = int(renderer.width), int(renderer.height)
+                    if self.format == 'raw':
+                        index.write(f'{number} {t:.6f} {width} {height} '
+                                    f'{stream.tell()}\n')
+                        stream.write(buf)
+                    else:
+                        PIL.Image.frombuffer(
+                            'RGBA', (width, height), buf, 'raw', 'RGBA', 0, 1
+                        ).save(os.path.join(self.path, f'{number:06d}.png'),
+                               compress_level=self.compress_level)
+                    self.written += 1
+                except Exception:
+                    # keep recording, a full disk may be freed meanwhile
+                    traceback.print_exc()
+                finally:
+                    self.canvas._return_frame(renderer)
+        finally:
+            if self.format == 'raw':
+                stream.close()
+                index.close()
+
+
+class _FigureMirror:
+    """
+    Mixin for the mirror views below: they show the frames of a *source* Agg
+    canvas, scaled to fit, with its overlays, without rendering anything
+    themselves; the frame QImage of the source is painted as is, no copy.
+    With *max_fps*, they repaint at most that many times a second.
+    """
+
+    def _init_mirror(self, source, max_fps):
+        self._source = None
+        self._max_fps = max_fps
+        self._last_paint = 0.
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.update)
+        self.set_source(source)
+
+    def get_source(self):
+        return self._source
+
+    def _unsubscribe(self):
+        if self._source is not None:
+            self._source._mirrors = tuple(
+                mirror for mirror in self._source._mirrors
+                if mirror is not self)
+            self._source = None
+
+    def set_source(self, source):
+        if source is self._source:
+            return
+        self._unsubscribe()
+        self._source = source
+        if source is not None:
+            source._mirrors = (*source._mirrors, self)
+        self.source_changed.emit()
+        self.update()
+
+    def get_max_fps(self):
+        return self._max_fps
+
+    def set_max_fps(self, value):
+        if value != self._max_fps:
+            self._max_fps = value
+            self.max_fps_changed.emit()
+
+    def _source_changed(self):
+        """The source has a new frame, or new overlays."""
+        try:
+            if self._timer.isActive():
+                return
+            delay = (self._last_paint + 1 / self._max_fps - time.monotonic()
+                     if self._max_fps else 0)
+            if delay > 0:
+                self._timer.start(int(delay * 1000))
+            else:
+                self.update()
+        except RuntimeError:
+            # the Qt object of this view is gone
+            self._unsubscribe()
+
+    def _paint_mirror(self, painter, width, height):
+        source = self._source
+        if source is None or getattr(source, 'renderer', None) is None:
+            return
+        self._last_paint = time.monotonic()
+        image = source._frame_qimage()
+        # the frame in the logical pixels of the source, fit in this view
+        ratio = source._render_ratio
+        w, h = image.width() / ratio, image.height() / ratio
+        scale = min(width / w, height / h)
+        painter.translate((width - w * scale) / 2, (height - h * scale) / 2)
+        painter.scale(scale, scale)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawImage(QtCore.QRectF(0, 0, w, h), image)
+        painter.setClipRect(QtCore.QRectF(0, 0, w, h))
+        source._paint_overlays(painter)
+
+
+class FigureMirrorQtQuick(_FigureMirror, QtQuick.QQuickPaintedItem):
+    """
+    QtQuick item mirroring a FigureCanvasQtQuickAgg or FigureCanvasQTAgg,
+    see `_FigureMirror`::
+
+        FigureMirror { source: mplView; max_fps: 5 }
+    """
+
+    source_changed = QtCore.Signal()
+    max_fps_changed = QtCore.Signal()
+
+    def __init__(self, parent=None, source=None, max_fps=0.):
+        super().__init__(parent)
+        self._init_mirror(source, max_fps)
+
+    source = QtCore.Property(QtCore.QObject, _FigureMirror.get_source,
+                             _FigureMirror.set_source, notify=source_changed)
+    max_fps = QtCore.Property(float, _FigureMirror.get_max_fps,
+                              _FigureMirror.set_max_fps,
+                              notify=max_fps_changed)
+
+    def paint(self, painter):
+        self._paint_mirror(painter, self.width(), self.height())
+
+
+class FigureMirrorQT(_FigureMirror, QtWidgets.QWidget):
+    """QWidget mirroring an Agg canvas, see `_FigureMirror`."""
+
+    source_changed = QtCore.Signal()
+    max_fps_changed = QtCore.Signal()
+
+    def __init__(self, source=None, parent=None, max_fps=0.):
+        super().__init__(parent)
+        self._init_mirror(source, max_fps)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        try:
+            painter.eraseRect(event.rect())
+            self._paint_mirror(painter, self.width(), self.height())
+        finally:
+            painter.end()
+
+
+class _UnsupportedByQPainter(Exception):
+    """Raised by RendererQPainter for what it can't draw."""
+
+
+# The matplotlib font files registered with Qt, by path.
+_qt_font_families = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _qfont(fname, weight, italic, point_size):
+    family = _qt_font_families.get(fname)
+    if family is None:
+        font_id = QtGui.QFontDatabase.addApplicationFont(fname)
+        families = (QtGui.QFontDatabase.applicationFontFamilies(font_id)
+                    if font_id >= 0 else [])
+        family = _qt_font_families[fname] = families[0] if families else ''
+    font = QtGui.QFont(family)
+    font.setWeight(QtGui.QFont.Weight(weight))
+    font.setItalic(italic)
+    font.setPointSizeF(point_size)
+    return font
+
+
+def _qpolygonf(xy):
+    """Return a QPolygonF of the (N, 2) float array *xy*."""
+    # Going through the QDataStream serialization of QPolygonF (a big endian
+    # count, then the coordinates) is much faster than point by point.
+    data = np.empty(4 + xy.size * 8, np.uint8)
+    data[:4].view('>u4')[0] = len(xy)
+    data[4:].view('>f8')[:] = xy.ravel()
+    poly = QtGui.QPolygonF()
+    QtCore.QDataStream(QtCore.QByteArray(data.tobytes())) >> poly
+    return poly
+
+
+def _qpainterpath(vertices, codes):
+    """Return a QPainterPath of matplotlib path *vertices* and *codes*."""
+    qpath = QtGui.QPainterPath()
+    qpath.setFillRule(Qt.FillRule.WindingFill)
+    vertices = vertices.tolist()
+    codes = codes.tolist()
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        if code == MplPath.MOVETO:
+            qpath.moveTo(*vertices[i])
+        elif code == MplPath.LINETO:
+            qpath.lineTo(*vertices[i])
+        elif code == MplPath.CURVE3:
+            qpath.quadTo(*vertices[i], *vertices[i + 1])
+            i += 1
+        elif code == MplPath.CURVE4:
+            qpath.cubicTo(*vertices[i], *vertices[i + 1], *vertices[i + 2])
+            i += 2
+        elif code == MplPath.CLOSEPOLY:
+            qpath.closeSubpath()
+        i += 1
+    return qpath
+
+
+class RendererQPainter(RendererBase):
+    """
+    Renderer drawing paths, markers, text and images straight with a
+    `QPainter`, without an Agg buffer in between.
+
+    It works in physical pixels, y down; the canvases below scale the painter
+    to their logical pixels.  Without *painter* it can only measure text, for
+    the layout done outside of a paint.  Hatches, sketches, gouraud shading
+    and TeX raise `_UnsupportedByQPainter`, the canvases render the frame
+    with Agg then.
+    """
+
+    # Qt strokes an antialiased polyline as a single shape, which gets very
+    # slow as long, self overlapping lines get longer: solid opaque ones are
+    # drawn in pieces of that many points.
+    polyline_chunk = 16
+
+    _caps = {'butt': Qt.PenCapStyle.FlatCap, 'round': Qt.PenCapStyle.RoundCap,
+             'projecting': Qt.PenCapStyle.SquareCap}
+    _joins = {'miter': Qt.PenJoinStyle.MiterJoin,
+              'round': Qt.PenJoinStyle.RoundJoin,
+              'bevel': Qt.PenJoinStyle.BevelJoin}
+
+    def __init__(self, width, height, dpi, painter=None):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.painter = painter
+        self._flip = Affine2D().scale(1, -1).translate(0, height)
+
+    def get_canvas_width_height(self):
+        # docstring inherited
+        return self.width, self.height
+
+    def points_to_pixels(self, points):
+        # docstring inherited
+        return points * self.dpi / 72
+
+    def _begin(self, gc):
+        """Save the painter state and set it up for *gc*."""
+        if gc.get_hatch() is not None:
+            raise _UnsupportedByQPainter('hatch')
+        if gc.get_sketch_params() is not None:
+            raise _UnsupportedByQPainter('sketch')
+        painter = self.painter
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing,
+                              bool(gc.get_antialiased()))
+        cliprect = gc.get_clip_rectangle()
+        if cliprect is not None:
+            # rounded like Agg does
+            x0, y0, x1, y1 = np.round(cliprect.extents)
+            painter.setClipRect(
+                QtCore.QRectF(x0, self.height - y1, x1 - x0, y1 - y0),
+                Qt.ClipOperation.IntersectClip)
+        clippath, clippath_trans = gc.get_clip_path()
+        if clippath is not None:
+            clippath = clippath.cleaned(clippath_trans + self._flip,
+                                        remove_nans=True, curves=True)
+            painter.setClipPath(
+                _qpainterpath(clippath.vertices, clippath.codes),
+                Qt.ClipOperation.IntersectClip)
+        return painter
+
+    def _pen(self, gc):
+        width = self.points_to_pixels(gc.get_linewidth())
+        if width <= 0:
+            # a 0 width QPen is a cosmetic 1 pixel one
+            return QtGui.QPen(Qt.PenStyle.NoPen)
+        pen = QtGui.QPen(QtGui.QColor.fromRgbF(*gc.get_rgb()), width)
+        pen.setCapStyle(self._caps[gc.get_capstyle()])
+        pen.setJoinStyle(self._joins[gc.get_joinstyle()])
+        offset, dashes = gc.get_dashes()
+        if dashes is not None and len(dashes):
+            # QPen dashes are in pen widths and need an even count
+            dashes = [self.points_to_pixels(d) / width for d in dashes]
+            pen.setDashPattern(dashes * (len(dashes) % 2 + 1))
+            pen.setDashOffset(self.points_to_pixels(offset) / width)
+        return pen
+
+    def _brush(self, gc, rgbFace):
+        if rgbFace is None:
+            return QtGui.QBrush(Qt.BrushStyle.NoBrush)
+        r, g, b = rgbFace[:3]
+        # like Agg, the gc alpha wins when forced
+        alpha = (gc.get_alpha() if gc.get_forced_alpha() or len(rgbFace) == 3
+                 else rgbFace[3])
+        return QtGui.QBrush(QtGui.QColor.fromRgbF(r, g, b, alpha))
+
+    def draw_path(self, gc, path, transform, rgbFace=None):
+        # docstring inherited
+        painter = self._begin(gc)
+        try:
+            stroke_only = rgbFace is None
+            path = path.cleaned(
+                transform + self._flip, remove_nans=True,
+                clip=(0, 0, self.width, self.height) if stroke_only else None,
+                simplify=path.should_simplify and stroke_only, curves=True)
+            # drop the trailing STOP
+            keep = path.codes != MplPath.STOP
+            vertices, codes = path.vertices[keep], path.codes[keep]
+            pen = self._pen(gc)
+            painter.setPen(pen)
+            painter.setBrush(self._brush(gc, rgbFace))
+            if stroke_only and np.all(codes <= MplPath.LINETO):
+                # polylines (lines plots), the fast way
+                # translucent pieces would blend twice where they join
+                chunk = (self.polyline_chunk
+                         if pen.style() == Qt.PenStyle.SolidLine
+                         and pen.color().alpha() == 255 else 0)
+                starts = np.flatnonzero(codes == MplPath.MOVETO)
+                for start, stop in zip(starts, [*starts[1:], len(codes)]):
+                    if stop - start < 2:
+                        continue
+                    poly = _qpolygonf(vertices[start:stop])
+                    if not chunk or stop - start <= chunk:
+                        painter.drawPolyline(poly)
+                        continue
+                    for i in range(0, stop - start - 1, chunk - 1):
+                        painter.drawPolyline(poly.mid(i, chunk))
+            else:
+                painter.drawPath(_qpainterpath(vertices, codes))
+        finally:
+            painter.restore()
+
+    def draw_markers(self, gc, marker_path, marker_trans, path, trans,
+                     rgbFace=None):
+        # docstring inherited
+        marker = marker_path.cleaned(marker_trans + Affine2D().scale(1, -1),
+                                     remove_nans=True, curves=True)
+        marker = _qpainterpath(marker.vertices, marker.codes)
+        points = self._flip.transform(trans.transform(path.vertices))
+        # skip the markers that can't be seen
+        extent = marker.boundingRect()
+        margin = (max(extent.width(), extent.height())
+                  + self.points_to_pixels(gc.get_linewidth()))
+        points = points[np.isfinite(points).all(axis=1)
+                        & (points[:, 0] > -margin)
+                        & (points[:, 0] < self.width + margin)
+                        & (points[:, 1] > -margin)
+                        & (points[:, 1] < self.height + margin)]
+        painter = self._begin(gc)
+        try:
+            painter.setPen(self._pen(gc))
+            painter.setBrush(self._brush(gc, rgbFace))
+            x0 = y0 = 0
+            for x, y in points.tolist():
+                painter.translate(x - x0, y - y0)
+                painter.drawPath(marker)
+                x0, y0 = x, y
+        finally:
+            painter.restore()
+
+    def draw_gouraud_triangles(self, gc, triangles_array, colors_array,
+                               transform):
+        # docstring inherited
+        raise _UnsupportedByQPainter('gouraud shading')
+
+    def draw_image(self, gc, x, y, im):
+        # docstring inherited
+        # The rows of *im* go bottom up, as for Agg, QImage's top down.
+        im = np.ascontiguousarray(im[::-1])
+        height, width = im.shape[:2]
+        image = QtGui.QImage(im, width, height, width * 4,
+                             QtGui.QImage.Format.Format_RGBA8888)
+        painter = self._begin(gc)
+        try:
+            painter.drawImage(
+                QtCore.QPointF(round(x), self.height - round(y) - height),
+                image)
+        finally:
+            painter.restore()
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        # docstring inherited
+        if ismath == 'TeX':
+            raise _UnsupportedByQPainter('usetex')
+        if ismath:
+            return self._draw_text_as_path(gc, x, y, s, prop, angle, ismath)
+        # The layout is done with matplotlib's own font metrics (see
+        # RendererBase.get_text_width_height_descent), draw with the same
+        # font file.  As flipy() is True, *y* is already top down.
+        weight = prop.get_weight()
+        weight = weight_dict.get(weight, weight)
+        weight = min(max(int(round(weight / 100)) * 100, 100), 900)
+        point_size = (self.points_to_pixels(prop.get_size_in_points()) * 72
+                      / self.painter.device().logicalDpiY())
+        font = _qfont(findfont(prop), weight, prop.get_style() != 'normal',
+                      point_size)
+        painter = self._begin(gc)
+        try:
+            painter.setPen(QtGui.QColor.fromRgbF(*gc.get_rgb()))
+            painter.setFont(font)
+            painter.translate(x, y)
+            if angle:
+                painter.rotate(-angle)
+            painter.drawText(QtCore.QPointF(0, 0), s)
+        finally:
+            painter.restore()
+
+
+class _QPainterCanvas:
+    """
+    Mixin for the canvases below, rendering the figure with a
+    `RendererQPainter` rather than Agg: there is no Agg buffer to fill and
+    convert, which pays off for line heavy real-time plots.  Frames of
+    figures using something it doesn't support are rendered with Agg
+    instead, ``fallback_frames`` counts them.
+
+    `draw` renders into a QImage kept until the next one, so that paints
+    (overlay updates, expose events...) only blit it.
+    """
+
+    supports_blit = False
+    frame_count = 0
+    fallback_frames = 0
+    _measure_renderer = None
+    _frame = None
+
+    def get_renderer(self):
+        # For the layout done outside of a paint (tight bboxes, text sizes).
+        w, h = self.figure.bbox.size
+        renderer = self._measure_renderer
+        if renderer is None or (renderer.width, renderer.height,
+                                renderer.dpi) != (w, h, self.figure.dpi):
+            renderer = self._measure_renderer = RendererQPainter(
+                w, h, self.figure.dpi)
+        return renderer
+
+    def draw(self):
+        """Render the figure into the frame image, and queue a repaint."""
+        if self._is_drawing:
+            return
+        with cbook._setattr_cm(self, _is_drawing=True):
+            self._render_frame()
+        self._update_frame()
+
+    def _render_frame(self):
+        """Render the figure into `_frame`, in physical pixels."""
+        w, h = self.figure.bbox.size
+        size = QtCore.QSize(max(int(np.ceil(w)), 1), max(int(np.ceil(h)), 1))
+        image = self._frame
+        if image is None or image.size() != size:
+            image = self._frame = QtGui.QImage(
+                size, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(image)
+        try:
+            self.figure.draw(
+                RendererQPainter(w, h, self.figure.dpi, painter))
+        except _UnsupportedByQPainter:
+            painter.setCompositionMode(
+                QtGui.QPainter.CompositionMode.CompositionMode_Source)
+            key = (w, h, self.figure.dpi)
+            renderer = _renderer_pool.acquire(key)
+            try:
+                renderer.clear()
+                self.figure.draw(renderer)
+                buf = renderer.buffer_rgba()
+                painter.drawImage(QtCore.QPointF(0, 0), QtGui.QImage(
+                    buf, int(renderer.width), int(renderer.height),
+                    int(renderer.width) * 4,
+                    QtGui.QImage.Format.Format_RGBA8888))
+            finally:
+                _renderer_pool.release(key, renderer)
+            self.fallback_frames += 1
+        finally:
+            painter.end()
+        self.frame_count += 1
+
+    def _paint_figure(self, painter):
+        """Paint the last frame with *painter*, in logical pixels."""
+        w, h = self.figure.bbox.size
+        image = self._frame
+        if image is None or (image.width(), image.height()) != (
+                max(int(np.ceil(w)), 1), max(int(np.ceil(h)), 1)):
+            # resized, and not drawn since
+            with cbook._setattr_cm(self, _is_drawing=True):
+                self._render_frame()
+            image = self._frame
+        ratio = self._render_ratio
+        painter.drawImage(
+            QtCore.QRectF(0, 0, image.width() / ratio, image.height() / ratio),
+            image)
+
+
+class FigureCanvasQtQuickQPainter(_QPainterCanvas, FigureCanvasQtQuick):
+    """FigureCanvasQtQuick rendering with a QPainter rather than Agg."""
+
+    def paint(self, p):
+        self._draw_idle()  # Only does something if a draw is pending.
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        self._paint_figure(p)
+
+
+class FigureCanvasQTQPainter(_QPainterCanvas, FigureCanvasQT):
+    """FigureCanvasQT rendering with a QPainter rather than Agg."""
+
+    def paintEvent(self, event):
+        self._draw_idle()  # Only does something if a draw is pending.
+        painter = QtGui.QPainter(self)
+        try:
+            painter.setClipRect(event.rect())
+            self._paint_figure(painter)
+            self._paint_overlays(painter)
+        finally:
+            painter.end()
 
 
 # The first one is a standard name; The second not so
 FigureCanvas = FigureCanvasQtQuickAgg
 
 
+class _SortedIndex:
+    """
+    Nearest point lookup for series monotonic in display x (time series and
+    the like): a binary search, snapping on x.
+    """
+
+    def __init__(self, xy, valid):
+        index = np.flatnonzero(valid)
+        x = xy[index, 0]
+        if len(x) > 1 and x[0] > x[-1]:
+            index, x = index[::-1], x[::-1]
+        self._index = index
+        self._x = x
+
+    def nearest(self, x, y):
+        if not len(self._x):
+            return None
+        i = np.searchsorted(self._x, x)
+        if i == len(self._x) or (i > 0 and x - self._x[i - 1] < self._x[i] - x):
+            i -= 1
+        return self._index[i], abs(self._x[i] - x)
+
+
+class _GridIndex:
+    """
+    Nearest point lookup for scattered points: the display space is binned in
+    *cell* sized squares, and only the 3x3 cells around the query are
+    searched.  Only the points within a cell of *bounds* (the axes bbox) are
+    indexed, the others can't be near a query in the axes; that also keeps
+    the cell keys small, whatever the zoom.
+    """
+
+    def __init__(self, xy, valid, cell, bounds):
+        self._cell = cell
+        (x0, y0), (x1, y1) = bounds.padded(cell).get_points()
+        with np.errstate(invalid='ignore'):
+            valid = (valid & (xy[:, 0] >= x0) & (xy[:, 0] <= x1)
+                     & (xy[:, 1] >= y0) & (xy[:, 1] <= y1))
+        index = np.flatnonzero(valid)
+        points = xy[index]
+        if not len(points):
+            self._keys = np.empty(0, np.int64)
+            return
+        cells = np.floor(points / cell).astype(np.int64)
+        self._origin = cells.min(axis=0)
+        cells -= self._origin
+        self._shape = cells.max(axis=0) + 1
+        keys = cells[:, 0] * self._shape[1] + cells[:, 1]
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._points = points[order]
+        self._index = index[order]
+
+    def nearest(self, x, y):
+        if not len(self._keys):
+            return None
+        nx, ny = self._shape
+        # clipped to just outside the grid, queries far away miss it all
+        cx, cy = np.clip(np.floor(np.array([x, y]) / self._cell)
+                         - self._origin, -2, (nx + 1, ny + 1)).astype(np.int64)
+        y0, y1 = max(cy - 1, 0), min(cy + 1, ny - 1)
+        if y0 > y1:
+            return None
+        # The cells y0..y1 of a column are contiguous in the sorted keys.
+        spans = [np.searchsorted(self._keys, (col * ny + y0, col * ny + y1 + 1))
+                 for col in range(max(cx - 1, 0), min(cx + 1, nx - 1) + 1)]
+        candidates = np.concatenate(
+            [np.arange(start, stop) for start, stop in spans] or [[]]
+        ).astype(np.intp)
+        if not len(candidates):
+            return None
+        d = np.hypot(*(self._points[candidates] - (x, y)).T)
+        i = np.argmin(d)
+        return self._index[candidates[i]], d[i]
+
+
+class HoverQuery(QtCore.QObject):
+    """
+    Nearest data point of each series under the cursor, for hover tooltips.
+
+    Display space indexes of the lines and scatter collections of the axes
+    are (re)built only when their data or the view changes, so that each
+    motion event is answered with a binary search (monotonic x data) or a
+    grid lookup (scattered data) instead of an argmin over all the points.
+    The hits within *max_distance* pixels are in `results`, and published as
+    text through the ``nearest`` property.  With *mark*, the nearest hit is
+    circled in the canvas overlay.
+    """
+
+    nearestChanged = QtCore.Signal(str)
+
+    def __init__(self, canvas, max_distance=20, mark=False, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.max_distance = max_distance
+        self.mark = mark
+        self.results = []
+        self._nearest = ""
+        self._indexes = weakref.WeakKeyDictionary()
+        # the data is checked for changes once per frame drawn
+        self._frame = 0
+        canvas.mpl_connect('draw_event', self._on_draw)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('figure_leave_event', self._on_leave)
+
+    def getNearest(self):
+        return self._nearest
+
+    def setNearest(self, nearest):
+        if nearest != self._nearest:
+            self._nearest = nearest
+            self.nearestChanged.emit(nearest)
+
+    nearest = QtCore.Property(str, getNearest, setNearest,
+                              notify=nearestChanged)
+
+    def _index(self, artist):
+        """Return (data, display index) for *artist*, rebuilt if stale."""
+        ax = artist.axes
+        if isinstance(artist, Line2D):
+            source = (artist.get_xdata(), artist.get_ydata())
+            transform = artist.get_transform()
+        elif isinstance(artist, PathCollection):
+            source = (artist.get_offsets(),)
+            transform = artist.get_offset_transform()
+        else:
+            return None
+        view = (ax.viewLim.bounds, ax.bbox.bounds,
+                ax.get_xscale(), ax.get_yscale())
+        cached = self._indexes.get(artist)
+        if (cached is not None and cached[2] == view
+                and all(a is b for a, b in zip(cached[3], source))):
+            if cached[5] == self._frame:
+                return cached[:2]
+            # the arrays may have been changed in place since
+            data = self._data(artist, source)
+            if zlib.crc32(data) == cached[4]:
+                cached[5] = self._frame
+                return cached[:2]
+        else:
+            data = self._data(artist, source)
+        xy = transform.transform(data)
+        valid = np.isfinite(xy).all(axis=1)
+        x = xy[valid, 0]
+        dx = np.diff(x)
+        if isinstance(artist, Line2D) and ((dx >= 0).all() or (dx <= 0).all()):
+            index = _SortedIndex(xy, valid)
+        else:
+            index = _GridIndex(xy, valid, self.max_distance, ax.bbox)
+        self._indexes[artist] = [data, index, view, source, zlib.crc32(data),
+                                 self._frame]
+        return data, index
+
+    @staticmethod
+    def _data(artist, source):
+        if isinstance(artist, Line2D):
+            data = artist.get_xydata()
+        else:
+            data = np.ma.filled(np.ma.asarray(source[0], float), np.nan)
+        return np.ascontiguousarray(data, float)
+
+    def _on_draw(self, event):
+        self._frame += 1
+
+    def query(self, x, y, ax=None):
+        """
+        Return the (artist, index, (xdata, ydata), distance) of the nearest
+        point of each series of *ax* (by default the axes under the display
+        coordinates *x*, *y*), closest first.
+        """
+        if ax is None:
+            ax = self.canvas.inaxes((x, y))
+        if ax is None:
+            return []
+        results = []
+        for artist in [*ax.lines, *ax.collections]:
+            if not artist.get_visible():
+                continue
+            found = self._index(artist)
+            if found is None:
+                continue
+            data, index = found
+            hit = index.nearest(x, y)
+            if hit is not None and hit[1] <= self.max_distance:
+                i, distance = hit
+                results.append((artist, i, tuple(data[i]), distance))
+        results.sort(key=lambda result: result[3])
+        return results
+
+    def _on_motion(self, event):
+        self.results = self.query(event.x, event.y, event.inaxes)
+        self.nearest = "\n".join(
+            f"{artist.get_label()}[{i}]: ({x:.4g}, {y:.4g})"
+            for artist, i, (x, y), _ in self.results)
+        if self.mark and hasattr(self.canvas, 'set_hover_marker'):
+            if self.results:
+                artist, i, _, _ = self.results[0]
+                data, _ = self._indexes[artist][:2]
+                self.canvas.set_hover_marker(
+                    self._display_xy(artist, data[i]))
+            else:
+                self.canvas.set_hover_marker(None)
+
+    @staticmethod
+    def _display_xy(artist, xy):
+        if isinstance(artist, PathCollection):
+            return artist.get_offset_transform().transform(xy)
+        return artist.get_transform().transform(xy)
+
+    def _on_leave(self, event):
+        self.results = []
+        self.nearest = ""
+        if self.mark and hasattr(self.canvas, 'set_hover_marker'):
+            self.canvas.set_hover_marker(None)
+
+
+class AxesLinkGroup:
+    """
+    Shares the x (and/or y) view limits of axes across canvases: a pan or
+    zoom of any of them, from the toolbar or code, is applied once to all
+    the others, and all the canvases affected are redrawn together in one
+    batch, on the next event loop iteration.
+
+    The limit changes the group makes itself don't propagate back, so
+    linked axes don't ping-pong; draws the canvases had pending are folded
+    in the batch.  ``batches`` counts the batches, ``draws`` the canvas
+    draws.
+    """
+
+    def __init__(self, axes=(), x=True, y=False):
+        self._events = [name for name, on in [('xlim_changed', x),
+                                              ('ylim_changed', y)] if on]
+        self._cids = {}
+        self._propagating = False
+        self._pending = []
+        self.batches = 0
+        self.draws = 0
+        for ax in axes:
+            self.add(ax)
+
+    @property
+    def axes(self):
+        """The linked axes."""
+        return list(self._cids)
+
+    def add(self, ax):
+        """Link *ax*, setting its limits to the group's ones."""
+        if ax in self._cids:
+            return
+        if self._cids:
+            self._sync(next(iter(self._cids)), [ax])
+
+        # Not the bound method, which the callback registry only holds
+        # weakly: the group links as long as its axes live.
+        def changed(ax):
+            self._changed(ax)
+        self._cids[ax] = [ax.callbacks.connect(event, changed)
+                          for event in self._events]
+
+    def remove(self, ax):
+        """Unlink *ax*."""
+        for cid in self._cids.pop(ax, []):
+            ax.callbacks.disconnect(cid)
+
+    def _changed(self, ax):
+        if self._propagating:
+            # one of our own changes
+            return
+        self._sync(ax, [other for other in self._cids if other is not ax])
+        self._schedule(ax.figure.canvas)
+
+    def _sync(self, source, targets):
+        """Apply the limits of *source* to *targets*."""
+        limits = [(event, getattr(source, 'get_' + event[0] + 'lim')())
+                  for event in self._events]
+        self._propagating = True
+        try:
+            for ax in targets:
+                changed = False
+                for event, lims in limits:
+                    getter = getattr(ax, 'get_' + event[0] + 'lim')
+                    if tuple(getter()) != tuple(lims):
+                        # emitted, for the axes shared with *ax*
+                        getattr(ax, 'set_' + event[0] + 'lim')(lims, auto=None)
+                        changed = True
+                if changed:
+                    self._schedule(ax.figure.canvas)
+        finally:
+            self._propagating = False
+
+    def _schedule(self, canvas):
+        if not self._pending:
+            QtCore.QTimer.singleShot(0, self._flush)
+        if canvas not in self._pending:
+            self._pending.append(canvas)
+
+    def _flush(self):
+        canvases, self._pending = self._pending, []
+        self.batches += 1
+        for canvas in canvases:
+            self.draws += 1
+            # folded with the draw_idle the toolbar queued, if any
+            canvas.draw_idle()
+
+
+class MultiLineSeries:
+    """
+    Many series (channels) drawn as a single `LineCollection`, for views of
+    thousands of channels where one Line2D each makes the artist traversal
+    the bottleneck.
+
+    All the channels live in one contiguous (nseries, npoints, 2) array,
+    the paths of the collection are views of it: updates are vectorized
+    writes into it, and don't create any Python object per channel.  *x* is
+    shared, shape (npoints,), or per channel, (nseries, npoints); *y* is
+    (nseries, npoints).  *offsets* shift the channels vertically (stacked
+    traces).  *colors* is a color or one per channel; or give *values*, one
+    per channel, to color them through the *cmap*/*norm* of the collection.
+    The other keyword arguments go to the `LineCollection`.
+
+    Like for any artist, the canvas has to be redrawn after changes.
+    """
+
+    def __init__(self, ax, x, y, offsets=None, colors=None, values=None,
+                 **kwargs):
+        y = np.asarray(y, float)
+        nseries, npoints = y.shape
+        self.axes = ax
+        self._offsets = np.zeros(nseries)
+        if offsets is not None:
+            self._offsets[:] = offsets
+        self._segments = np.empty((nseries, npoints, 2))
+        self._segments[..., 0] = x
+        self._segments[..., 1] = y + self._offsets[:, None]
+        self._visible = np.ones(nseries, bool)
+        self._colors = None
+        self._values = None
+        self.collection = LineCollection(self._segments, **kwargs)
+        # The paths LineCollection made are views of self._segments, the
+        # hidden channels are left out of its list of paths.  Should they be
+        # copies, the updates give the collection its segments again.
+        self._paths = list(self.collection.get_paths())
+        self._views = all(np.shares_memory(path.vertices, segment)
+                          for path, segment in zip(self._paths,
+                                                   self._segments))
+        if values is not None:
+            self.set_values(values)
+        else:
+            self.set_colors(colors if colors is not None
+                            else ax._get_lines.get_next_color())
+        ax.add_collection(self.collection)
+        ax.autoscale_view()
+
+    def __len__(self):
+        return len(self._segments)
+
+    def get_data(self):
+        """Return the (nseries, npoints) y values, without the offsets."""
+        return self._segments[..., 1] - self._offsets[:, None]
+
+    def set_data(self, y, channels=slice(None)):
+        """Set the y values of *channels* (all of them by default)."""
+        self._segments[channels, :, 1] = (
+            np.asarray(y, float) + self._offsets[channels, None])
+        self._changed()
+
+    def set_xdata(self, x):
+        """Set the x values, shared (npoints,) or per channel."""
+        self._segments[..., 0] = x
+        self._changed()
+
+    def set_offsets(self, offsets):
+        """Set the vertical offset of each channel (or of all of them)."""
+        offsets = np.broadcast_to(np.asarray(offsets, float),
+                                  self._offsets.shape)
+        self._segments[..., 1] += (offsets - self._offsets)[:, None]
+        self._offsets[:] = offsets
+        self._changed()
+
+    def set_colors(self, colors):
+        """Set a color for all the channels, or one per channel."""
+        self._values = None
+        self.collection.set_array(None)
+        self._colors = mcolors.to_rgba_array(colors)
+        self._update_visible()
+
+    def set_values(self, values):
+        """Color the channels by *values* through the colormap."""
+        self._colors = None
+        self._values = np.asarray(values, float)
+        self._update_visible()
+
+    def set_visible(self, channels, visible=True):
+        """Show or hide *channels* (an index, indices, a slice or a mask)."""
+        self._visible[channels] = visible
+        self._update_visible()
+
+    def get_visible(self):
+        """Return the visibility of each channel."""
+        return self._visible.copy()
+
+    def _update_visible(self):
+        index = (slice(None) if self._visible.all()
+                 else np.flatnonzero(self._visible))
+        if self._views:
+            paths = self.collection.get_paths()
+            paths[:] = (self._paths if isinstance(index, slice)
+                        else [self._paths[i] for i in index])
+        if self._values is not None:
+            self.collection.set_array(self._values[index])
+        elif len(self._colors) > 1:
+            self.collection.set_color(self._colors[index])
+        else:
+            self.collection.set_color(self._colors)
+        self._changed()
+
+    def _changed(self):
+        if not self._views:
+            self.collection.set_segments(self._segments[self._visible])
+        self.collection.stale = True
+
+    def autoscale(self):
+        """Grow the data limits of the axes to the channels, and rescale."""
+        points = self._segments[self._visible].reshape(-1, 2)
+        points = points[np.isfinite(points).all(axis=1)]
+        if len(points):
+            self.axes.update_datalim([points.min(axis=0),
+                                      points.max(axis=0)])
+        self.axes.autoscale_view()
+
+    def remove(self):
+        self.collection.remove()
+
+
+class DensityScatter(AxesImage):
+    """
+    Scatter plot of millions of points, drawn as the colormapped count of
+    points per pixel of the current view.
+
+    Each draw bins the points of the view into a 2D histogram of the pixel
+    size of the axes with `numpy.bincount`, so it scales with the number of
+    points, not with the cost of drawing markers; pixels without points are
+    transparent.  The histograms of the last *cache_size* views are kept, so
+    that going back and forth in the navigation history is instant.  Unless
+    a *norm* with limits is given, the colormap spans the counts of the view.
+    """
+
+    def __init__(self, ax, x, y, cmap=None, norm=None, cache_size=16,
+                 **kwargs):
+        super().__init__(ax, cmap=cmap, norm=norm, origin='lower',
+                         interpolation='nearest', **kwargs)
+        self._autoscale_norm = (self.norm.vmin is None
+                                and self.norm.vmax is None)
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._view = (0, 1, 0, 1)
+        # replaced by the histogram of the view at each draw
+        self.set_data(np.ma.masked_all((1, 1)))
+        self.set_points(x, y)
+        ax.add_image(self)
+        ax.autoscale_view()
+
+    def set_points(self, x, y):
+        """Set the coordinates of the points."""
+        x = np.asarray(x, float).ravel()
+        y = np.asarray(y, float).ravel()
+        finite = np.isfinite(x) & np.isfinite(y)
+        self._x = x[finite]
+        self._y = y[finite]
+        self._cache.clear()
+        if len(self._x):
+            self.axes.update_datalim([(self._x.min(), self._y.min()),
+                                      (self._x.max(), self._y.max())])
+        self.stale = True
+
+    def get_extent(self):
+        # the data extent, for the data limits; draws use the view extent
+        if not len(self._x):
+            return (0, 1, 0, 1)
+        return (self._x.min(), self._x.max(), self._y.min(), self._y.max())
+
+    def get_window_extent(self, renderer=None):
+        # docstring inherited
+        # drawn over the view, so over the axes
+        return self.axes.bbox.frozen()
+
+    def _histogram(self, width, height):
+        """Return the (height, width) point counts of the view."""
+        ax = self.axes
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        key = (x0, x1, y0, y1, width, height,
+               ax.get_xscale(), ax.get_yscale())
+        counts = self._cache.get(key)
+        if counts is not None:
+            self._cache.move_to_end(key)
+            return counts
+        # bin in scaled coordinates, for log axes and the like
+        scale_x = ax.xaxis.get_transform()
+        scale_y = ax.yaxis.get_transform()
+        x = scale_x.transform(self._x) if ax.get_xscale() != 'linear' else self._x
+        y = scale_y.transform(self._y) if ax.get_yscale() != 'linear' else self._y
+        (x0, y0), (x1, y1) = ax.transScale.transform([(x0, y0), (x1, y1)])
+        ix = np.floor((x - x0) * (width / (x1 - x0))).astype(np.intp)
+        iy = np.floor((y - y0) * (height / (y1 - y0))).astype(np.intp)
+        inside = (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height)
+        counts = np.bincount(iy[inside] * width + ix[inside],
+                             minlength=width * height).reshape(height, width)
+        self._cache[key] = counts
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return counts
+
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        # docstring inherited
+        ax = self.axes
+        width = max(int(np.ceil(ax.bbox.width * magnification)), 1)
+        height = max(int(np.ceil(ax.bbox.height * magnification)), 1)
+        counts = self._histogram(width, height)
+        self.set_data(np.ma.masked_equal(counts, 0))
+        if self._autoscale_norm and counts.any():
+            self.norm.autoscale(self._A)
+        # same as AxesImage.make_image, over the view rather than the extent
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        self._view = (x0, x1, y0, y1)
+        bbox = Bbox([[x0, y0], [x1, y1]])
+        transformed_bbox = TransformedBbox(bbox, self.get_transform())
+        clip = ((self.get_clip_box() or ax.bbox) if self.get_clip_on()
+                else self.figure.bbox)
+        return self._make_image(self._A, bbox, transformed_bbox, clip,
+                                magnification, unsampled=unsampled)
+
+    def get_cursor_data(self, event):
+        # docstring inherited
+        x0, x1, y0, y1 = self._view
+        if self._A is None or not (x0 <= event.xdata <= x1
+                                   and y0 <= event.ydata <= y1):
+            return None
+        # pixels of the axes, as the histogram is
+        x, y = self.axes.transAxes.inverted().transform((event.x, event.y))
+        height, width = self._A.shape
+        i = min(int(y * height), height - 1)
+        j = min(int(x * width), width - 1)
+        count = self._A[i, j]
+        return 0 if count is np.ma.masked else count
+
+
+class FastImage(AxesImage):
+    """
+    Image artist for streaming frames (camera feeds, live heatmaps) that
+    bypasses Agg: `set_data` colormaps the frame through a 256 entry lookup
+    table, premultiplied ARGB32 like Qt paints fastest, straight into a
+    reused buffer, and the canvas paints it over its frame as an overlay.
+    Agg only renders the rest of the figure (axes, ticks, colorbar) when
+    that changes; a new frame doesn't trigger any render.
+
+    2D frames are colormapped, (h, w, 3) or (h, w, 4) uint8 frames are
+    copied as is.  The image is painted nearest neighbour over its extent,
+    clipped to the axes, above the other artists of the axes.  Without
+    *vmin*/*vmax* (or a norm with limits), the color scale is set from the
+    first frame.  Saved figures render it the regular way.
+    """
+
+    def __init__(self, ax, data, extent=None, cmap=None, norm=None,
+                 vmin=None, vmax=None, origin='upper', **kwargs):
+        super().__init__(ax, cmap=cmap, norm=norm, extent=extent,
+                         origin=origin, interpolation='nearest', **kwargs)
+        self.set_clim(vmin, vmax)
+        self._lut = None
+        self._index = None
+        self._argb = None
+        self._qimage = None
+        self._placement = None
+        self._overlay = f'fast_image@{id(self):#x}'
+        AxesImage.set_data(self, data)
+        if self._A.ndim == 2 and np.isfinite(self._A).any():
+            self.norm.autoscale_None(cbook.safe_masked_invalid(self._A))
+        ax.add_image(self)
+        # like imshow, for the data limits and the sticky edges
+        self.set_extent(self.get_extent())
+        self._colormap()
+
+    def set_data(self, A):
+        """
+        Show the frame *A*: colormapped into the paint buffer, then only the
+        canvas overlay is repainted.
+        """
+        # masked values are painted with the colormap's "bad" color
+        A = A if np.ma.isMaskedArray(A) else np.asarray(A)
+        if self._A is None or A.shape != self._A.shape:
+            self._A = A
+            self._imcache = None
+            # the image size may change the extent, let Agg redraw
+            self.stale = True
+        else:
+            self._A = A
+            self._imcache = None
+        self._colormap()
+        canvas = self.figure.canvas if self.figure is not None else None
+        if self._placement is not None and hasattr(canvas, '_update_overlay'):
+            canvas._update_overlay()
+
+    def changed(self):
+        # the colormap, norm or clim changed
+        self._lut = None
+        super().changed()
+        if getattr(self, '_argb', None) is not None:
+            self._colormap()
+
+    def _colormap(self):
+        """Write the current frame into the paint buffer."""
+        A = self._A
+        height, width = A.shape[:2]
+        argb = self._argb
+        if argb is None or argb.shape[:2] != (height, width):
+            argb = self._argb = np.empty((height, width, 4), np.uint8)
+            self._qimage = QtGui.QImage(
+                argb, width, height, width * 4,
+                QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+            self._index = None
+        if A.ndim == 3:
+            if A.shape[2] == 3:
+                A = np.dstack([A, np.full((height, width), 255, np.uint8)])
+            _rgba_to_premultiplied_argb32(A.astype(np.uint8, copy=False), argb)
+            return
+        if self._index is None or self._index.shape != A.shape:
+            self._index = np.empty(A.shape, np.float32)
+        self._map(A, argb, self._index)
+
+    def _map(self, A, out, index):
+        """
+        Colormap the 2D values *A* into *out*, through the lookup table;
+        *index* is float32 scratch space of the shape of *A*.
+        """
+        if self._lut is None:
+            lut = self.cmap(np.linspace(0, 1, 256), alpha=self.get_alpha(),
+                            bytes=True)
+            self._lut = _rgba_to_premultiplied_argb32(lut, np.empty_like(lut))
+            bad = np.array([self.cmap(np.nan, alpha=self.get_alpha(),
+                                      bytes=True)], np.uint8)
+            self._bad = _rgba_to_premultiplied_argb32(bad, np.empty_like(bad))[0]
+        norm = self.norm
+        if not norm.scaled():
+            # no values yet to scale the colors on
+            out[...] = self._bad
+            return
+        mask = np.ma.getmask(A)
+        if (A.dtype == np.uint8 and type(norm) is mcolors.Normalize
+                and (norm.vmin, norm.vmax) == (0, 255)
+                and mask is np.ma.nomask):
+            np.take(self._lut, A, axis=0, out=out)
+            return
+        if type(norm) is mcolors.Normalize:
+            # Normalize, without its masked array overhead
+            vmin, vmax = norm.vmin, norm.vmax
+            scale = 255.999 / (vmax - vmin) if vmax > vmin else 0
+            np.subtract(np.ma.getdata(A), vmin, out=index, casting='unsafe')
+            np.multiply(index, scale, out=index)
+        else:
+            np.multiply(norm(A).filled(np.nan), 255.999, out=index,
+                        casting='unsafe')
+        bad = np.isnan(index)
+        if mask is not np.ma.nomask:
+            bad |= mask
+        has_bad = bad.any()
+        if has_bad:
+            index[bad] = 0
+        np.clip(index, 0, 255, out=index)
+        np.take(self._lut, index.astype(np.uint8), axis=0, out=out)
+        if has_bad:
+            out[bad] = self._bad
+
+    def draw(self, renderer):
+        # docstring inherited
+        canvas = self.figure.canvas
+        if not hasattr(canvas, 'set_overlay') or canvas.is_saving():
+            if self._A.ndim == 2 and not np.ma.isMaskedArray(self._A):
+                # set_data skips the masking that Agg resampling expects
+                self._A = cbook.safe_masked_invalid(self._A, copy=True)
+            return super().draw(renderer)
+        # Agg doesn't draw the image, only its placement is updated.
+        self._placement = None
+        if self.get_visible():
+            x0, x1, y0, y1 = self.get_extent()
+            if self.origin == 'upper':
+                # the first row goes at the "top" of the extent
+                y0, y1 = y1, y0
+            trans = self.get_transform()
+            corners = [canvas._to_logical(*trans.transform(xy))
+                       for xy in [(x0, y0), (x1, y1)]]
+            clip = self.axes.bbox if self.get_clip_on() else self.figure.bbox
+            (cx0, cy0), (cx1, cy1) = [canvas._to_logical(x, y)
+                                      for x, y in clip.get_points()]
+            self._placement = (corners, QtCore.QRectF(
+                QtCore.QPointF(cx0, cy0), QtCore.QPointF(cx1, cy1)).normalized())
+        canvas.set_overlay(self._overlay, self._paint)
+        self.stale = False
+
+    def remove(self):
+        canvas = self.figure.canvas
+        super().remove()
+        if hasattr(canvas, 'remove_overlay'):
+            canvas.remove_overlay(self._overlay)
+
+    def __getstate__(self):
+        # the Qt paint buffer doesn't pickle, copies render through Agg
+        return {**super().__getstate__(), '_qimage': None, '_argb': None,
+                '_placement': None}
+
+    def _paint(self, painter):
+        if self._placement is None or self._qimage is None:
+            return
+        (x0, y0), (x1, y1) = self._placement[0]
+        painter.setClipRect(self._placement[1])
+        # mirror as needed, for inverted axes and origin
+        painter.translate(x0, y0)
+        painter.scale(1 if x1 >= x0 else -1, 1 if y1 >= y0 else -1)
+        self._paint_image(painter, abs(x1 - x0), abs(y1 - y0))
+
+    def _paint_image(self, painter, width, height):
+        """Paint the buffer, first row at the top, over *width* x *height*."""
+        painter.drawImage(QtCore.QRectF(0, 0, width, height), self._qimage)
+
+
+class Waterfall(FastImage):
+    """
+    Scrolling waterfall (spectrogram) of *rows* rows of *bins* values, like
+    a `FastImage` kept in a circular buffer: `append` colormaps and writes
+    only the new rows, and the buffer is painted in its two wrapped slices,
+    so that a new row costs neither a render nor a shift of the history.
+
+    With the default *origin* 'lower' the newest row is at the top of the
+    *extent* and older rows move down; 'upper' scrolls the other way.  Rows
+    not appended yet are painted with the colormap's "bad" color.  Without
+    *vmin*/*vmax* the color scale is set from the first row.
+    """
+
+    def __init__(self, ax, rows, bins, extent=None, cmap=None, norm=None,
+                 vmin=None, vmax=None, origin='lower', **kwargs):
+        self._head = 0
+        super().__init__(ax, np.full((rows, bins), np.nan, np.float32),
+                         extent=extent, cmap=cmap, norm=norm, vmin=vmin,
+                         vmax=vmax, origin=origin, **kwargs)
+        # a colorbar may scale the norm on the empty history meanwhile
+        self._scale_pending = not self.norm.scaled()
+
+    def append(self, values):
+        """Append one row, or an (n, bins) array of rows, oldest first."""
+        values = np.atleast_2d(np.asarray(values))
+        ring = self._A
+        if values.shape[1:] != ring.shape[1:]:
+            raise ValueError(f'expected rows of {ring.shape[1]} values, '
+                             f'got {values.shape[1:]}')
+        values = values[-len(ring):]
+        if self._scale_pending and np.isfinite(values).any():
+            self._scale_pending = False
+            # calls changed(), which maps the whole history once
+            self.norm.autoscale(cbook.safe_masked_invalid(values))
+        rows = (self._head + np.arange(len(values))) % len(ring)
+        ring[rows] = values
+        argb = np.empty(values.shape + (4,), np.uint8)
+        self._map(ring[rows], argb, np.empty(values.shape, np.float32))
+        self._argb[rows] = argb
+        self._head = (self._head + len(values)) % len(ring)
+        canvas = self.figure.canvas if self.figure is not None else None
+        if self._placement is not None and hasattr(canvas, '_update_overlay'):
+            canvas._update_overlay()
+
+    def set_data(self, A):
+        """Replace the whole history by the (rows, bins) array *A*, oldest first."""
+        self._head = 0
+        super().set_data(np.array(A, np.float32))
+
+    def get_array(self):
+        # the history oldest first, not in buffer order
+        return np.roll(self._A, -self._head, axis=0)
+
+    def draw(self, renderer):
+        # docstring inherited
+        canvas = self.figure.canvas
+        if hasattr(canvas, 'set_overlay') and not canvas.is_saving():
+            return super().draw(renderer)
+        ring = self._A
+        self._A = self.get_array()
+        try:
+            return super().draw(renderer)
+        finally:
+            self._A = ring
+
+    def _paint_image(self, painter, width, height):
+        # the oldest rows from the head, then the newest ones from the start
+        rows, bins = self._A.shape
+        head = self._head
+        split = height * (rows - head) / rows
+        painter.drawImage(QtCore.QRectF(0, 0, width, split), self._qimage,
+                          QtCore.QRectF(0, head, bins, rows - head))
+        if head:
+            painter.drawImage(
+                QtCore.QRectF(0, split, width, height - split), self._qimage,
+                QtCore.QRectF(0, 0, bins, head))
+
+
 class DemoViewModel(QtCore.QObject):
     """ A bridge class to interact with the plot in python
     """
@@ -1370,19 +4700,20 @@ class DemoViewModel(QtCore.QObject):
             self.axes = canvas.figure.subplots()
             t = np.linspace(0, 10, 101)
             # Set up a Line2D.
-            self._line, = self.axes.plot(t, np.sin(t + time.time()))
+            self._line, = self.axes.plot(t, np.sin(t))
             self._timer = canvas.new_timer(50)
-            self._timer.add_callback(self._update_canvas)
+            self._timer.add_callback(self._update_canvas, self._timer.clock)
             self._timer.start()
-        # connect for displaying the coordinates
+        # connect for displaying the coordinates, snapped to the nearest point
+        self.hover = HoverQuery(canvas, mark=True, parent=self)
         self.figure.canvas.mpl_connect('motion_notify_event', self.on_motion)
 
-    def _update_canvas(self):
+    def _update_canvas(self, clock):
         if self.pause :
             return
         t = np.linspace(0, 10, 101)
-        # Shift the sinusoid as a function of time.
-        self._line.set_data(t, np.sin(t + time.time()))
+        # Shift the sinusoid as a function of the frame time.
+        self._line.set_data(t, np.sin(t + clock.time))
         self._line.figure.canvas.draw()
 
     def update_toolbar(self, canvas):
@@ -1436,7 +4767,11 @@ class DemoViewModel(QtCore.QObject):
         Update the coordinates on the display
         """
         if event.inaxes == self.axes:
-            self.coordinates = f"({event.xdata:.2f}, {event.ydata:.2f})"
+            if self.hover.results:
+                _, _, (x, y), _ = self.hover.results[0]
+                self.coordinates = f"({x:.2f}, {y:.2f})"
+            else:
+                self.coordinates = f"({event.xdata:.2f}, {event.ydata:.2f})"
 
 def myMessageOutput(type:QtMsgType, context:QMessageLogContext, msg:str):
     logging.info(rf'====> {msg}')
@@ -1461,6 +4796,7 @@ if __name__ == "__main__":
 
     # matplotlib stuff
     PySide6.QtQml.qmlRegisterType(FigureCanvasQtQuickAgg, "Backend", 1, 0, "FigureCanvas")
+    PySide6.QtQml.qmlRegisterType(FigureMirrorQtQuick, "Backend", 1, 0, "FigureMirror")
 
     # Load the QML file
     qmlFile = Path(Path.cwd(), Path(__file__).parent, "demoview.qml")
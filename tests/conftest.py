@@ -0,0 +1,27 @@
+"""The tests run offscreen, against the package in src."""
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+import pytest
+from PySide6 import QtWidgets
+from matplotlib.figure import Figure
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def canvas(qapp):
+    """A FigureCanvasQTAgg with one axes, drawn once."""
+    from matplotlibqml.matplotlibqml import FigureCanvasQTAgg
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    canvas.figure.subplots().plot([1, 3, 2])
+    canvas.draw()
+    yield canvas
+    canvas.deleteLater()
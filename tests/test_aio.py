@@ -0,0 +1,59 @@
+import asyncio
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.aio import CanvasFeed, run
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg
+
+
+def _settle(qapp):
+    for _ in range(3):
+        qapp.processEvents()
+
+
+def _canvas():
+    canvas = FigureCanvasQTAgg(Figure())
+    line, = canvas.figure.subplots().plot([1, 3, 2])
+    canvas.draw()
+    return canvas, line
+
+
+def test_pushes_coalesce_into_one_draw(qapp):
+    canvas, line = _canvas()
+    _settle(qapp)
+    updates = []
+    feed = CanvasFeed(canvas, updates.append,
+                      merge=lambda old, new: np.concatenate([old, new]))
+    idle_draws = []
+    draw_idle = canvas.draw_idle
+    canvas.draw_idle = lambda: (idle_draws.append(1), draw_idle())
+    frames = canvas.frame_count
+    for i in range(5):
+        feed.push(np.array([i]))
+    assert updates == []
+    _settle(qapp)
+    assert [list(values) for values in updates] == [[0, 1, 2, 3, 4]]
+    assert len(idle_draws) == 1
+    assert canvas.frame_count == frames + 1
+    assert feed.stats() == {'pushes': 5, 'updates': 1, 'draws': 1}
+    feed.close()
+    canvas.deleteLater()
+
+
+def test_put_waits_for_the_frame(qapp):
+    canvas, line = _canvas()
+    events = []
+    feed = CanvasFeed(canvas, lambda y: (events.append('update'),
+                                         line.set_ydata(y)))
+    canvas.mpl_connect('draw_event', lambda event: events.append('drawn'))
+
+    async def produce():
+        await feed.put([2, 1, 3])
+        events.append('put')
+
+    run(produce(), keep_running=False)
+    assert events == ['update', 'drawn', 'put']
+    assert list(line.get_ydata()) == [2, 1, 3]
+    feed.close()
+    canvas.deleteLater()
@@ -0,0 +1,17 @@
+import multiprocessing
+
+from matplotlibqml.export import demo_jobs, export_figures
+
+
+def test_export_figures_default_start_method(tmp_path, monkeypatch):
+    methods = []
+    get_context = multiprocessing.get_context
+
+    def spy(method=None):
+        methods.append(method)
+        return get_context(method)
+    monkeypatch.setattr(multiprocessing, 'get_context', spy)
+    results = list(export_figures(demo_jobs(2, tmp_path), processes=1))
+    assert methods[0] in ('forkserver', 'spawn')
+    assert [error for *_, error in results] == [None, None]
+    assert len(list(tmp_path.glob('demo-*.png'))) == 2
@@ -0,0 +1,27 @@
+import io
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import DensityScatter
+
+
+def _figure():
+    figure = Figure()
+    ax = figure.subplots()
+    rng = np.random.default_rng(0)
+    DensityScatter(ax, rng.normal(size=1000), rng.normal(size=1000))
+    return figure, ax
+
+
+def test_window_extent_is_the_view():
+    figure, ax = _figure()
+    figure.canvas.draw()
+    image, = ax.images
+    assert (image.get_window_extent().extents == ax.bbox.extents).all()
+
+
+def test_tight_layout_and_savefig():
+    figure, ax = _figure()
+    figure.tight_layout()
+    figure.savefig(io.BytesIO(), format='png', bbox_inches='tight')
@@ -0,0 +1,28 @@
+import pytest
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureExporter
+
+
+def test_export_writes_the_figure(qapp, tmp_path):
+    exporter = FigureExporter()
+    figure = Figure()
+    figure.subplots().plot([1, 3, 2])
+    fname = tmp_path / 'figure.png'
+    exporter.export(figure, fname).result(timeout=30)
+    exporter.shutdown()
+    assert fname.stat().st_size > 0
+
+
+def test_unpicklable_figure_fails(qapp, tmp_path):
+    exporter = FigureExporter()
+    failed = []
+    exporter.failed.connect(lambda fname, message: failed.append(fname))
+    figure = Figure()
+    figure.callback = lambda: None
+    fname = str(tmp_path / 'figure.png')
+    future = exporter.export(figure, fname)
+    with pytest.raises(Exception):
+        future.result(timeout=30)
+    exporter.shutdown()
+    assert failed == [fname]
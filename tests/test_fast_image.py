@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from PySide6 import QtGui
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FastImage, FigureCanvasQTAgg, Waterfall
+
+ROWS, COLS = 6, 8
+
+
+def _axes(figure):
+    ax = figure.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    return ax
+
+
+def _cells(get, rows=ROWS, cols=COLS):
+    """Return the color at the center of each cell of the image."""
+    width, height = 640, 480
+    return np.array([[get(int((j + .5) * width / cols),
+                          int((i + .5) * height / rows))
+                      for j in range(cols)] for i in range(rows)], int)
+
+
+def _paint(canvas, rows=ROWS, cols=COLS):
+    image = QtGui.QImage(canvas.size(),
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    canvas.render(image)
+
+    def get(x, y):
+        color = image.pixelColor(x, y)
+        return color.red(), color.green(), color.blue()
+    return _cells(get, rows, cols)
+
+
+def _painted(data, frame=None, **kwargs):
+    canvas = FigureCanvasQTAgg(Figure())
+    fast = FastImage(_axes(canvas.figure), data, **kwargs)
+    canvas.draw()
+    if frame is not None:
+        fast.set_data(frame)
+    cells = _paint(canvas)
+    canvas.deleteLater()
+    return cells
+
+
+def _imshow(data, **kwargs):
+    figure = Figure()
+    _axes(figure).imshow(data, aspect='auto', interpolation='nearest',
+                         **kwargs)
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    buffer = np.asarray(canvas.buffer_rgba())
+    return _cells(lambda x, y: tuple(buffer[y, x, :3]), *np.shape(data)[:2])
+
+
+rng = np.random.default_rng(0)
+floats = rng.normal(size=(ROWS, COLS))
+masked = np.ma.masked_greater(floats, 1)
+
+
+@pytest.mark.parametrize('data, kwargs', [
+    (floats, {}),
+    (floats, {'vmin': -1, 'vmax': 1}),
+    (masked, {}),
+    (np.where(floats > 1, np.nan, floats), {}),
+    (rng.integers(0, 256, (ROWS, COLS), dtype=np.uint8),
+     {'vmin': 0, 'vmax': 255}),
+    (rng.integers(0, 256, (ROWS, COLS, 3), dtype=np.uint8), {}),
+    (floats, {'origin': 'lower', 'cmap': 'magma'}),
+], ids=['float', 'clim', 'masked', 'nan', 'uint8', 'rgb', 'lower'])
+def test_matches_imshow(qapp, data, kwargs):
+    # the lookup table may round to the next color of the colormap
+    assert np.abs(_painted(data, **kwargs) - _imshow(data, **kwargs)).max() <= 4
+
+
+def test_new_frame_matches_imshow(qapp):
+    clim = {'vmin': -1, 'vmax': 1}
+    assert np.abs(_painted(floats, masked, **clim)
+                  - _imshow(masked, **clim)).max() <= 4
+
+
+@pytest.mark.parametrize('appended', [2, 4, 7])
+def test_waterfall_scrolls_and_wraps(qapp, appended):
+    canvas = FigureCanvasQTAgg(Figure())
+    waterfall = Waterfall(_axes(canvas.figure), 4, 3, vmin=0, vmax=10)
+    _paint(canvas)
+    frames = canvas.frame_count
+    rows = np.arange(appended * 3).reshape(appended, 3) % 11
+    waterfall.append(rows[:1])
+    waterfall.append(rows[1:])
+    history = np.ma.filled(waterfall.get_array(), np.nan)
+    # oldest first, the rows not appended yet are NaN
+    assert np.array_equal(history[-min(appended, 4):], rows[-4:])
+    assert np.isnan(history[:max(4 - appended, 0)]).all()
+    # the newest row at the top
+    expected = _imshow(history, origin='lower', vmin=0, vmax=10)
+    assert np.abs(_paint(canvas, 4, 3) - expected).max() <= 4
+    assert canvas.frame_count == frames
+    canvas.deleteLater()
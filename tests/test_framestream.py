@@ -0,0 +1,35 @@
+import os
+import socket
+import time
+
+import numpy as np
+
+from matplotlibqml.framestream import (FrameDecoder, FrameStreamServer,
+                                       _parse_address)
+
+
+def test_relative_socket_path_is_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert _parse_address('stream.sock') == str(tmp_path / 'stream.sock')
+    assert _parse_address('localhost:8765') == ('localhost', 8765)
+
+
+def test_viewer_gets_current_frame_on_connect(qapp, canvas, tmp_path):
+    server = FrameStreamServer(canvas, str(tmp_path / 'stream.sock'))
+    with server:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(server.address)
+        client.setblocking(False)
+        decoder = FrameDecoder()
+        deadline = time.monotonic() + 10
+        # no draw: the frame on screen is sent to the new viewer
+        while decoder.frame is None and time.monotonic() < deadline:
+            qapp.processEvents()
+            try:
+                decoder.feed(client.recv(1 << 20))
+            except BlockingIOError:
+                time.sleep(.01)
+        client.close()
+    assert np.array_equal(decoder.frame,
+                          np.asarray(canvas.renderer.buffer_rgba()))
+    assert not os.path.exists(server.address)
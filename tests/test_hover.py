@@ -0,0 +1,34 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg, HoverQuery
+
+
+def _scatter(qapp, offsets):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    ax = canvas.figure.subplots()
+    scatter = ax.scatter(*np.transpose(offsets))
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
+    canvas.draw()
+    return canvas, ax, scatter, HoverQuery(canvas)
+
+
+def _hits(hover, ax, xy):
+    x, y = ax.transData.transform(xy)
+    return [i for _, i, _, _ in hover.query(x, y, ax)]
+
+
+def test_far_points_do_not_overflow_the_grid(qapp):
+    canvas, ax, _, hover = _scatter(qapp, [(2, 2), (1e300, 3), (3, -1e300)])
+    assert _hits(hover, ax, (2, 2)) == [0]
+    assert _hits(hover, ax, (8, 8)) == []
+
+
+def test_offsets_changed_in_place(qapp):
+    canvas, ax, scatter, hover = _scatter(qapp, [(2, 2), (8, 8)])
+    assert _hits(hover, ax, (5, 5)) == []
+    scatter.get_offsets()[0] = (5, 5)
+    canvas.draw()
+    assert _hits(hover, ax, (5, 5)) == [0]
@@ -0,0 +1,29 @@
+from matplotlibqml.matplotlibqml import _IconCache
+
+
+def test_one_lookup_counts_once(qapp):
+    cache = _IconCache()
+    cache.image('home.png', 24, 24, 2.0)
+    assert cache.stats()['hits'] == 0 and cache.stats()['misses'] == 1
+    cache.image('home.png', 24, 24, 2.0)
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    cache.icon('home.png', 1.0)
+    cache.icon('home.png', 1.0)
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 2)
+
+
+def test_least_recently_used_evicted(qapp):
+    cache = _IconCache(maxsize=3)
+    for size in (8, 16, 24):
+        cache.image('home.png', size, size)
+    # the unscaled image, used to scale the others, was the first one
+    assert cache.stats()['images'] == 3
+    cache.image('home.png', 16, 16)
+    cache.image('home.png', 32, 32)
+    assert cache.stats()['images'] == 3
+    hits = cache.hits
+    cache.image('home.png', 16, 16)
+    assert cache.hits == hits + 1
+    cache.image('home.png', 8, 8)
+    assert cache.hits == hits + 1
@@ -0,0 +1,54 @@
+import io
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg
+
+
+def _lend(canvas):
+    renderer = canvas._lend_frame()
+    return renderer, np.asarray(renderer.buffer_rgba()).copy()
+
+
+def test_full_render_does_not_copy_lent_frame(canvas, monkeypatch):
+    renderer, frame = _lend(canvas)
+    copies = []
+    unlend = canvas._unlend
+    monkeypatch.setattr(canvas, '_unlend',
+                        lambda keep=False: (copies.append(keep), unlend(keep)))
+    canvas.figure.axes[0].lines[0].set_ydata([3, 1, 2])
+    canvas.draw()
+    assert True not in copies
+    assert canvas.renderer is not renderer
+    assert np.array_equal(np.asarray(renderer.buffer_rgba()), frame)
+    canvas._return_frame(renderer)
+
+
+def test_partial_render_over_lent_frame(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    left, right = canvas.figure.subplots(1, 2)
+    line, = left.plot([1, 3, 2])
+    right.plot([2, 1, 3])
+    canvas.draw()
+    renderer, frame = _lend(canvas)
+    line.set_ydata([2, 2, 2])
+    canvas.draw()
+    assert canvas.partial_frames == 1
+    assert np.array_equal(np.asarray(renderer.buffer_rgba()), frame)
+    # the right axes, left alone, was copied over
+    right = slice(-frame.shape[1] // 4, None)
+    assert np.array_equal(np.asarray(canvas.renderer.buffer_rgba())[:, right],
+                          frame[:, right])
+    canvas._return_frame(renderer)
+    canvas.deleteLater()
+
+
+def test_print_does_not_draw_into_lent_frame(canvas):
+    renderer, frame = _lend(canvas)
+    canvas.figure.patch.set_facecolor('red')
+    canvas.figure.savefig(io.BytesIO(), format='png', dpi=canvas.figure.dpi,
+                          facecolor='blue')
+    assert np.array_equal(np.asarray(renderer.buffer_rgba()), frame)
+    canvas._return_frame(renderer)
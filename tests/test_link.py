@@ -0,0 +1,40 @@
+import gc
+
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import AxesLinkGroup, FigureCanvasQTAgg
+
+
+def _settle(qapp):
+    for _ in range(3):
+        qapp.processEvents()
+
+
+def test_linked_canvases_render_once(qapp):
+    canvases = [FigureCanvasQTAgg(Figure()) for _ in range(2)]
+    axes = []
+    for canvas in canvases:
+        canvas.resize(400, 300)
+        axes.append(canvas.figure.subplots())
+        axes[-1].plot([1, 3, 2])
+        canvas.draw()
+    group = AxesLinkGroup(axes)
+    frames = [canvas.frame_count for canvas in canvases]
+    axes[0].set_xlim(0.5, 1.5)
+    canvases[0].draw_idle()
+    _settle(qapp)
+    assert axes[1].get_xlim() == (0.5, 1.5)
+    assert [canvas.frame_count - n
+            for canvas, n in zip(canvases, frames)] == [1, 1]
+    assert group.batches == 1
+    for canvas in canvases:
+        canvas.deleteLater()
+
+
+def test_group_links_without_a_reference(qapp):
+    axes = [Figure().subplots() for _ in range(2)]
+    AxesLinkGroup(axes)
+    gc.collect()
+    axes[0].set_xlim(0.5, 1.5)
+    assert axes[1].get_xlim() == (0.5, 1.5)
+    _settle(qapp)
@@ -0,0 +1,12 @@
+import gc
+
+
+def test_blit_regions_counted_while_held(canvas):
+    region = canvas.copy_from_bbox(canvas.figure.bbox)
+    x0, y0, x1, y1 = region.get_extents()
+    assert canvas.memory_report()['blit_regions'] == (x1 - x0) * (y1 - y0) * 4
+    canvas.restore_region(region)
+    canvas.blit()
+    del region
+    gc.collect()
+    assert canvas.memory_report()['blit_regions'] == 0
@@ -0,0 +1,51 @@
+from PySide6 import QtGui
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import (FigureCanvasQTAgg, FigureMirrorQT,
+                                         FigureMirrorQtQuick)
+
+
+def _image(size):
+    image = QtGui.QImage(size, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    return image
+
+
+def _render(widget):
+    image = _image(widget.size())
+    widget.render(image)
+    return image
+
+
+def _paint_item(item):
+    image = _image(item.size().toSize())
+    painter = QtGui.QPainter(image)
+    try:
+        item.paint(painter)
+    finally:
+        painter.end()
+    return image
+
+
+def test_mirrors_show_the_source_frame(qapp):
+    source = FigureCanvasQTAgg(Figure())
+    line, = source.figure.subplots().plot([1, 3, 2])
+    source.draw()
+    widget = FigureMirrorQT(source)
+    widget.resize(source.size())
+    item = FigureMirrorQtQuick(source=source)
+    item.setSize(source.size().toSizeF())
+    before = _render(source)
+    assert _render(widget) == before
+    assert _paint_item(item) == before
+    frames = source.frame_count
+    line.set_ydata([2, 1, 3])
+    source.draw()
+    after = _render(source)
+    assert after != before
+    assert _render(widget) == after
+    assert _paint_item(item) == after
+    # the mirrors don't render anything themselves
+    assert source.frame_count == frames + 1
+    for view in (widget, item, source):
+        view.deleteLater()
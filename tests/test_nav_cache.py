@@ -0,0 +1,118 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import (FigureCanvasQTAgg, NavigationToolbar2QT,
+                                         _FrameCache)
+
+
+def _settle(qapp):
+    for _ in range(3):
+        qapp.processEvents()
+
+
+def _frame(canvas):
+    return np.asarray(canvas.renderer.buffer_rgba()).copy()
+
+
+def _zoomed(qapp):
+    """A canvas whose toolbar stack has the home view and a zoomed one."""
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    toolbar = NavigationToolbar2QT(canvas, None)
+    ax = canvas.figure.subplots()
+    ax.plot([1, 3, 2])
+    canvas.draw()
+    toolbar.push_current()
+    ax.set_xlim(0.5, 1.5)
+    toolbar.push_current()
+    canvas.draw()
+    return canvas, toolbar, ax
+
+
+def _round_trip(qapp, toolbar):
+    for move in (toolbar.back, toolbar.forward):
+        move()
+        _settle(qapp)
+
+
+def test_back_forward_hit(qapp):
+    canvas, toolbar, ax = _zoomed(qapp)
+    zoomed = _frame(canvas)
+    # the frames are kept from the first navigation on
+    _round_trip(qapp, toolbar)
+    _round_trip(qapp, toolbar)
+    assert canvas.nav_cache.stats()['hits'] == 2
+    assert np.array_equal(_frame(canvas), zoomed)
+    canvas.deleteLater()
+
+
+def test_back_forward_after_grid_toggle(qapp):
+    canvas, toolbar, ax = _zoomed(qapp)
+    _round_trip(qapp, toolbar)
+    toolbar.back()
+    _settle(qapp)
+    home = _frame(canvas)
+    toolbar.forward()
+    _settle(qapp)
+    ax.grid(True)
+    toolbar.back()
+    _settle(qapp)
+    assert not np.array_equal(_frame(canvas), home)
+    assert canvas.nav_cache.stats()['invalidations'] == 1
+    canvas.deleteLater()
+
+
+def test_formatter_change_invalidates(qapp):
+    canvas, toolbar, ax = _zoomed(qapp)
+    _round_trip(qapp, toolbar)
+    ax.xaxis.get_major_formatter().set_useOffset(10)
+    toolbar.back()
+    _settle(qapp)
+    assert canvas.nav_cache.stats()['invalidations'] == 1
+    canvas.deleteLater()
+
+
+def test_scale_change_invalidates(qapp):
+    canvas, toolbar, ax = _zoomed(qapp)
+    _round_trip(qapp, toolbar)
+    ax.set_yscale('log')
+    toolbar.back()
+    _settle(qapp)
+    assert canvas.nav_cache.stats()['invalidations'] == 1
+    canvas.deleteLater()
+
+
+def test_streaming_draws_skip_the_nav_cache(qapp, monkeypatch):
+    scans = []
+    scan = _FrameCache.scan
+    monkeypatch.setattr(_FrameCache, 'scan',
+                        lambda self, *args, **kwargs:
+                        (scans.append(args), scan(self, *args, **kwargs))[1])
+    canvas, toolbar, ax = _zoomed(qapp)
+    line = ax.lines[0]
+    for i in range(3):
+        line.set_ydata([i, 2, 1])
+        canvas.draw()
+    assert scans == []
+    canvas.deleteLater()
+
+
+def test_draw_event_sees_the_ticks_of_a_cached_frame(qapp):
+    canvas, toolbar, ax = _zoomed(qapp)
+    _round_trip(qapp, toolbar)
+    labels = []
+    # the tick artists as they are, get_xticklabels would update them
+    canvas.mpl_connect('draw_event', lambda event: labels.append(
+        [(tick.get_loc(), tick.label1.get_text())
+         for tick in ax.xaxis.majorTicks]))
+    for move in (toolbar.back, toolbar.forward):
+        move()
+        _settle(qapp)
+    assert canvas.nav_cache.stats()['hits'] == 2
+    # as rendered for the home and the zoomed views
+    home, zoomed = labels
+    assert home != zoomed
+    ax.set_xlim(0.5, 1.5)
+    canvas.draw()
+    assert labels[-1] == zoomed
+    canvas.deleteLater()
@@ -0,0 +1,28 @@
+from PySide6 import QtGui
+
+
+def _paint(canvas):
+    image = QtGui.QImage(canvas.size(),
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    canvas.render(image)
+    return image
+
+
+def test_rubberband_without_redraw(canvas):
+    _paint(canvas)
+    frames = canvas.frame_count
+    plain = _paint(canvas)
+    # display coordinates, y up: x0, y0, width, height
+    canvas.drawRectangle((20, 20, 100, 80))
+    framed = _paint(canvas)
+    assert canvas.frame_count == frames
+    changed = [(x, y) for x in range(canvas.width())
+               for y in range(canvas.height())
+               if plain.pixel(x, y) != framed.pixel(x, y)]
+    assert changed
+    xs, ys = zip(*changed)
+    assert (min(xs), max(xs)) == (20, 120)
+    canvas.drawRectangle(None)
+    assert _paint(canvas) == plain
+    assert canvas.frame_count == frames
@@ -0,0 +1,92 @@
+import pickle
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import (DensityScatter, FigureCanvasQTAgg,
+                                        _tightbbox)
+
+
+def test_single_axes_keeps_no_background(canvas):
+    canvas.draw()
+    assert canvas._background is None
+
+
+def test_extent_includes_artists_out_of_layout(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    left, right = canvas.figure.subplots(1, 2)
+    text = left.text(1.1, 0.5, 'outside', transform=left.transAxes)
+    text.set_in_layout(False)
+    canvas.draw()
+    renderer = canvas.get_renderer()
+    extent = text.get_window_extent(renderer)
+    assert _tightbbox(left, renderer).x1 >= extent.x1
+    assert canvas._background is not None
+    canvas.deleteLater()
+
+
+def test_background_released_down_to_one_axes(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    left, right = canvas.figure.subplots(1, 2)
+    canvas.draw()
+    assert canvas.memory_report()['partial_background'] > 0
+    right.remove()
+    canvas.draw()
+    assert canvas.memory_report()['partial_background'] == 0
+    canvas.deleteLater()
+
+
+def test_one_stale_axes_renders_partially(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.resize(400, 300)
+    left, right = canvas.figure.subplots(1, 2)
+    line, = left.plot([1, 3, 2])
+    right.plot([2, 1, 3])
+    canvas.draw()
+    line.set_ydata([2, 2, 2])
+    canvas.draw()
+    assert canvas.partial_frames == 1
+    canvas.deleteLater()
+
+
+def _fresh_render(figure):
+    """Render a copy of *figure* from scratch, on a plain Agg canvas."""
+    copy = pickle.loads(pickle.dumps(figure))
+    agg = FigureCanvasAgg(copy)
+    agg.draw()
+    return np.asarray(agg.buffer_rgba())
+
+
+def test_partial_frames_match_full_render(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    axes = canvas.figure.subplots(2, 2)
+    rng = np.random.default_rng(1)
+    lines = [ax.plot(rng.random(50))[0] for ax in axes.flat]
+    canvas.draw()
+    # each axes in turn, the top right one's spine is snapped outwards
+    for i, line in enumerate(lines * 2):
+        line.set_ydata(rng.random(50))
+        canvas.draw()
+        frame = np.asarray(canvas.renderer.buffer_rgba())
+        differ = (frame != _fresh_render(canvas.figure)).any(axis=-1)
+        assert np.count_nonzero(differ) == 0, i
+    assert canvas.partial_frames == 8
+    canvas.deleteLater()
+
+
+def test_partial_render_next_to_density_scatter(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    left, right = canvas.figure.subplots(1, 2)
+    rng = np.random.default_rng(0)
+    DensityScatter(left, rng.normal(size=1000), rng.normal(size=1000))
+    line, = right.plot([1, 3, 2])
+    canvas.draw()
+    line.set_ydata([2, 1, 3])
+    canvas.draw()
+    assert canvas.partial_frames == 1
+    frame = np.asarray(canvas.get_renderer().buffer_rgba())
+    assert (frame != _fresh_render(canvas.figure)).any(axis=-1).sum() == 0
+    canvas.deleteLater()
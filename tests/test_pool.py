@@ -0,0 +1,45 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg, _LRUPool
+
+
+def _pool(max_bytes):
+    return _LRUPool(lambda shape: np.empty(shape, np.uint8),
+                    lambda shape: int(np.prod(shape)), max_bytes=max_bytes)
+
+
+def test_reuse_by_key():
+    pool = _pool(1000)
+    small, large = pool.acquire((10,)), pool.acquire((20,))
+    pool.release((10,), small)
+    pool.release((20,), large)
+    assert pool.acquire((20,)) is large
+    assert pool.acquire((10,)) is small
+    assert pool.acquire((10,)) is not small
+    assert pool.stats()['allocations'] == 3
+    assert pool.stats()['reuses'] == 2
+
+
+def test_least_recently_released_evicted():
+    pool = _pool(25)
+    first, second, third = (pool.acquire((10,)) for _ in range(3))
+    for buf in (first, second, third):
+        pool.release((10,), buf)
+    stats = pool.stats()
+    assert (stats['idle'], stats['idle_bytes']) == (2, 20)
+    assert {id(pool.acquire((10,))), id(pool.acquire((10,)))} == \
+        {id(second), id(third)}
+
+
+def test_resize_back_reuses_renderer(qapp):
+    canvas = FigureCanvasQTAgg(Figure(figsize=(4, 3)))
+    canvas.draw()
+    first = canvas.renderer
+    canvas.figure.set_size_inches(5, 3)
+    canvas.draw()
+    assert canvas.renderer is not first
+    canvas.figure.set_size_inches(4, 3)
+    canvas.draw()
+    assert canvas.renderer is first
+    canvas.deleteLater()
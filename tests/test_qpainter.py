@@ -0,0 +1,70 @@
+import matplotlib as mpl
+import numpy as np
+from PySide6 import QtGui
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTQPainter
+
+
+def _canvas():
+    canvas = FigureCanvasQTQPainter(Figure())
+    canvas.resize(400, 300)
+    return canvas
+
+
+def _paint(canvas):
+    image = QtGui.QImage(canvas.size(),
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    canvas.render(image)
+    return image
+
+
+def test_overlay_update_does_not_render(qapp):
+    canvas = _canvas()
+    canvas.figure.subplots().plot([1, 3, 2])
+    canvas.draw()
+    _paint(canvas)
+    frames = canvas.frame_count
+    canvas.set_crosshair((100, 100))
+    _paint(canvas)
+    _paint(canvas)
+    assert canvas.frame_count == frames
+    canvas.deleteLater()
+
+
+def test_translucent_line_blends_once(qapp):
+    canvas = _canvas()
+    ax = canvas.figure.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    # unsimplified, so that the line has many joints
+    with mpl.rc_context({'path.simplify': False}):
+        ax.plot(np.linspace(0, 1, 200), np.full(200, 0.5), color='black',
+                alpha=0.5, linewidth=10)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    canvas.draw()
+    image = _paint(canvas)
+    row = [image.pixelColor(x, 150).red() for x in range(20, 380)]
+    assert max(row) - min(row) <= 2
+    canvas.deleteLater()
+
+
+def test_image_matches_agg(qapp):
+    canvas = _canvas()
+    ax = canvas.figure.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    ax.imshow([[[1., 0, 0]], [[0, 0, 1.]]], aspect='auto',
+              interpolation='nearest')
+    canvas.draw()
+    image = _paint(canvas)
+    agg = FigureCanvasAgg(canvas.figure)
+    agg.draw()
+    expected = np.asarray(agg.buffer_rgba())
+    height = expected.shape[0]
+    for y in (height // 4, 3 * height // 4):
+        color = image.pixelColor(20, y)
+        assert ((color.red(), color.green(), color.blue())
+                == tuple(expected[y, 20, :3]))
+    canvas.deleteLater()
@@ -0,0 +1,53 @@
+"""Each screen change renders the figure exactly once."""
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg, FigureCanvasQtQuickAgg
+
+
+def _settle(qapp):
+    for _ in range(3):
+        qapp.processEvents()
+
+
+def test_widget_resize_renders_once(qapp):
+    canvas = FigureCanvasQTAgg(Figure())
+    canvas.figure.subplots().plot([1, 3, 2])
+    canvas.resize(400, 300)
+    canvas.show()
+    _settle(qapp)
+    count = canvas.frame_count
+    canvas.resize(500, 300)
+    _settle(qapp)
+    assert canvas.frame_count == count + 1
+    # a render cap and a resize in the same iteration, like a screen move
+    canvas.max_render_dpi = 50
+    canvas.resize(600, 300)
+    _settle(qapp)
+    assert canvas.frame_count == count + 2
+    canvas.close()
+
+
+def test_item_screen_change_renders_once(qapp):
+    canvas = FigureCanvasQtQuickAgg()
+    canvas.figure.subplots().plot([1, 3, 2])
+    canvas.setWidth(400)
+    canvas.setHeight(300)
+    _settle(qapp)
+    count = canvas.frame_count
+    canvas.dpi_ratio = 2
+    canvas.setWidth(500)
+    _settle(qapp)
+    assert canvas.frame_count == count + 1
+
+
+def test_draw_idle_after_resize_without_paint(qapp):
+    # the item is in no window, so never painted
+    canvas = FigureCanvasQtQuickAgg()
+    canvas.figure.subplots().plot([1, 3, 2])
+    canvas.setWidth(400)
+    canvas.setHeight(300)
+    _settle(qapp)
+    count = canvas.frame_count
+    canvas.draw_idle()
+    _settle(qapp)
+    assert canvas.frame_count == count + 1
@@ -0,0 +1,16 @@
+from matplotlibqml.matplotlibqml import _capped_render_ratio
+
+
+def test_pixel_cap_is_stable_across_resizes():
+    cap = 1920 * 1080
+    ratios = {_capped_render_ratio(2., 100, width, 1080, 0, cap)
+              for width in range(1930, 2100, 10)}
+    assert ratios == {0.875}
+    for width in range(1930, 4000, 37):
+        ratio = _capped_render_ratio(2., 100, width, 1080, 0, cap)
+        assert (width * ratio) * (1080 * ratio) <= cap
+
+
+def test_uncapped_ratios_unchanged():
+    assert _capped_render_ratio(2., 100, 800, 600, 0, 1920 * 1080) == 2.
+    assert _capped_render_ratio(3., 100, 800, 600, 150, 0) == 1.5
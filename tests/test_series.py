@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import MultiLineSeries
+
+
+def _render(figure):
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def test_paths_are_views():
+    # the in place updates rely on it, see MultiLineSeries._views
+    series = MultiLineSeries(Figure().subplots(), np.arange(5),
+                             np.zeros((2, 5)))
+    assert series._views
+
+
+@pytest.mark.parametrize('views', [True, False])
+def test_updates_reach_the_collection(views):
+    x = np.arange(50)
+    y = np.random.default_rng(0).random((3, 50))
+    figure = Figure()
+    ax = figure.subplots()
+    series = MultiLineSeries(ax, x, y, offsets=[0, 1, 2])
+    series._views = views
+    series.set_data(y[::-1])
+    series.set_offsets([2, 1, 0])
+    series.set_visible(1, False)
+    ax.set_ylim(-1, 4)
+
+    expected = Figure()
+    ax = expected.subplots()
+    segments = np.stack(
+        [np.broadcast_to(x, (3, 50)), y[::-1] + [[2], [1], [0]]], axis=-1)
+    ax.add_collection(LineCollection(segments[[0, 2]],
+                                     colors=series.collection.get_color()))
+    ax.set_xlim(figure.axes[0].get_xlim())
+    ax.set_ylim(-1, 4)
+    assert (_render(figure) == _render(expected)).all()
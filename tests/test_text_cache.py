@@ -0,0 +1,13 @@
+from matplotlib.font_manager import FontProperties
+
+from matplotlibqml.matplotlibqml import _CachingRendererAgg
+
+
+def test_text_key_ignores_font_hash(monkeypatch):
+    monkeypatch.setattr(FontProperties, '__hash__', lambda self: 0)
+    renderer = _CachingRendererAgg(200, 100, 100)
+    small = renderer.get_text_width_height_descent(
+        'cached', FontProperties(size=8), False)
+    large = renderer.get_text_width_height_descent(
+        'cached', FontProperties(size=24), False)
+    assert large[0] > small[0]
@@ -0,0 +1,54 @@
+from matplotlib.ticker import (FixedLocator, FuncFormatter, MaxNLocator,
+                               StrMethodFormatter)
+
+
+def _drawn(canvas, axis, n):
+    """Return the locations and labels of the first *n* ticks drawn."""
+    canvas.draw()
+    ticks = axis.majorTicks[:n]
+    return ([tick.get_loc() for tick in ticks],
+            [tick.label1.get_text() for tick in ticks])
+
+
+def test_unchanged_ticks_hit(canvas):
+    canvas.draw()
+    canvas.draw()
+    assert canvas.tick_cache.stats()['hits'] > 0
+
+
+def test_formatter_setting_changed(canvas):
+    axis = canvas.figure.axes[0].xaxis
+    fmt = StrMethodFormatter('{x:.1f}')
+    axis.set_major_formatter(fmt)
+    _drawn(canvas, axis, 2)
+    fmt.fmt = '<{x:.2f}>'
+    locs, labels = _drawn(canvas, axis, 2)
+    assert labels == [f'<{x:.2f}>' for x in locs]
+
+
+def test_formatter_replaced(canvas):
+    axis = canvas.figure.axes[0].xaxis
+    _drawn(canvas, axis, 2)
+    axis.set_major_formatter(FuncFormatter(lambda x, pos: f'#{x:g}'))
+    locs, labels = _drawn(canvas, axis, 2)
+    assert labels == [f'#{x:g}' for x in locs]
+
+
+def test_fixed_locator_changed(canvas):
+    axis = canvas.figure.axes[0].xaxis
+    locator = FixedLocator([0.5, 1.5])
+    axis.set_major_locator(locator)
+    _drawn(canvas, axis, 1)
+    locator.locs = [1.0, 1.25]
+    assert _drawn(canvas, axis, 2)[0] == [1.0, 1.25]
+
+
+def test_maxn_steps_changed(canvas):
+    ax = canvas.figure.axes[0]
+    ax.set_ylim(0, 7)
+    locator = MaxNLocator(nbins=4, steps=[1, 10])
+    ax.yaxis.set_major_locator(locator)
+    _drawn(canvas, ax.yaxis, 2)
+    locator.set_params(steps=[5, 10])
+    expected = list(locator.tick_values(0, 7))
+    assert _drawn(canvas, ax.yaxis, len(expected))[0] == expected
@@ -0,0 +1,49 @@
+from PySide6 import QtGui
+from matplotlib.figure import Figure
+
+from matplotlibqml.matplotlibqml import FigureCanvasQTAgg
+
+
+def _canvas():
+    canvas = FigureCanvasQTAgg(Figure())
+    axs = canvas.figure.subplots(2, 2)
+    lines = [ax.plot([1, 3, 2])[0] for ax in axs.flat]
+    canvas.draw()
+    # the first paint runs the draw queued by the construction
+    canvas.render(QtGui.QImage(canvas.size(),
+                               QtGui.QImage.Format.Format_ARGB32_Premultiplied))
+    regions = []
+    update_region = canvas._update_region
+
+    def record(bbox):
+        regions.append(bbox)
+        update_region(bbox)
+    canvas._update_region = record
+    return canvas, axs.flat[0], lines[0], regions
+
+
+def _inside(bbox, area):
+    return (bbox.x0 >= area.x0 and bbox.y0 >= area.y0
+            and bbox.x1 <= area.x1 and bbox.y1 <= area.y1)
+
+
+def test_one_axes_change_repaints_its_tiles(qapp):
+    canvas, ax, line, regions = _canvas()
+    line.set_ydata([2, 1, 3])
+    canvas.draw()
+    assert regions
+    area = ax.bbox.padded(canvas.tile_size)
+    assert all(_inside(bbox, area) for bbox in regions)
+    assert canvas.upload_fraction < 0.25
+    canvas.deleteLater()
+
+
+def test_tile_rows_merge_into_bands(qapp):
+    canvas, ax, line, regions = _canvas()
+    ax.set_facecolor('0.9')
+    canvas.draw()
+    # the whole of the axes changed, a block of tiles
+    bbox, = regions
+    assert _inside(ax.bbox, bbox)
+    assert _inside(bbox, ax.bbox.padded(canvas.tile_size))
+    canvas.deleteLater()
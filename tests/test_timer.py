@@ -0,0 +1,74 @@
+import time
+
+from PySide6 import QtCore
+
+from matplotlibqml.matplotlibqml import TimerQT
+
+
+def _wait(ms):
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def _timer(interval, callback, **kwargs):
+    timer = TimerQT(interval=interval, **kwargs)
+    times = []
+
+    def tick():
+        times.append(timer.clock.time)
+        return callback(len(times))
+    timer.add_callback(tick)
+    return timer, times
+
+
+def test_late_ticks_are_skipped(qapp):
+    # the first tick takes 3.5 intervals
+    timer, times = _timer(20, lambda n: time.sleep(0.07) if n == 1 else None)
+    timer.start()
+    _wait(200)
+    timer.stop()
+    assert timer.skipped >= 2
+    # the deadlines past are skipped, not fired in a burst
+    assert times[1] - times[0] >= 0.07
+    assert timer.clock.frame == timer.ticks == len(times)
+    assert timer.stats()['skipped'] == timer.skipped
+
+
+def test_late_ticks_burst_without_skip_late(qapp):
+    timer, times = _timer(20, lambda n: time.sleep(0.07) if n == 1 else None,
+                          skip_late=False)
+    timer.start()
+    _wait(200)
+    timer.stop()
+    assert timer.skipped == 0
+    assert times[2] - times[1] < 0.01
+
+
+def test_single_shot(qapp):
+    timer, times = _timer(10, lambda n: None)
+    timer.single_shot = True
+    timer.start()
+    _wait(100)
+    assert len(times) == 1
+    assert timer._deadline is None
+
+
+def test_callback_returning_zero_stops(qapp):
+    timer, times = _timer(10, lambda n: 0 if n == 3 else None)
+    timer.start()
+    _wait(150)
+    assert len(times) == 3
+    assert timer._deadline is None
+
+
+def test_interval_change_while_running(qapp):
+    timer, times = _timer(1000, lambda n: None)
+    timer.start()
+    _wait(20)
+    assert not times
+    timer.interval = 10
+    _wait(100)
+    timer.stop()
+    assert len(times) >= 3
+    assert timer.clock.dt < 0.05